@@ -8,6 +8,7 @@ except ModuleNotFoundError:
     # when running directly from core/
     from phonologizer import Phonologizer
 
+from evolution import evolver as _evo
 from evolution.tokenizer import Tokenizer, DEFAULT_IPA_UNITS
 from evolution.ipa_dictionaries import IPA_GROUPS
 
@@ -58,6 +59,8 @@ class PhonoCeltic(Phonologizer):
             legal_compounds=self.legal_compounds,
             strict_compounds=True,
         )
+        # the labiovelars kʷ, ɡʷ rank as stops
+        _evo.set_sonority_scale(_evo.SonorityScale(resolve_diacritics=True, units=self.tokenizer.units))
 
     # ------------------------------------------------------------------ parent hooks
 
@@ -20,6 +20,8 @@ class PhonoGermanic(Phonologizer):
         ])
 
         _evo.set_weight_fn(self.is_syllable_heavy)
+        # kʷ, ɡʷ, xʷ and the nasal vowels rank as their base segment
+        _evo.set_sonority_scale(_evo.SonorityScale(resolve_diacritics=True, units=self.tokenizer.units))
 
         self.ipa_map = {
             # Short vowels
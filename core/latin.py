@@ -78,6 +78,8 @@ class PhonoLatin(Phonologizer):
             legal_compounds=self.legal_compounds,
             strict_compounds=True,
         )
+        # kʷ, ɡʷ, pʰ, kʰ and the syllabic sonorants rank as their base segment
+        _evo.set_sonority_scale(_evo.SonorityScale(resolve_diacritics=True, units=self.tokenizer.units))
 
 
     # Parent class overwrites
@@ -0,0 +1,478 @@
+# core/test_evolver.py
+
+from evolution.evolver import EvolutionEngine, Syllable, TokenTrie, Word
+
+
+def con(name, old, new, **extra):
+    rule = {"name": name, "type": "con", "notes": "",
+            "old_list": old, "new_list": new,
+            "pre_trig": [], "post_trig": [], "pre_ex": [], "post_ex": [],
+            "skip_stress": False, "stress_solo": False}
+    rule.update(extra)
+    return rule
+
+
+def evolve(words, rules, log_steps=False):
+    engine = EvolutionEngine(words, log_steps=log_steps)
+    engine.evolve(rules)
+    return engine
+
+
+def test_syllables_keep_canonical_tokens():
+    word = Word("ˈkʷa.tsai")
+    assert [s.tokens for s in word.syllables] == [("kʷ", "a"), ("ts", "ai")]
+    assert word.syllables[0].stressed
+    assert word.to_string() == "ˈkʷa.tsai"
+
+    # rule output is re-normalized exactly like a string round-trip would be
+    assert Syllable.from_tokens(["t", "s", "a", "i"]).tokens == ("ts", "ai")
+
+
+def test_engine_accepts_and_returns_strings():
+    engine = evolve(["ˈkʷa.tɛr", "ˈka.sa"], [con("k → t", ["k"], ["t"])], log_steps=True)
+    assert [w.to_string() for w in engine.words] == ["ˈkʷa.tɛr", "ˈta.sa"]
+    assert engine.words[1].history == [("k → t", "ˈka.sa", "ˈta.sa")]
+
+
+def test_contextual_triggers_blank_and_exceptions():
+    rules = [con("t → d / V_V", ["t"], ["d"],
+                 pre_trig=["a", "o"], post_trig=["a", "o"], pre_ex=["."])]
+    engine = evolve(["ˈa.ta", "ˈat.a", "ˈto.ta"], rules)
+    # "." in pre_ex blocks the syllable-initial t; the coda t only sees through the boundary
+    assert [w.to_string() for w in engine.words] == ["ˈa.ta", "ˈa.da", "ˈto.ta"]
+
+    initial = [con("word-initial t", ["t"], ["θ"], pre_trig=["*Blank"])]
+    assert evolve(["ˈto.ta"], initial).words[0].to_string() == "ˈθo.θa"
+
+
+def test_token_trie_reports_every_pattern_in_list_order():
+    trie = TokenTrie()
+    for j, pattern in enumerate([("k", "s"), ("k",), (), ("k", "s", "a")]):
+        trie.add(j, pattern)
+    phonemes = ["k", "s", "a", ".", "k"]
+    assert trie.matches(phonemes, 0) == [(0, 2), (1, 1), (2, 0), (3, 3)]
+    assert trie.matches(phonemes, 3) == [(2, 0)]
+    assert trie.matches(phonemes, 4) == [(1, 1), (2, 0)]
+
+
+def test_batch_mode_matches_per_word_path():
+    rules = [
+        {"name": "Penult stress", "type": "str", "notes": "", "mode": "penult"},
+        con("k → t", ["k"], ["t"], pre_trig=["a"]),
+        {"name": "No final s", "type": "del", "notes": "", "del_list": ["s"],
+         "post_list": ["*Blank"]},
+    ]
+    words = ["ka.kas", "ka.kas", "ˈtɛr.ra", "ka.kas"]
+
+    engine = evolve(words, rules, log_steps=True)
+    forms, histories = EvolutionEngine([]).evolve_batch(words, rules, histories=True)
+
+    assert forms == [w.to_string() for w in engine.words]
+    assert histories == [w.history for w in engine.words]
+
+
+def heavy_if_rounded(syllable_text, coda_matters=True):
+    return "o" in syllable_text
+
+
+def test_parallel_mode_keeps_order_and_weight_fn():
+    from evolution import evolver
+
+    rules = [
+        {"name": "Weight stress", "type": "str", "notes": "", "mode": "weight",
+         "weight_default": "ultimate", "weight_window": 3},
+        con("a → ə unstressed", ["a"], ["ə"], skip_stress=True),
+    ]
+    words = ["ka.ro.ta", "ta.ka.ra", "ka.ro.ta", "sa.la.mo", "a.ta.ka.ra"]
+
+    evolver.set_weight_fn(heavy_if_rounded)
+    try:
+        expected = [w.to_string() for w in evolve(words, rules).words]
+        forms, histories = EvolutionEngine([]).evolve_parallel(
+            words, rules, workers=2, chunk_size=1, histories=True)
+    finally:
+        evolver.set_weight_fn(None)
+
+    assert forms == expected == ["kə.ˈro.tə", "tə.kə.ˈra", "kə.ˈro.tə", "sə.lə.ˈmo", "ə.tə.kə.ˈra"]
+    assert histories[0][0][0] == "Weight stress"
+
+
+def test_result_cache_reuses_and_invalidates(tmp_path):
+    from evolution.result_cache import ResultCache
+
+    rules = [con("k → t", ["k"], ["t"])]
+    path = str(tmp_path / "result_cache.db")
+    cache = ResultCache(maxsize=1, path=path)
+    engine = EvolutionEngine([])
+
+    assert engine.evolve_batch(["ˈka", "ˈko"], rules, cache=cache) == ["ˈta", "ˈto"]
+    assert engine.evolve_batch(["ˈka"], rules, cache=cache) == ["ˈta"]
+    assert cache.stats()["hits"] == 1          # "ˈka" came back from SQLite (memory holds 1)
+
+    # histories are recorded on demand, then served from the cache
+    forms, histories = engine.evolve_batch(["ˈka"], rules, histories=True, cache=cache)
+    assert histories == [[("k → t", "ˈka", "ˈta")]]
+    cache.close()
+
+    reopened = ResultCache(path=path)
+    assert engine.evolve_batch(["ˈka"], rules, histories=True, cache=reopened) == (
+        ["ˈta"], [[("k → t", "ˈka", "ˈta")]])
+    assert reopened.stats()["hits"] == 1
+
+    # any rule edit changes the preset key
+    edited = [con("k → d", ["k"], ["d"])]
+    assert engine.evolve_batch(["ˈka"], edited, cache=reopened) == ["ˈda"]
+    assert reopened.stats()["misses"] == 1
+
+
+def test_preset_key_is_stable_across_processes():
+    import json, os, subprocess, sys
+    from evolution.result_cache import preset_key
+
+    rules = [con("k → t", ["k"], ["t"])]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ("import json, sys; from evolution.result_cache import preset_key; "
+            "print(preset_key(json.loads(sys.argv[1])))")
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        out = subprocess.run([sys.executable, "-c", code, json.dumps(rules)], cwd=root, env=env,
+                             capture_output=True, text=True, check=True).stdout.split()[-1]
+        assert out == preset_key(rules)
+
+
+def test_preset_key_follows_the_engine_source(monkeypatch):
+    from evolution import result_cache
+
+    rules = [con("k → t", ["k"], ["t"])]
+    key = result_cache.preset_key(rules)
+    monkeypatch.setattr(result_cache, "ENGINE_FINGERPRINT", "edited")
+    assert result_cache.preset_key(rules) != key
+
+
+def test_incremental_resumes_from_edited_rule():
+    from evolution.incremental import IncrementalEvolution
+
+    rules = [
+        con("k → t", ["k"], ["t"]),
+        con("a → e", ["a"], ["e"]),
+        con("t → d / e_", ["t"], ["d"], pre_trig=["e"]),
+    ]
+    words = ["ˈka.ka", "ˈso.lo"]
+    inc = IncrementalEvolution(words, log_steps=True)
+    assert inc.evolve(rules) == ["ˈte.de", "ˈso.lo"]
+
+    edited = rules[:1] + [con("a → o", ["a"], ["o"])] + rules[2:]
+    assert inc.evolve(edited) == ["ˈto.to", "ˈso.lo"]
+    assert inc.resumed_from == 1
+
+    full = evolve(words, edited, log_steps=True)
+    assert [w.history for w in inc.words] == [w.history for w in full.words]
+
+
+def test_refine_gives_every_syllable_a_nucleus():
+    from evolution.evolver import PhonoRule
+
+    rule = PhonoRule({"name": "refine", "type": "con", "notes": ""})
+    sylls = [Syllable("pa"), Syllable("st", stressed=True), Syllable("a"), Syllable("n")]
+    out = rule.refine_syllables(sylls)
+    # "st" becomes the (stressed) onset of "a"; the final "n" becomes its coda
+    assert [str(s) for s in out] == ["pa", "ˈstan"]
+
+    # a bare nucleus borrows the previous coda as onset
+    out = rule.refine_syllables([Syllable("pat", stressed=True), Syllable("a")])
+    assert [str(s) for s in out] == ["ˈpa", "ta"]
+
+
+def test_cached_cluster_policies_are_declared_on_every_compile():
+    from evolution.evolver import ClusterPolicyRule
+
+    policy = {"name": "no st", "type": "clp", "notes": "", "position": "onset", "scope": "any",
+              "allow": [], "ban": [["s", "t"]], "max_check": 3}
+    rules = [policy, con("k → g", ["k"], ["g"])]
+    engine = EvolutionEngine([])
+    for _ in range(2):      # the second compile gets the rules from rule_cache
+        stages = engine.compile(rules, fuse=False)
+        assert [type(p) for p in stages[1][1]] == [ClusterPolicyRule]
+
+
+def test_sonority_scale_is_per_language():
+    from evolution import evolver
+    from evolution.evolver import SonorityScale
+
+    generic = SonorityScale()
+    assert generic.rank("kʷ") == 2                      # unknowns rank like fricatives
+    assert generic.licensable(["s", "t", "r"]) and not generic.licensable(["r", "t"])
+
+    resolved = SonorityScale(resolve_diacritics=True)
+    assert [resolved.rank(t) for t in ("kʷ", "r̥", "tʃ")] == [1, 4, 1]
+
+    # a registered scale drives the deletion guard: r̥n is no onset once r̥ ranks as a liquid
+    rule = {"name": "del ə", "type": "del", "notes": "", "del_list": ["ə"], "sonority_safe": True}
+    assert evolve(["ˈa.ər̥n.a"], [rule]).words[0].to_string() == "ˈa.r̥na"
+    evolver.set_sonority_scale(resolved)
+    try:
+        assert evolve(["ˈa.ər̥n.a"], [rule]).words[0].to_string() == "ˈa.ər̥.na"
+    finally:
+        evolver.set_sonority_scale(None)
+
+    # the base languages register theirs, next to their weight functions
+    from core.latin import PhonoLatin
+    PhonoLatin()
+    try:
+        assert evolver._SCALE.resolve_diacritics and evolver._SCALE.rank("kʷ") == 1
+    finally:
+        evolver.set_sonority_scale(None)
+        evolver.set_weight_fn(None)
+
+
+def test_indexed_lexicon_matches_plain_run():
+    from evolution.evolver import LexiconIndex
+
+    rules = [
+        {"name": "h loss", "type": "del", "notes": "", "del_list": ["h"]},
+        con("kʷ → p", ["kʷ"], ["p"]),
+        {"name": "Penult stress", "type": "str", "notes": "", "mode": "penult"},
+        {"name": "i-umlaut", "type": "ass", "notes": "", "targets": ["a"], "triggers": ["i"],
+         "replace": ["e"], "regressive": True},
+        {"name": "Apocope", "type": "syll", "notes": "", "old_list": ["a", "u"], "new_list": ["", ""],
+         "position": "last", "post_list": ["*Blank"]},
+    ]
+    words = ["ha.kʷa", "ˈkʷi.tai", "ˈsa.l", "ˈma.ri", "ta.ˈla.s", ".ˈɔ.hu", "kʷat"] * 6
+
+    plain = EvolutionEngine(words, log_steps=True)
+    for rule_data in rules:
+        plain._apply_to(plain.build_rule(rule_data), plain.words)
+    indexed = evolve(words, rules, log_steps=True)
+
+    assert [w.to_string() for w in indexed.words] == [w.to_string() for w in plain.words]
+    assert [w.history for w in indexed.words] == [w.history for w in plain.words]
+
+    index = LexiconIndex(indexed.words)
+    assert index.candidates(({("h",)},)) == set()
+    # alternatives need all their tokens somewhere in the word ("pat" has t and a)
+    assert index.candidates(({("t", "a"), ("k",)},)) == {i for i in range(42) if i % 7 in (4, 6)}
+
+
+def test_discontiguous_window_sees_earlier_replacements():
+    def disc(regressive):
+        return {"name": "a → e near i/e", "type": "disc", "notes": "", "targets": ["a"],
+                "triggers": ["i", "e"], "replace": ["e"], "regressive": regressive, "max_distance": 2}
+
+    # progressive: the first replacement triggers the next one
+    assert evolve(["ˈi.ta.ta"], [disc(False)]).words[0].to_string() == "ˈi.te.te"
+    # regressive: windows look ahead at tokens not yet visited
+    assert evolve(["ˈta.ta.ti"], [disc(True)]).words[0].to_string() == "ˈta.te.ti"
+
+
+def test_discontiguous_window_skips_boundaries():
+    # an earlier rule leaves "." inside a syllable; it does not count towards max_distance
+    rules = [{"name": "x → .", "type": "ass", "notes": "", "targets": ["x"], "triggers": ["a"],
+              "replace": ["."], "regressive": True},
+             {"name": "a → e / i_", "type": "disc", "notes": "", "targets": ["a"], "triggers": ["i"],
+              "replace": ["e"], "regressive": False, "max_distance": 1}]
+    assert [w.to_string() for w in evolve(["ˈixa", "ˈpi.xa"], rules).words] == ["ˈi.e", "ˈpi..e"]
+
+
+def test_group_products_stay_symbolic():
+    from evolution.ipa_dictionaries import IPA_GROUPS, ExpandedList, expand_group_keywords
+
+    lazy = expand_group_keywords(["a", "*Plosives+ShortVowels"], lazy=True)
+    eager = expand_group_keywords(["a", "*Plosives+ShortVowels"])
+    assert isinstance(lazy, ExpandedList) and list(lazy) == eager
+    assert lazy[-1] == eager[-1] and lazy.index("ka") == eager.index("ka")
+
+    huge = EvolutionEngine([]).build_rule(con("CVC", ["*Consonants+Nuclei+Consonants"], [""]))
+    assert len(huge.old_list) == len(IPA_GROUPS["Consonants"]) ** 2 * len(IPA_GROUPS["Nuclei"])
+
+    rules = [con("CV → CVː / _.N", ["*Plosives+ShortVowels"], ["*Plosives+LongVowels"],
+                 post_trig=["*Boundary+Nasals"]),
+             {"name": "V lenition", "type": "ass", "notes": "", "targets": ["*Plosives+Glides"],
+              "triggers": ["a"], "replace": ["x"] * 80, "regressive": False}]
+    words = ["ˈpa.ta.na", "ˈka.mo", "ta.ˈne", "ˈpo.ma.ti", "ˈaw.ka"]
+    expanded = [{k: expand_group_keywords(v) for k, v in r.items()} for r in rules]
+    out = [w.to_string() for w in evolve(words, rules).words]
+    assert out == [w.to_string() for w in evolve(words, expanded).words]
+    assert out[:2] == ["ˈpa.taː.na", "ˈkaː.mo"]
+
+
+def test_phoneme_inventory_masks():
+    from evolution.ipa_dictionaries import IPA_GROUPS, INVENTORY
+
+    vowel = INVENTORY.group_mask("Nuclei", "ShortVowels")
+    assert INVENTORY.mask_of("a") & vowel and not INVENTORY.mask_of("t") & vowel
+    assert INVENTORY.in_groups("t", "Plosives") and not INVENTORY.in_groups("t", "Nasals", "Nowhere")
+    assert INVENTORY.members("Nuclei") == frozenset(IPA_GROUPS["Nuclei"])
+    assert INVENTORY.tokens[INVENTORY.id_of("k")] == "k" and INVENTORY.id_of("ʘʘ") == -1
+
+
+def test_dead_rules_are_pruned_without_changing_output():
+    rules = [con("θ → t", ["θ"], ["t"]),                          # θ never occurs: dead
+             {"name": "θ-epenthesis", "type": "epen", "notes": "", "find_list": ["θ"],
+              "replace_list": ["t"], "syllable_pos": "first"},     # dead, no effect: dropped
+             con("k → θ", ["k"], ["θ"], pre_trig=["ʃ"]),          # trigger never occurs: dead
+             con("s → θ", ["s"], ["θ"]),
+             con("θ → ð", ["θ"], ["ð"])]                          # live again after s → θ
+    words = ["ˈka.sa", "ˈma.kis", "ta.ˈla.ki"]
+
+    engine = EvolutionEngine([])
+    stages = engine.compile(rules, inputs=words)
+    assert [r.dead for r in engine.analysis] == [True, True, True, False, False]
+    assert engine.analysis[2].dead_contexts == ["pre_trig"]
+    assert [type(rule).__name__ for rule, _ in stages] == ["NoMatchRule", "NoMatchRule",
+                                                           "ContextualRule", "ContextualRule"]
+
+    pruned = evolve(words, rules, log_steps=True)
+    EvolutionEngine.PRUNE_DEAD_RULES = False
+    try:
+        full = evolve(words, rules, log_steps=True)
+    finally:
+        EvolutionEngine.PRUNE_DEAD_RULES = True
+    assert [w.to_string() for w in pruned.words] == [w.to_string() for w in full.words]
+    assert [w.history for w in pruned.words] == [w.history for w in full.words]
+    assert pruned.words[0].to_string() == "ˈka.ða"
+
+
+def test_adjacent_assimilations_are_fused():
+    from evolution.evolver import FusedRegroupRule
+
+    def ass(name, targets, triggers, replace):
+        return {"name": name, "type": "ass", "notes": "", "targets": targets,
+                "triggers": triggers, "replace": replace, "regressive": True}
+
+    rules = [ass("h → ∅ / _a", ["h"], ["a"], [""]),       # "" would vanish: word falls back
+             ass("n → ŋ / _k", ["n"], ["k"], ["ŋ"]),
+             ass("t → s / _i", ["t"], ["i"], ["s"]),
+             ass("a → e / _i", ["a"], ["i", "ŋ"], ["e"]),
+             con("k → g", ["k"], ["g"])]
+    words = ["ˈan.ka", "ˈma.ti", "ˈpa.i", "ˈhan.ka", "ka"]
+
+    stages = EvolutionEngine([]).compile(rules)
+    assert [type(r).__name__ for r, _ in stages] == ["FusedRegroupRule", "ContextualRule"]
+    assert isinstance(stages[0][0], FusedRegroupRule) and len(stages[0][0].rules) == 4
+
+    batch = EvolutionEngine([]).evolve_batch(words, rules)
+    assert batch == [w.to_string() for w in evolve(words, rules).words]
+    assert batch[:4] == ["ˈeŋ.ga", "ˈma.si", "ˈpe.i", "ˈeŋ.ga"]
+
+
+def test_profile_records_every_rule():
+    from evolution.profiler import format_table, to_json
+
+    rules = [{"name": "θ-epenthesis", "type": "epen", "notes": "", "find_list": ["θ"],
+              "replace_list": ["t"], "syllable_pos": "first"},     # dead: dropped, never applied
+             con("k → g", ["k"], ["g"], pre_trig=["a"]),
+             {"name": "a → e", "type": "ass", "notes": "", "targets": ["a"],
+              "triggers": ["i"], "replace": ["e"], "regressive": True}]
+    words = ["ˈa.ka", "ˈpa.i", "ˈki.ta"]
+
+    engine = EvolutionEngine(words, profile=True)
+    engine.evolve(rules)
+    assert [w.to_string() for w in engine.words] == [w.to_string() for w in evolve(words, rules).words]
+    assert [p.index for p in engine.profile_stats] == [0, 1, 2]
+    assert engine.profile_stats[0].name == "θ-epenthesis (dropped)"
+    lenition = engine.profile_stats[1]
+    assert (lenition.visited, lenition.changed) == (3, 1)
+    assert (lenition.attempted, lenition.accepted) == (2, 1)    # k in "ki" fails the context
+    assert "a → e" in format_table(engine.profile_stats) and '"changed": 1' in to_json(engine.profile_stats)
+
+
+def test_benchmark_compare_flags_regressions():
+    from evolution.benchmark import bench_case, compare
+
+    words = ["ˈka.sa", "ˈma.kis", "ta.ˈla.ki"] * 17
+
+    case = bench_case([con("k → g", ["k"], ["g"])], words, repeat=1)
+    assert set(case["times"]) == {"tokenize", "evolve", "rules", "resyllabify"}
+
+    def result(evolve, rules):
+        return {"results": {"A/x": {"words": 50, "rules": 1, "times": {"evolve": evolve, "rules": rules}}}}
+    rows = compare(result(1.0, 0.5), result(1.2, 0.501), threshold=0.1)
+    assert [(r["stage"], r["regressed"]) for r in rows] == [("evolve", True), ("rules", False)]
+
+
+def test_differential_minimizes_a_planted_bug():
+    from types import SimpleNamespace
+    from evolution import evolver
+    from evolution.differential import Differential
+
+    class BuggyEngine(EvolutionEngine):
+        # swaps the first two syllables after "s → z" when the word has an "a"
+        def apply_rule(self, rule, index=None):
+            super().apply_rule(rule, index)
+            if rule.name == "s → z":
+                for word in self.words:
+                    if "a" in word.to_string() and len(word.syllables) > 1:
+                        word.syllables[:2] = word.syllables[1::-1]
+
+    rules = [con("k → g", ["k"], ["g"]), con("s → z", ["s"], ["z"]), con("e → i", ["e"], ["i"])]
+    diff = Differential(evolver, SimpleNamespace(EvolutionEngine=BuggyEngine, _tokens=evolver._tokens))
+    mismatches = diff.run(rules, ["ˈka.sa.te", "ˈmi.ni"])
+    assert [(m.word, m.field, m.rule_index) for m in mismatches] == [("ˈka.sa.te", "final", None)]
+
+    case = diff.minimize(rules, "ˈka.sa.te")
+    assert [r["name"] for r in case.rules] == ["s → z"]
+    assert case.word.count(".") == 1 and "a" in case.word and case.mismatches
+    assert diff.minimize(rules, "ˈmi.ni") is None
+
+
+def test_compact_history_reads_like_full_history():
+    rules = [con("k → g", ["k"], ["g"]), con("a → ə", ["a"], ["ə"]), con("s → ", ["s"], [""]),
+             con("x → y", ["x"], ["y"])]
+    words = ["ˈka.sa.kas", "ˈmi.ni", "ta.ˈkis", "ˈsa.ka"] * 10   # long enough for the indexed path
+
+    def histories(**kw):
+        engine = EvolutionEngine(words, log_steps=True, **kw)
+        engine.evolve(rules)
+        return [w.history for w in engine.words]
+
+    full = histories()
+    compact = histories(history_mode="compact")
+    assert compact == full and all(len(c) == len(f) for c, f in zip(compact, full))
+    assert [tuple(c) for c in compact[0]] == full[0] and compact[0][-1] == full[0][-1]
+
+    fired = histories(history_mode="fired")
+    assert list(fired[0]) == [(name, None, None) for name, _, _ in full[0]]
+    assert list(fired[1]) == []
+    # bits follow the engine's rule list, not what other engines saw first
+    assert fired[0].table == [r["name"] for r in rules] and fired[0].indices() == [0, 1, 2]
+    assert fired[0].table is not histories(history_mode="fired")[0].table
+    import pickle
+    back = pickle.loads(pickle.dumps(fired[0]))
+    assert back.names() == fired[0].names() and back.indices() == fired[0].indices()
+
+    # rules sharing a name keep their own bits, in evolve() and in compiled stages
+    twins = [con("shift", ["k"], ["g"]), con("shift", ["s"], ["z"]), con("shift", ["a"], ["ə"])]
+    engine = EvolutionEngine(["ˈka"], log_steps=True, history_mode="fired")
+    engine.evolve(twins)
+    assert engine.words[0].history.indices() == [0, 2] and "shift" in engine.words[0].history
+    engine = EvolutionEngine([], log_steps=True, history_mode="fired")
+    word = Word("ˈsa")
+    engine.run_stages(engine.compile(twins), [word])
+    assert word.history.indices() == [1, 2] and list(word.history) == [("shift", None, None)] * 2
+
+    del compact[0][1:]
+    assert list(compact[0]) == full[0][:1]
+
+    sampled = histories(history_sample=0.5)
+    kept = {w for w, h in zip(words, sampled) if h}
+    assert kept and kept != {w for w, h in zip(words, full) if h}
+    assert all(h == full[k] for k, h in enumerate(sampled) if h)
+
+
+def test_lexicon_round_trips_and_evolves_like_the_engine():
+    from evolution.lexicon import Lexicon
+
+    words = ["ˈka.sa.kas", "ˈmi.ni", "ta.ˈkis", "ˈsa.ka"] * 10
+    assert not hasattr(Word("ˈka.sa"), "__dict__") and not hasattr(Syllable("ka"), "__dict__")
+
+    lex = Lexicon(words)
+    assert len(lex) == len(words) and lex.strings() == words
+    assert lex[2].snapshot() == Word(words[2]).snapshot() and lex[-1].original == words[-1]
+    assert lex[0].syllables[1].tokens is Word(words[0]).syllables[1].tokens     # shared tuples
+
+    rules = [con("k → g", ["k"], ["g"]), con("a → ə", ["a"], ["ə"]), con("s → ", ["s"], [""])]
+    engine = EvolutionEngine(words)
+    engine.evolve(rules)
+    out = lex.evolve(rules, chunk_size=7)
+    assert out.strings() == [w.to_string() for w in engine.words]
+    assert out.originals == words and Lexicon(words, originals=False)[0].original == words[0]
@@ -0,0 +1,73 @@
+# core/test_pipeline.py
+
+import io
+
+from evolution.evolver import EvolutionEngine
+from evolution.orthographer import Orthographer
+from evolution.pipeline import clean_line, run_pipeline
+
+
+class SpellOut:
+    """Stand-in base language: one stressed syllable per word."""
+    def to_ipa(self, word):
+        return "ˈ" + word
+
+
+def test_pipeline_streams_lines_in_order():
+    rules = [{"name": "k → t", "type": "con", "notes": "", "old_list": ["k"], "new_list": ["t"],
+              "pre_trig": [], "post_trig": [], "pre_ex": [], "post_ex": []}]
+    text = io.StringIO("Kas, kos—ka!\n\nsak\n")
+
+    out = list(run_pipeline(text, SpellOut(), rules, Orthographer([["t", "th"]]), batch_lines=1))
+
+    assert clean_line("Kas, kos—ka!") == ["kas", "kos", "ka"]
+    assert out == [("ˈtas ˈtos ˈta", "thas thos tha"), ("", ""), ("ˈsat", "sath")]
+
+    engine = EvolutionEngine(["ˈkas", "ˈkos", "ˈka"])
+    engine.evolve(rules)
+    assert out[0][0] == " ".join(w.to_string() for w in engine.words)
+
+
+def test_pipeline_marks_failing_words_and_goes_on(capsys):
+    class Picky(SpellOut):
+        def to_ipa(self, word):
+            if word == "x":
+                raise ValueError("no x")
+            return super().to_ipa(word)
+
+    # new_list is one short: the rule raises IndexError on any "a"
+    rules = [{"name": "k, a → t", "type": "con", "notes": "", "old_list": ["k", "a"], "new_list": ["t"],
+              "pre_trig": [], "post_trig": [], "pre_ex": [], "post_ex": []}]
+    text = io.StringIO("kos ka x\nsok\n")
+
+    out = list(run_pipeline(text, Picky(), rules, Orthographer([["t", "th"]]), batch_lines=2))
+
+    assert out == [("ˈtos ? ?", "thos ? ?"), ("ˈsot", "soth")]
+    err = capsys.readouterr().err
+    assert "[Warning] Could not evolve 'ˈka'" in err and "[Warning] Could not convert 'x'" in err
+
+
+def test_synthetic_lexicon_is_seeded_and_shaped_like_to_ipa(tmp_path):
+    from core.latin import PhonoLatin
+    from evolution.synthetic import LexiconGenerator
+
+    lat = PhonoLatin()
+    gen = LexiconGenerator(lat, seed=4, lengths={2: 1, 3: 1})
+    words = gen.words(200)
+    assert words == LexiconGenerator(lat, seed=4, lengths={2: 1, 3: 1}).words(200)
+    assert words[:50] == list(gen.stream(50))
+    assert all(w.count("ˈ") == 1 and 1 <= w.count(".") <= 4 for w in words)
+    assert "aː" in gen.nuclei and "ː" not in gen.consonants | gen.nuclei
+
+    clusters = LexiconGenerator(lat, seed=1, lengths={1: 1}, onsets={2: 1}, codas={0: 1}).words(30)
+    assert all(len(lat.tokenizer.tokenize(w.lstrip("ˈ"))) >= 3 for w in clusters)
+
+    path = tmp_path / "lexicon.txt"
+    gen.write(str(path), 25, per_line=10)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3 and " ".join(lines).split() == words[:25]
+
+    # without a base language: the whole inventory, one syllable per template
+    wild = LexiconGenerator(None, seed=2, lengths={3: 1}).words(40)
+    assert wild == LexiconGenerator(None, seed=2, lengths={3: 1}).words(40)
+    assert all(w.count("ˈ") == 1 and w.count(".") == 2 for w in wild)
@@ -1,7 +1,7 @@
 # core/test_tokenizer_latin.py
 
 from core.latin import PhonoLatin
-from evolution.tokenizer import Tokenizer, DEFAULT_IPA_UNITS
+from evolution.tokenizer import Tokenizer, TokenCache, DEFAULT_IPA_UNITS
 
 
 def make_strict_latin_tokenizer():
@@ -72,6 +72,45 @@ def test_permissive_mode_allows_emergent_compounds():
     assert tok.tokenize("miː") == ["m", "iː"]
 
 
+def test_trie_follows_mode_flips_and_new_units():
+    tok = make_strict_latin_tokenizer()
+    assert tok.tokenize("tsai") == ["t", "s", "a", "i"]
+
+    tok.set_permissive()
+    assert tok.tokenize("tsai") == ["ts", "ai"]
+
+    # units added after the tries were built must be picked up in both modes
+    tok.add_units(["tsai"])
+    assert tok.tokenize("tsai") == ["tsai"]
+    tok.set_strict(True)
+    assert tok.tokenize("tsai") == ["t", "s", "a", "i"]
+
+    tok.set_legal_compounds({"tsai"})
+    assert tok.tokenize("tsai") == ["tsai"]
+
+
+def test_token_cache_counts_and_invalidates():
+    tok = make_permissive_tokenizer()
+    cache = TokenCache(tok, maxsize=2)
+
+    assert cache.tokens("tsai") == ("ts", "ai")
+    assert cache.tokens("tsai") == ("ts", "ai")
+    cache.tokens("miː")
+    cache.tokens("kʷa")                       # pushes "tsai" out
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["evictions"] == 1
+
+    # strict/permissive mode is part of the key
+    tok.set_strict(True)
+    assert cache.tokens("kʷa") == ("k", "ʷ", "a")
+
+    # inventory changes drop stale entries
+    tok.set_permissive()
+    tok.add_units(["tsai"])
+    assert cache.tokens("tsai") == ("tsai",)
+
+
 if __name__ == "__main__":
     try:
         test_known_sentence_against_expected()
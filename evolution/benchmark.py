@@ -0,0 +1,186 @@
+# benchmark.py
+"""
+Reproducible timing of presets over fixed word lists, with JSON baselines.
+
+    cases = {"Marcher/survey": (rules, words, orthographer), ...}
+    result = run_suite(cases, repeat=3)
+    save(result, "baseline.json")
+    ...
+    rows = compare(load("baseline.json"), run_suite(cases))
+    print(format_comparison(rows))
+
+Each case is timed in stages, taking the fastest of `repeat` runs of each:
+
+    tokenize     parsing the input words into syllables and tokens, cache cold
+    evolve       EvolutionEngine.evolve, as it runs with profiling off
+    rules        time inside the rules, from a profiled run (see profiler.py)
+    resyllabify  the part of that spent in refine_syllables
+    orthography  Orthographer.transcribe over the evolved words (if given)
+
+The garbage collector is off while timing, as in timeit. Wall times depend on
+the machine, so only compare results from the same one.
+
+bytes_per_word() measures how much memory a lexicon layout (a list of Word
+objects, a lexicon.Lexicon, ...) takes per word.
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from time import perf_counter
+
+from .evolver import EvolutionEngine, Word, clear_tokenize_cache
+
+STAGES = ("tokenize", "evolve", "rules", "resyllabify", "orthography")
+
+# Smaller differences than this (seconds) are never reported as regressions.
+MIN_DELTA = 0.005
+
+
+def bench_case(rules: list, words: list[str], orthographer=None, repeat: int = 3) -> dict:
+    """Stage timings (seconds, best of `repeat`) for one preset over one word list."""
+    best = dict.fromkeys(STAGES, float("inf"))
+    if orthographer is None:
+        del best["orthography"]
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            _bench_once(best, rules, words, orthographer)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"words": len(words), "rules": len(rules), "times": best}
+
+
+def _bench_once(best: dict, rules: list, words: list[str], orthographer) -> None:
+    gc.collect()
+    clear_tokenize_cache()
+    start = perf_counter()
+    for text in words:
+        Word(text)
+    best["tokenize"] = min(best["tokenize"], perf_counter() - start)
+
+    engine = EvolutionEngine(words)
+    start = perf_counter()
+    engine.evolve(rules)
+    best["evolve"] = min(best["evolve"], perf_counter() - start)
+
+    profiled = EvolutionEngine(words, profile=True)
+    profiled.evolve(rules)
+    refine = sum(p.refine for p in profiled.profile_stats)
+    best["rules"] = min(best["rules"], sum(p.wall for p in profiled.profile_stats) - refine)
+    best["resyllabify"] = min(best["resyllabify"], refine)
+
+    if orthographer is not None:
+        evolved = [w.to_string() for w in engine.words]
+        start = perf_counter()
+        for text in evolved:
+            orthographer.transcribe(text)
+        best["orthography"] = min(best["orthography"], perf_counter() - start)
+
+
+
+def run_suite(cases: dict, repeat: int = 3, progress=None) -> dict:
+    """
+    Time every case of {name: (rules, words, orthographer or None)}. `progress`,
+    if given, is called with each case name before it runs. A case whose rules
+    raise is recorded with its error instead of times.
+    """
+    results = {}
+    for name, (rules, words, orthographer) in cases.items():
+        if progress is not None:
+            progress(name)
+        try:
+            results[name] = bench_case(rules, words, orthographer, repeat)
+        except Exception as e:
+            print(f"[Warning] {name} failed: {e!r}", file=sys.stderr)
+            results[name] = {"words": len(words), "rules": len(rules), "error": repr(e)}
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def save(result: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(result, fh, ensure_ascii=False, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+# ===== Memory =====
+
+def bytes_per_word(build, words: list[str]) -> float:
+    """
+    Memory allocated by build(words) and still held by its result, per word.
+    build runs once beforehand so that shared caches (tokenization) are warm and
+    not counted.
+    """
+    build(words)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build(words)
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return held / max(len(words), 1)
+
+
+# ===== Comparison =====
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list[dict]:
+    """
+    One row per case and stage timed in both results. A stage regressed when it
+    got more than `threshold` (a fraction) slower, by at least MIN_DELTA seconds.
+    """
+    rows = []
+    base_results = baseline["results"]
+    for name, case in current["results"].items():
+        old_case = base_results.get(name)
+        if old_case is None or "times" not in old_case or "times" not in case:
+            continue
+        if old_case["words"] != case["words"] or old_case["rules"] != case["rules"]:
+            print(f"[Warning] {name}: baseline ran {old_case['words']} words × {old_case['rules']} rules, "
+                  f"now {case['words']} × {case['rules']}; skipped.")
+            continue
+        for stage, new in case["times"].items():
+            old = old_case["times"].get(stage)
+            if old is None:
+                continue
+            ratio = new / old if old else float("inf")
+            rows.append({
+                "case": name, "stage": stage, "old": old, "new": new, "ratio": ratio,
+                "regressed": ratio > 1 + threshold and new - old >= MIN_DELTA,
+            })
+    return rows
+
+
+def format_comparison(rows: list[dict], only_regressions: bool = False) -> str:
+    lines = [f"{'case':<32} {'stage':<12} {'old ms':>9} {'new ms':>9} {'change':>8}", "-" * 74]
+    for r in rows:
+        if only_regressions and not r["regressed"]:
+            continue
+        flag = "  REGRESSION" if r["regressed"] else ""
+        lines.append(f"{r['case']:<32} {r['stage']:<12} {r['old'] * 1000:>9.1f} {r['new'] * 1000:>9.1f} "
+                     f"{(r['ratio'] - 1) * 100:>+7.1f}%{flag}")
+    regressed = sum(r["regressed"] for r in rows)
+    lines.append(f"{regressed} regression(s) in {len(rows)} timings.")
+    return "\n".join(lines)
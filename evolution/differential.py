@@ -0,0 +1,259 @@
+# differential.py
+"""
+Differential testing of the evolution engine against a frozen reference.
+
+    reference = load_reference("main")          # evolution/ as of a baseline revision, or a directory
+    diff = Differential(reference, evolver)     # evolver: the working tree's module
+    mismatches = diff.run(rules, words)
+    if mismatches:
+        case = diff.minimize(rules, mismatches[0].word)
+
+Both engines evolve the same words through the same rules and are compared on
+    final    the forms EvolutionEngine.evolve() leaves, logging off
+    steps    the form of every word after every rule, applied one at a time
+    history  Word.history of an evolve() with log_steps=True
+    batch    EvolutionEngine.evolve_batch(), where both engines have it
+and on the errors they raise. A mismatch is minimized by dropping rules and then
+syllables and tokens of the word for as long as the engines still disagree.
+"""
+
+import atexit
+import importlib.util
+import io
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from dataclasses import dataclass, field
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIELDS = ("final", "steps", "history", "batch")
+
+# loaded references by resolved source; their copies are removed at exit
+_REFERENCES: dict = {}
+
+
+# ===== Reference engine =====
+
+def load_reference(source: str, root: str = ROOT):
+    """
+    The evolver module of a frozen copy of the evolution package: `source` is a
+    directory holding one, or a git revision of the repository at `root` (the
+    baseline to compare against: a release tag, main, the branch point). The
+    copy is imported under its own package name, so its tokenizer, caches and
+    settings are independent of the working tree's. Loading the same revision
+    or directory again returns the same module; the copies are deleted at exit.
+    """
+    if os.path.isdir(source):
+        key = os.path.abspath(source)
+    else:
+        key = subprocess.run(["git", "-C", root, "rev-parse", "--verify", source + "^{commit}"],
+                             capture_output=True, check=True, text=True).stdout.strip()
+    if key in _REFERENCES:
+        return _REFERENCES[key]
+
+    tmp = tempfile.mkdtemp(prefix="evolution_ref_")
+    atexit.register(shutil.rmtree, tmp, ignore_errors=True)
+    package = "evolution_ref_" + re.sub(r"\W", "_", source)[-40:]
+    target = os.path.join(tmp, package)
+    if os.path.isdir(source):
+        shutil.copytree(source, target, ignore=shutil.ignore_patterns("__pycache__"))
+    else:
+        archive = subprocess.run(["git", "-C", root, "archive", key, "evolution"],
+                                 capture_output=True, check=True).stdout
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp, filter="data")
+        os.rename(os.path.join(tmp, "evolution"), target)
+
+    # modules that import their siblings as evolution.x would get the live ones
+    for name in os.listdir(target):
+        if name.endswith(".py"):
+            path = os.path.join(target, name)
+            with open(path, encoding="utf-8") as fh:
+                text = fh.read()
+            fixed = re.sub(r"^(\s*)(from|import) evolution\b", rf"\1\2 {package}", text, flags=re.M)
+            if fixed != text:
+                with open(path, "w", encoding="utf-8") as fh:
+                    fh.write(fixed)
+
+    init = os.path.join(target, "__init__.py")
+    if not os.path.exists(init):
+        open(init, "w").close()
+    spec = importlib.util.spec_from_file_location(package, init, submodule_search_locations=[target])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[package] = module
+    spec.loader.exec_module(module)
+    _REFERENCES[key] = importlib.import_module(f"{package}.evolver")
+    return _REFERENCES[key]
+
+
+# ===== Comparison =====
+
+@dataclass
+class Outcome:
+    """What one engine made of a list of words, per word."""
+    final: list
+    steps: list                 # per word: its form after each rule
+    history: list
+    batch: list | None
+    errors: list                # per word: repr of the exception it raised, or None
+
+
+@dataclass
+class Mismatch:
+    word: str
+    field: str                  # "final", "steps", "history", "batch" or "error"
+    rule_index: int | None      # first rule after which the forms differ (steps only)
+    reference: object
+    candidate: object
+
+
+@dataclass
+class Minimized:
+    word: str
+    rules: list
+    mismatches: list = field(default_factory=list)
+
+
+def _run(module, rules: list, words: list[str]) -> list:
+    """[final, steps, history, batch] for the whole list; raises if any word does."""
+    engine = module.EvolutionEngine(words)
+    engine.evolve(rules)
+    final = [w.to_string() for w in engine.words]
+
+    engine = module.EvolutionEngine(words)
+    steps = [[] for _ in words]
+    for rule_data in rules:
+        engine.apply_rule(engine.build_rule(rule_data))
+        for form, word in zip(steps, engine.words):
+            form.append(word.to_string())
+
+    engine = module.EvolutionEngine(words, log_steps=True)
+    engine.evolve(rules)
+    history = [list(w.history) for w in engine.words]
+
+    batch = None
+    if hasattr(module.EvolutionEngine, "evolve_batch"):
+        batch = module.EvolutionEngine([]).evolve_batch(words, rules)
+    return [final, steps, history, batch]
+
+
+def outcome(module, rules: list, words: list[str]) -> Outcome:
+    """Run one engine; if the list raises, run its words one by one to find which do."""
+    try:
+        final, steps, history, batch = _run(module, rules, words)
+        return Outcome(final, steps, history, batch, [None] * len(words))
+    except Exception:
+        pass
+    result = Outcome([], [], [], [], [])
+    for text in words:
+        try:
+            columns = [c[0] if c is not None else None for c in _run(module, rules, [text])]
+            error = None
+        except Exception as e:
+            columns = [None] * 4
+            error = f"{type(e).__name__}: {e}"
+        for name, value in zip(("final", "steps", "history", "batch"), columns):
+            getattr(result, name).append(value)
+        result.errors.append(error)
+    if not hasattr(module.EvolutionEngine, "evolve_batch"):
+        result.batch = None
+    return result
+
+
+def compare(reference: Outcome, candidate: Outcome, words: list[str]) -> list[Mismatch]:
+    """The first difference found for each word, if any."""
+    out = []
+    for i, text in enumerate(words):
+        ref_error, cand_error = reference.errors[i], candidate.errors[i]
+        if ref_error or cand_error:
+            # the same exception type is agreement; the message may name internals
+            if (ref_error or "").split(":")[0] != (cand_error or "").split(":")[0]:
+                out.append(Mismatch(text, "error", None, ref_error, cand_error))
+            continue
+        for name in FIELDS:
+            ref, cand = getattr(reference, name), getattr(candidate, name)
+            if ref is None or cand is None or ref[i] == cand[i]:
+                continue
+            k = None
+            if name == "steps":
+                k = next(k for k, (a, b) in enumerate(zip(ref[i], cand[i])) if a != b)
+            out.append(Mismatch(text, name, k, ref[i] if k is None else ref[i][k],
+                                cand[i] if k is None else cand[i][k]))
+            break
+    return out
+
+
+class Differential:
+    def __init__(self, reference, candidate):
+        """Both are evolver modules (anything with an EvolutionEngine)."""
+        self.reference = reference
+        self.candidate = candidate
+
+    def run(self, rules: list, words: list[str]) -> list[Mismatch]:
+        return compare(outcome(self.reference, rules, words),
+                       outcome(self.candidate, rules, words), words)
+
+    def differs(self, rules: list, word: str) -> list[Mismatch]:
+        return self.run(rules, [word]) if rules else []
+
+    # ----- minimization -----
+
+    def minimize(self, rules: list, word: str) -> Minimized | None:
+        """
+        A smaller rule list and word on which the engines still disagree, or None
+        if the word does not reproduce the mismatch on its own (the difference
+        then depends on the other words evolved with it).
+        """
+        if not self.differs(rules, word):
+            return None
+        rules = self._shrink_rules(rules, word)
+        word = self._shrink_word(rules, word)
+        return Minimized(word, rules, self.differs(rules, word))
+
+    def _shrink_rules(self, rules: list, word: str) -> list:
+        # shortest failing prefix first, then drop single rules until none can go
+        lo, hi = 1, len(rules)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.differs(rules[:mid], word):
+                hi = mid
+            else:
+                lo = mid + 1
+        if self.differs(rules[:lo], word):
+            rules = rules[:lo]
+        k = len(rules) - 1
+        while k >= 0:
+            trial = rules[:k] + rules[k + 1:]
+            if self.differs(trial, word):
+                rules = trial
+            k -= 1
+        return rules
+
+    def _shrink_word(self, rules: list, word: str) -> str:
+        tokens = getattr(self.reference, "_tokens", None) or getattr(self.reference, "tokenize_ipa")
+        sylls = [(s.startswith("ˈ"), list(tokens(s.lstrip("ˈ")))) for s in word.split(".")]
+
+        def text(sylls):
+            return ".".join(("ˈ" if stressed else "") + "".join(toks) for stressed, toks in sylls)
+
+        changed = True
+        while changed:
+            changed = False
+            candidates = [sylls[:k] + sylls[k + 1:] for k in range(len(sylls))] if len(sylls) > 1 else []
+            for k, (stressed, toks) in enumerate(sylls):
+                if len(toks) > 1:
+                    candidates += [sylls[:k] + [(stressed, toks[:j] + toks[j + 1:])] + sylls[k + 1:]
+                                   for j in range(len(toks))]
+                if stressed:
+                    candidates.append(sylls[:k] + [(False, toks)] + sylls[k + 1:])
+            for trial in candidates:
+                if self.differs(rules, text(trial)):
+                    sylls, changed = trial, True
+                    break
+        return text(sylls)
@@ -1,6 +1,14 @@
+import multiprocessing
+import os
+import pickle
+import unicodedata
+import zlib
+from collections import deque
+from time import perf_counter
 from typing import Callable
-from .ipa_dictionaries import expand_group_keywords, IPA_GROUPS
-from .tokenizer import Tokenizer, DEFAULT_IPA_UNITS
+from .ipa_dictionaries import expand_group_keywords, ExpandedList, INVENTORY
+from .profiler import RuleProfile
+from .tokenizer import Tokenizer, TokenCache, DEFAULT_IPA_UNITS
 
 # Sonority helpers (soft, language-agnostic)
 _SONORITY = {
@@ -10,51 +18,101 @@ _SONORITY = {
     "liquid":{"l","r","ɾ"},
     "glide": {"j","w","ɥ","ɰ"},
 }
-def _sonority_rank(seg: str) -> int:
-    if seg in _SONORITY["stops"]:  return 1
-    if seg in _SONORITY["fric"]:   return 2
-    if seg in _SONORITY["nasal"]:  return 3
-    if seg in _SONORITY["liquid"]: return 4
-    if seg in _SONORITY["glide"]:  return 5
-    return 2  # safe default: treat unknowns like fricatives
-
-def _cluster_policy_decision(position, syll_idx, n_sylls, cons_seq, rule):
-    if not cons_seq:
-        return None
-
-    scope = _scope_for_index(syll_idx, n_sylls)
-    if rule.position not in (position, "any"):
-        return None
-    if rule.scope not in (scope, "any"):
-        return None
+_SONORITY_RANKS = {"stops": 1, "fric": 2, "nasal": 3, "liquid": 4, "glide": 5}
 
-    tup = tuple(cons_seq)
-    maxL = rule.max_check
-    allow = getattr(rule, "allow_set", set())
-    ban = getattr(rule, "ban_set", set())
 
-    matched_allow = any(tuple(tup[:L]) in allow for L in range(2, min(maxL, len(tup)) + 1))
-    if matched_allow:
-        return True
-
-    matched_ban = any(tuple(tup[:L]) in ban for L in range(2, min(maxL, len(tup)) + 1))
-    if matched_ban:
-        return False
+class SonorityScale:
+    """
+    Sonority ranking plus onset licensing (SSP with the s + stop (+ liquid/glide)
+    exception) for one language.
+
+    `classes` maps a class name to its segments, `ranks` maps class name to rank;
+    segments outside every class get `default`. With resolve_diacritics=True a
+    token such as "kʷ", "r̥" or "tʃ" is ranked by its base segment instead of
+    falling to the default. Ranks for the whole token inventory are tabulated up
+    front and onset verdicts are memoized (up to memo_size onsets).
+    """
 
-    return None
+    def __init__(self, classes: dict | None = None, ranks: dict | None = None, default: int = 2,
+                 resolve_diacritics: bool = False, units=DEFAULT_IPA_UNITS, memo_size: int = 4096):
+        self.classes = {k: frozenset(v) for k, v in (classes or _SONORITY).items()}
+        self.ranks = dict(ranks or _SONORITY_RANKS)
+        self.default = default
+        self.resolve_diacritics = resolve_diacritics
+        self.memo_size = memo_size
+
+        self._class_rank = {}
+        for name in sorted(self.classes, key=lambda n: self.ranks[n], reverse=True):
+            for seg in self.classes[name]:
+                self._class_rank[seg] = self.ranks[name]   # lowest rank wins on overlap
+        self._stops = self.classes.get("stops", frozenset())
+        self._s_tails = self.classes.get("liquid", frozenset()) | self.classes.get("glide", frozenset())
+
+        self._table = dict(self._class_rank)
+        for unit in units:
+            self._table[unit] = self._lookup(unit)
+        self._memo: dict = {}
+
+    def _lookup(self, seg: str) -> int:
+        rank = self._class_rank.get(seg)
+        if rank is not None:
+            return rank
+        if self.resolve_diacritics:
+            base = "".join(c for c in seg if c != "ː" and unicodedata.category(c) not in ("Mn", "Lm", "Sk"))
+            rank = self._class_rank.get(base)
+            if rank is None and base:
+                rank = self._class_rank.get(base[0])     # affricates rank as their stop
+            if rank is not None:
+                return rank
+        return self.default
+
+    def rank(self, seg: str) -> int:
+        rank = self._table.get(seg)
+        if rank is None:
+            rank = self._table[seg] = self._lookup(seg)
+        return rank
+
+    def licensable(self, tokens) -> bool:
+        """Whether a consonant sequence can stand as an onset."""
+        key = tuple(tokens)
+        verdict = self._memo.get(key)
+        if verdict is None:
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+            verdict = self._memo[key] = self._licensable(key)
+        return verdict
+
+    def _licensable(self, tokens) -> bool:
+        # s-cluster exception: s + stop (+ liquid/glide) is OK
+        if tokens and tokens[0] == "s":
+            if len(tokens) == 1: return True
+            if tokens[1] in self._stops:
+                if len(tokens) == 2: return True
+                if len(tokens) == 3 and tokens[2] in self._s_tails:
+                    return True
+        # general SSP: sonority left→right
+        ranks = [self.rank(t) for t in tokens]
+        return all(ranks[i] <= ranks[i+1] for i in range(len(ranks)-1))
+
+    def fingerprint(self) -> tuple:
+        """Hashable description of the scale (for result caches)."""
+        return (tuple(sorted((k, tuple(sorted(v))) for k, v in self.classes.items())),
+                tuple(sorted(self.ranks.items())), self.default, self.resolve_diacritics)
+
+
+# Language specific sonority scale; the default reproduces the generic ranking above.
+_SCALE = SonorityScale()
+
+def set_sonority_scale(scale: SonorityScale | None) -> None:
+    """Languages can register their own SonorityScale. Pass None to reset."""
+    global _SCALE
+    _SCALE = scale if scale is not None else SonorityScale()
 
+def _sonority_rank(seg: str) -> int:
+    return _SCALE.rank(seg)
 
 def _licensable_onset(tokens: list[str]) -> bool:
-    # s-cluster exception: s + stop (+ liquid/glide) is OK
-    if tokens and tokens[0] == "s":
-        if len(tokens) == 1: return True
-        if tokens[1] in _SONORITY["stops"]:
-            if len(tokens) == 2: return True
-            if len(tokens) == 3 and (tokens[2] in _SONORITY["liquid"] or tokens[2] in _SONORITY["glide"]):
-                return True
-    # general SSP: sonority left→right
-    ranks = [_sonority_rank(t) for t in tokens]
-    return all(ranks[i] <= ranks[i+1] for i in range(len(ranks)-1))
+    return _SCALE.licensable(tokens)
 
 
 def _scope_for_index(i: int, n: int) -> str:
@@ -78,21 +136,256 @@ def _coda_tokens(tokens: list[str], nuclei: set[str]) -> list[str]:
             last_nuc = j
     return tokens[last_nuc+1:] if last_nuc >= 0 else tokens
 
-def _prep_ctx_list(seq_list):
-    out = []
-    for s in (seq_list or []):
-        if s == "*Blank":
-            out.append(["*Blank"]) 
+class CompiledContext:
+    """
+    Immutable, pre-tokenized form of a context list (pre/post triggers or exceptions).
+
+    Sequences are bucketed by length into hashed sets of token tuples. "bound" holds
+    the sequences that carry their own syllable boundary on the inner edge (pre ends
+    with ".", post starts with ".") and are matched right at the match edge; "free"
+    sequences are matched after skipping boundaries. An empty sequence matches
+    everywhere, and "*Blank" (only honoured for triggers) matches at word/syllable edges.
+    Symbolic *GroupA+GroupB patterns are kept in "classes" and matched by splitting.
+    """
+    __slots__ = ("blank", "always", "bound", "free", "classes")
+
+    def __init__(self, seq_list, side: str, honor_blank: bool = True):
+        inner = -1 if side == "pre" else 0
+        blank = always = False
+        bound, free = {}, {}
+        classes = ()
+        if isinstance(seq_list, ExpandedList):
+            classes = tuple(pattern for _, pattern in seq_list.patterns())
+            seq_list = [s for _, s in seq_list.literals()]
+        for s in seq_list:
+            if s == "*Blank":
+                blank = blank or honor_blank
+                continue
+            toks = _tokens(s)
+            if not toks:
+                always = True
+                continue
+            bucket = bound if toks[inner] == "." else free
+            bucket.setdefault(len(toks), set()).add(toks)
+        self.blank = blank
+        self.always = always
+        self.bound = tuple((L, frozenset(v)) for L, v in sorted(bound.items()))
+        self.free = tuple((L, frozenset(v)) for L, v in sorted(free.items()))
+        self.classes = classes
+
+    def match_pre(self, phonemes, i) -> bool:
+        if self.always:
+            return True
+        if self.blank and (i == 0 or phonemes[i - 1] == "."):
+            return True
+        if self.classes and self._match_classes(phonemes, i, -1):
+            return True
+        for L, seqs in self.bound:
+            if i >= L and tuple(phonemes[i - L:i]) in seqs:
+                return True
+        if self.free:
+            while i > 0 and phonemes[i - 1] == ".":
+                i -= 1
+            for L, seqs in self.free:
+                if i >= L and tuple(phonemes[i - L:i]) in seqs:
+                    return True
+        return False
+
+    def match_post(self, phonemes, end) -> bool:
+        if self.always:
+            return True
+        n = len(phonemes)
+        if self.blank and (end >= n or phonemes[end] == "."):
+            return True
+        if self.classes and self._match_classes(phonemes, end, 1):
+            return True
+        for L, seqs in self.bound:
+            if end + L <= n and tuple(phonemes[end:end + L]) in seqs:
+                return True
+        if self.free:
+            while end < n and phonemes[end] == ".":
+                end += 1
+            for L, seqs in self.free:
+                if end + L <= n and tuple(phonemes[end:end + L]) in seqs:
+                    return True
+        return False
+
+
+    def _match_classes(self, phonemes, i, step) -> bool:
+        # Same rule as the literal buckets: a span whose inner edge is a boundary is
+        # tried right at i, any other span only after skipping boundaries.
+        inner = -1 if step < 0 else 0
+        for pattern in self.classes:
+            for span in _pattern_spans(pattern, phonemes, i, step, stop_at_boundary=False):
+                if span[inner] == ".":
+                    return True
+        if step < 0:
+            while i > 0 and phonemes[i - 1] == ".":
+                i -= 1
         else:
-            out.append(tokenize_ipa(s))
-    return out
+            while i < len(phonemes) and phonemes[i] == ".":
+                i += 1
+        for pattern in self.classes:
+            for span in _pattern_spans(pattern, phonemes, i, step, stop_at_boundary=False):
+                if span[inner] != ".":
+                    return True
+        return False
+
+
+def _compile_ctx(seq_list, side: str, honor_blank: bool = True):
+    """CompiledContext for a non-empty list, None for "no constraint"."""
+    return CompiledContext(seq_list, side, honor_blank) if seq_list else None
+
+
+class TokenTrie:
+    """
+    Trie over token sequences. `matches(phonemes, i)` returns every pattern that starts
+    at position i as (pattern_id, length) pairs in pattern-id order, in a single walk
+    that stops at the first token no pattern continues with. Boundaries (".") are never
+    part of a pattern, so the walk also stops at the next syllable edge.
+    """
+    __slots__ = ("root", "size")
+
+    def __init__(self):
+        self.root = {}          # token -> child node; key None holds ((id, length), ...)
+        self.size = 0
+
+    def add(self, pattern_id: int, tokens) -> None:
+        node = self.root
+        for t in tokens:
+            node = node.setdefault(t, {})
+        node[None] = node.get(None, ()) + ((pattern_id, len(tokens)),)
+        self.size += 1
+
+    def matches(self, phonemes, i) -> list:
+        node = self.root
+        found = list(node.get(None, ()))
+        n = len(phonemes)
+        sources = 1 if found else 0
+        while i < n:
+            node = node.get(phonemes[i])
+            if node is None:
+                break
+            i += 1
+            hits = node.get(None)
+            if hits:
+                found.extend(hits)
+                sources += 1
+        if sources > 1:
+            found.sort()
+        return found
+
+
+def _singles(tokens) -> frozenset:
+    """Alternatives group (see Rule.required_tokens) of one-token alternatives."""
+    return frozenset((t,) for t in tokens)
+
+
+def _required_singles(*lookups):
+    """required_tokens of one-token lookups; None (no skipping) if any is symbolic."""
+    if any(isinstance(lookup, SymbolicLookup) for lookup in lookups):
+        return None
+    return tuple(_singles(lookup) for lookup in lookups)
+
+
+class SymbolicLookup:
+    """
+    Token lookup over a field holding *GroupA+GroupB patterns: `in` and get() answer
+    what the set / first-index dict of the expanded list would, memoized per token.
+    """
+    __slots__ = ("seq", "_first")
+
+    def __init__(self, seq: ExpandedList):
+        self.seq = seq
+        self._first = {}
+
+    def get(self, token, default=None):
+        k = self._first.get(token, -1)
+        if k == -1:
+            try:
+                k = self.seq.index(token)
+            except ValueError:
+                k = None
+            if len(self._first) >= 65536:
+                self._first.clear()
+            self._first[token] = k
+        return default if k is None else k
+
+    def __contains__(self, token):
+        return self.get(token) is not None
+
+    def __bool__(self):
+        return len(self.seq) > 0
+
+
+def _first_index(seq) -> dict:
+    """Map each item to the index of its first occurrence (what list.index returns)."""
+    if isinstance(seq, ExpandedList):
+        return SymbolicLookup(seq)
+    index = {}
+    for k, item in enumerate(seq):
+        index.setdefault(item, k)
+    return index
+
+
+def _member_set(seq):
+    """frozenset of a field, or a SymbolicLookup if it holds *GroupA+GroupB patterns."""
+    return SymbolicLookup(seq) if isinstance(seq, ExpandedList) else frozenset(seq)
+
+
+class _LazyTokens:
+    """Index-aligned tokenizations of a symbolic field, computed on first use."""
+    __slots__ = ("seq",)
+
+    def __init__(self, seq):
+        self.seq = seq
+
+    def __getitem__(self, j):
+        return _tokens(self.seq[j])
+
+
+def _pattern_spans(pattern, phonemes, i, step, stop_at_boundary=True):
+    """
+    Yield the token spans next to position i (after it for step 1, before it for
+    step -1) that spell a string of `pattern` and tokenize back to the same tokens.
+    Work depends on the span length, never on how many strings the pattern has.
+    """
+    n = len(phonemes)
+    text = ""
+    k = i if step > 0 else i - 1
+    while 0 <= k < n:
+        tok = phonemes[k]
+        if stop_at_boundary and tok == ".":
+            return
+        text = text + tok if step > 0 else tok + text
+        if len(text) > pattern.max_len:
+            return
+        k += step
+        if text in pattern:
+            span = tuple(phonemes[i:k]) if step > 0 else tuple(phonemes[k + 1:i])
+            if _tokens(text) == span:
+                yield span
 
 
 # One module-level tokenizer (permissive by default for evolution stage)
 _TOK = Tokenizer(units=DEFAULT_IPA_UNITS, strict_compounds=False)
 
+# Shared memo: the same syllables are re-tokenized by every rule of a preset.
+_TOK_CACHE = TokenCache(_TOK, maxsize=65536)
+
+def _tokens(ipa_string) -> tuple:
+    """Cached tokenization as a shared tuple. Do not mutate; use tokenize_ipa for a list."""
+    return _TOK_CACHE.tokens(ipa_string)
+
 def tokenize_ipa(ipa_string):
-    return _TOK.tokenize(ipa_string)
+    return list(_TOK_CACHE.tokens(ipa_string))
+
+def tokenize_cache_info() -> dict:
+    """Hit/miss/eviction counters of the shared tokenization cache."""
+    return _TOK_CACHE.stats()
+
+def clear_tokenize_cache() -> None:
+    _TOK_CACHE.clear()
 
 # Language specific weight function (optional)
 _WEIGHT_FN: Callable[[str, bool], bool] | None = None
@@ -108,8 +401,8 @@ def is_syllable_heavy(syllable_text: str, coda_matters: bool = True) -> bool:
         return _WEIGHT_FN(syllable_text, coda_matters)
 
     # --- Generic fallback (very conservative) ---
-    toks = tokenize_ipa(syllable_text)
-    vowels = set(IPA_GROUPS.get("ShortVowels", []))
+    toks = _tokens(syllable_text)
+    vowels = INVENTORY.members("ShortVowels")
     # long vowel nucleus
     if any("ː" in t for t in toks):
         return True
@@ -125,21 +418,58 @@ def is_syllable_heavy(syllable_text: str, coda_matters: bool = True) -> bool:
 # ===== WORD-LEVEL CLASSES =====
 
 class Syllable: 
-    # Structured container for each syllable
-    def __init__(self, text: str, stressed: bool = False):
-        self.text = text
+    # Structured container for each syllable. The token tuple is the primary form
+    # (interned, shared through the tokenization cache); text is joined on demand.
+    __slots__ = ("tokens", "stressed")
+
+    def __init__(self, text: str = "", stressed: bool = False):
+        self.tokens = _tokens(text)
         self.stressed = stressed
-    
+
+    @classmethod
+    def from_tokens(cls, tokens, stressed: bool = False) -> "Syllable":
+        """
+        Build a syllable from rule output. The tokens are re-normalized through the
+        tokenizer so that neighbours fuse exactly as they would after a string
+        round-trip (e.g. t + s → ts), keeping rule semantics unchanged.
+        """
+        syll = cls.__new__(cls)
+        syll.tokens = _tokens("".join(tokens))
+        syll.stressed = stressed
+        return syll
+
+    @property
+    def text(self) -> str:
+        return "".join(self.tokens)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.tokens = _tokens(value)
+
     def __str__(self):
         return f"ˈ{self.text}" if self.stressed else self.text
     
 class Word:
     # Encapsulates syllables, original form and syntactic metadata.
+    # Slotted, and the history list is only created once something reads or logs it:
+    # a million-word lexicon holds a million of these.
+    __slots__ = ("original", "syllables", "syn_func", "_history")
+
     def __init__(self, text: str, syn_func: str = "v"):
         self.original = text
         self.syllables = self.parse_syllables(text)
         self.syn_func = syn_func
-        self.history = []
+        self._history = None
+
+    @property
+    def history(self):
+        if self._history is None:
+            self._history = []
+        return self._history
+
+    @history.setter
+    def history(self, value) -> None:
+        self._history = value
 
     def get_stress_index(self):
         for i, syll in enumerate(self.syllables):
@@ -151,6 +481,19 @@ class Word:
     def log_step(self, rule_name, before, after):
         self.history.append((rule_name, before, after))
 
+    def snapshot(self) -> tuple:
+        """Compact, hashable copy of the syllable state (shares the token tuples)."""
+        return tuple((s.tokens, s.stressed) for s in self.syllables)
+
+    def restore(self, state: tuple) -> None:
+        syllables = []
+        for tokens, stressed in state:
+            syll = Syllable.__new__(Syllable)
+            syll.tokens = tokens
+            syll.stressed = stressed
+            syllables.append(syll)
+        self.syllables = syllables
+
     def parse_syllables(self, text: str):
         sylls = text.split(".")
         syllables = []
@@ -164,7 +507,10 @@ class Word:
     def print_history(self):
         print(f"History for: {self.original}")
         for rule_name, before, after in self.history:
-            print(f"  {rule_name:<20}: {before} → {after}")
+            if before is None:      # history_mode="fired" keeps no forms
+                print(f"  {rule_name}")
+            else:
+                print(f"  {rule_name:<20}: {before} → {after}")
     
     def to_string(self):
         result = []
@@ -176,9 +522,166 @@ class Word:
                 result.append("?")  # visible error marker
         return ".".join(result)
            
+# ===== HISTORY =====
+# With log_steps, a changed word's history is by default a list of (rule_name, before,
+# after) strings. EvolutionEngine(history_mode="compact") keeps token-level edits
+# instead, rebuilt into the same tuples when read; "fired" keeps only which rules
+# changed the word. Steps are recorded from Word.snapshot() states, so nothing is
+# rendered for words a rule leaves alone.
+
+def _render(state: tuple) -> str:
+    """Word.to_string() of a Word.snapshot()."""
+    return ".".join("ˈ" + "".join(tokens) if stressed else "".join(tokens)
+                    for tokens, stressed in state)
+
+def _flat(state: tuple) -> tuple:
+    """A snapshot as one token tuple, "." between syllables and "ˈ" before a stressed one."""
+    out = []
+    for k, (tokens, stressed) in enumerate(state):
+        if k:
+            out.append(".")
+        if stressed:
+            out.append("ˈ")
+        out.extend(tokens)
+    return tuple(out)
+
+def _sampled(text: str, rate: float) -> bool:
+    """Is the word in the `rate` share of words whose history is kept? (Stable across runs.)"""
+    return zlib.crc32(text.encode("utf-8")) < rate * 0x100000000
+
+class CompactHistory:
+    """
+    A word's history as token-level edits: (rule_name, position, removed, inserted)
+    over the flat token form (see _flat), plus the form after the last one. Reads
+    like the list of (rule_name, before, after) tuples it replaces; earlier forms
+    are rebuilt by undoing edits from the last.
+    """
+    __slots__ = ("edits", "last")
+
+    def __init__(self):
+        self.edits: list[tuple] = []
+        self.last: tuple = ()
+
+    def record(self, rule_name: str, before: tuple, after: tuple) -> None:
+        """Add a step between two Word.snapshot() states (skipped if the text is unchanged)."""
+        if _render(before) == _render(after):
+            return
+        old = self.last if self.edits else _flat(before)     # renders the same as before
+        new = _flat(after)
+        i, n, m = 0, len(old), len(new)
+        while i < n and i < m and old[i] == new[i]:
+            i += 1
+        j = 0
+        while j < n - i and j < m - i and old[n - 1 - j] == new[m - 1 - j]:
+            j += 1
+        self.edits.append((rule_name, i, old[i:n - j], new[i:m - j]))
+        self.last = new
+
+    def _forms(self) -> list[tuple]:
+        """Flat form before every edit, and after the last one."""
+        forms = [self.last]
+        form = self.last
+        for _, pos, removed, inserted in reversed(self.edits):
+            form = form[:pos] + removed + form[pos + len(inserted):]
+            forms.append(form)
+        forms.reverse()
+        return forms
+
+    def steps(self) -> list[tuple]:
+        forms = ["".join(f) for f in self._forms()]
+        return [(edit[0], forms[k], forms[k + 1]) for k, edit in enumerate(self.edits)]
+
+    def __len__(self):
+        return len(self.edits)
+
+    def __iter__(self):
+        return iter(self.steps())
+
+    def __getitem__(self, key):
+        return self.steps()[key]
+
+    def __delitem__(self, key):
+        # only truncation (del history[k:]), as IncrementalEvolution rewinds
+        if not isinstance(key, slice) or key.stop is not None or key.step is not None:
+            raise TypeError("CompactHistory only supports del history[k:]")
+        k = len(self.edits) if key.start is None else min(key.start, len(self.edits))
+        if k < len(self.edits):
+            self.last = self._forms()[k]
+            del self.edits[k:]
+
+    def __eq__(self, other):
+        try:
+            return self.steps() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(self.steps())
+
+class FiredRules:
+    """
+    Only which rules changed a word, as a bitmask over rule indices: bit k is rule
+    k of the list the engine ran, and table[k] its name (the engine's rule_names),
+    so same-named rules keep their own bits. Reads as (rule_name, None, None) per
+    fired rule, in rule order.
+    """
+    __slots__ = ("mask", "table")
+
+    def __init__(self, table: list):
+        self.mask = 0
+        self.table = table
+
+    def record(self, k: int, before: tuple, after: tuple) -> None:
+        if _render(before) != _render(after):
+            self.mask |= 1 << k
+
+    def indices(self) -> list[int]:
+        mask = self.mask
+        return [k for k in range(mask.bit_length()) if mask >> k & 1]
+
+    def names(self) -> list[str]:
+        table = self.table
+        return [table[k] for k in self.indices()]
+
+    def __len__(self):
+        return self.mask.bit_count()
+
+    def __iter__(self):
+        return iter([(name, None, None) for name in self.names()])
+
+    def __contains__(self, rule_name):
+        return rule_name in self.names()
+
+    def __reduce__(self):
+        # only the fired rules travel, not the whole table
+        return (_fired_from, (self.indices(), self.names()))
+
+    def __repr__(self):
+        return f"FiredRules({self.names()!r})"
+
+def _fired_from(indices, names) -> FiredRules:
+    fired = FiredRules([None] * (indices[-1] + 1 if indices else 0))
+    for k, name in zip(indices, names):
+        fired.table[k] = name
+        fired.mask |= 1 << k
+    return fired
+
+HISTORY_MODES = ("full", "compact", "fired")
+
 # ===== RULE INTERFACE =====
 
 class Rule:
+    # What the engine may assume when skipping words (see LexiconIndex):
+    # required_tokens - tuple of groups; each group is a set of alternative token tuples
+    #                   and the rule can only change a word that holds every token of at
+    #                   least one alternative in each group. None: any word may change.
+    # no_match_effect - what apply() still does to a word it does not match: None (leaves
+    #                   it alone), "regroup", "resyllabify" or "syllabic-first/last".
+    required_tokens = None
+    no_match_effect = None
+    # RuleProfile collecting match counts while the engine profiles (see profiler.py)
+    stats = None
+
     def __init__(self, data: dict):
         self.name = data["name"]
         self.type = data["type"]
@@ -188,6 +691,9 @@ class Rule:
         raise NotImplementedError("This rule must implement apply()")
 
 class PhonoRule(Rule):
+    _nuclei = INVENTORY.members("Nuclei")
+    _short_vowels = INVENTORY.members("ShortVowels")
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.cluster_policies = []
@@ -209,76 +715,36 @@ class PhonoRule(Rule):
             i += 1
         return i
 
-    def match_context(self, phonemes, i, old_len, pre_list, post_list):
-        def _pre_anchor(pre_seq):
-            if pre_seq and pre_seq[-1] == ".":
-                return i  # look immediately before i, boundary-inclusive
-            return self.skip_boundaries_backward(phonemes, i)
-
-        def _post_anchor(post_seq):
-            if post_seq and post_seq[0] == ".":
-                return i + old_len  # look immediately after match, boundary-inclusive
-            return self.skip_boundaries_forward(phonemes, i + old_len)
-
-        pre_ok = True
-        if pre_list:
-            pre_ok = False
-            for pre in pre_list:
-                if pre == ["*Blank"]:
-                    if i == 0 or phonemes[i - 1] == ".":
-                        pre_ok = True
-                        break
-
-                anchor = _pre_anchor(pre)
-                if anchor >= len(pre) and phonemes[anchor - len(pre):anchor] == list(pre):
-                    pre_ok = True
-                    break
-
-        post_ok = True
-        if post_list:
-            post_ok = False
-            for post in post_list:
-                if post == ["*Blank"]: 
-                    if i + old_len >= len(phonemes) or phonemes[i + old_len] == ".":
-                        post_ok = True
-                        break
-
-                anchor = _post_anchor(post)
-                if anchor + len(post) <= len(phonemes) and phonemes[anchor:anchor + len(post)] == list(post):
-                    post_ok = True
-                    break
-        
-        return pre_ok and post_ok
+    def match_context(self, phonemes, i, old_len, pre_ctx, post_ctx):
+        """Both trigger contexts (CompiledContext or None) must be satisfied."""
+        if pre_ctx is not None and not pre_ctx.match_pre(phonemes, i):
+            return False
+        if post_ctx is not None and not post_ctx.match_post(phonemes, i + old_len):
+            return False
+        return True
 
     def match_exclusion(self, phonemes, i, old_len, except_pre, except_post):
-        def _pre_anchor(pre_seq):
-            if pre_seq and pre_seq[-1] == ".":
-                return i
-            return self.skip_boundaries_backward(phonemes, i)
-
-        def _post_anchor(post_seq):
-            if post_seq and post_seq[0] == ".":
-                return i + old_len
-            return self.skip_boundaries_forward(phonemes, i + old_len)
-
-        pre_hit = False
-        if except_pre:
-            for pre in except_pre:
-                anchor = _pre_anchor(pre)
-                if anchor >= len(pre) and phonemes[anchor - len(pre):anchor] == list(pre):
-                    pre_hit = True
-                    break
-
-        post_hit = False
-        if except_post:
-            for post in except_post:
-                anchor = _post_anchor(post)
-                if anchor + len(post) <= len(phonemes) and phonemes[anchor:anchor + len(post)] == list(post):
-                    post_hit = True
-                    break
-
-        return pre_hit or post_hit
+        """True if either exception context (CompiledContext or None) hits."""
+        if except_pre is not None and except_pre.match_pre(phonemes, i):
+            return True
+        if except_post is not None and except_post.match_post(phonemes, i + old_len):
+            return True
+        return False
 
+    def flatten(self, word):
+        """
+        Lay the word's syllable tokens out as one list with "." between syllables,
+        plus a parallel list of syllable indices (None on boundaries).
+        """
+        phonemes = []
+        syllable_map = []
+        for i, syll in enumerate(word.syllables):
+            if i:
+                phonemes.append(".")
+                syllable_map.append(None)
+            phonemes.extend(syll.tokens)
+            syllable_map.extend([i] * len(syll.tokens))
+        return phonemes, syllable_map
 
     def rebuild_syllables(self, phonemes, stress_index):
         syllables = []
@@ -288,149 +754,114 @@ class PhonoRule(Rule):
             if p == ".":
                 if buffer:
                     stressed = (syll_index == stress_index)
-                    syllables.append(Syllable("".join(buffer), stressed))
+                    syllables.append(Syllable.from_tokens(buffer, stressed))
                     buffer = []
                     syll_index += 1
             else:
                 buffer.append(p)
         if buffer:
             stressed = (syll_index == stress_index)
-            syllables.append(Syllable("".join(buffer), stressed))
+            syllables.append(Syllable.from_tokens(buffer, stressed))
         return syllables
     
     def refine_syllables(self, syllables):
         """
-        Refines a list of syllables to ensure each contains a valid phonological nucleus.
-        - Uses sonority sequencing to prevent illegal onset merges.
-        - Prevents merging prosthetic syllables with following onset.
-        - Rebalances nucleus-only syllables via coda sharing from previous syllable.
+        Refines a list of syllables to ensure each contains a valid phonological nucleus,
+        in a single left-to-right pass (each syllable is settled once, merges only touch
+        the syllable being settled and the last settled one):
+        - A syllable with no nucleus may not stand alone: it becomes the onset of the
+          next syllable (passing on its stress), or word-finally the coda of the previous.
+          Cluster policies and sonority cannot keep it apart, so they are not consulted.
+        - Rebalances nucleus-only syllables via coda sharing from the previous syllable.
         """
+        nuclei = self._nuclei
+        short_vowels = self._short_vowels
 
-        nuclei = set(IPA_GROUPS.get("Nuclei", []))
-        short_vowels = set(IPA_GROUPS.get("ShortVowels", []))  # for a tiny safety fallback
-
-        def has_nucleus(syllable):
-            toks = tokenize_ipa(syllable.text)
+        def has_nucleus(toks):
             if any(t in nuclei for t in toks):
                 return True
             # belt-and-suspenders: vowel + combining tilde split as separate tokens
-            return any(i + 1 < len(toks) and toks[i] in short_vowels and toks[i + 1] == "̃"
-                    for i in range(len(toks)))
-
-        def starts_with_nucleus(syllable):
-            toks = tokenize_ipa(syllable.text)
-            if not toks:
-                return False
-            if toks[0] in nuclei:
-                return True
-            # also treat leading vowel + combining tilde as a nucleus-start
-            return len(toks) >= 2 and toks[0] in short_vowels and toks[1] == "̃"
-
-        i = 0
-        while i < len(syllables):
-            curr = syllables[i]
-
-            if has_nucleus(curr):
-                # If current syllable is just a nucleus token, borrow previous coda as onset.
-                toks = tokenize_ipa(curr.text)
-                if len(toks) == 1 and (toks[0] in nuclei or (toks[0] in short_vowels)) and i > 0:
-                    prev = syllables[i - 1]
-                    prev_toks = tokenize_ipa(prev.text)
-                    if prev_toks and prev_toks[-1] not in nuclei:
-                        moved = prev_toks[-1]
-                        prev.text = "".join(prev_toks[:-1])
-                        curr.text = moved + curr.text
-                i += 1
-                continue
-
-
-            # MERGE FORWARD: if current has no nucleus, try to merge into the next syllable
-            if i + 1 < len(syllables):
-                nxt = syllables[i + 1]
-                nxt_toks = tokenize_ipa(nxt.text)
-                onset = _onset_tokens(nxt_toks, nuclei)
-
-
-                policy_dec = None
-                for rule in self.cluster_policies:
-                    d = _cluster_policy_decision("onset", i+1, len(syllables), onset, rule)
-                    if d is not None:
-                        policy_dec = d
-
-                if policy_dec is False:
-                    pass
-                elif policy_dec is True:
-                    if curr.stressed:
-                        nxt.stressed = True
-                    nxt.text = curr.text + nxt.text
-                    syllables.pop(i)
-                    continue
-
-                # If next starts with a nucleus, absorb curr into it.
-                if starts_with_nucleus(nxt):
-                    if curr.stressed:
-                        nxt.stressed = True
-                    nxt.text = curr.text + nxt.text
-                    syllables.pop(i)
-                    continue
-
-                # Otherwise: only merge if the next onset is NOT licensable by SSP (incl. s-cluster exception).
-                if not _licensable_onset(nxt_toks):
-                    if curr.stressed:
-                        nxt.stressed = True
-                    nxt.text = curr.text + nxt.text
-                    syllables.pop(i)
-                    continue
-
-
-            # A syllable with no nucleus may not stand alone.
-            if not has_nucleus(curr):
-                # Prefer attaching forward (as onset) if a next syllable exists
-                if i + 1 < len(syllables):
-                    if curr.stressed:
-                        syllables[i + 1].stressed = True
-                    syllables[i + 1].text = curr.text + syllables[i + 1].text
-                    syllables.pop(i)
-                    continue
-                # Otherwise, attach backward (as coda) if a previous syllable exists
-                if i > 0:
-                    syllables[i - 1].text += curr.text
-                    syllables.pop(i)
-                    i -= 1
-                    continue
+            return any(toks[i] in short_vowels and toks[i + 1] == "̃"
+                       for i in range(len(toks) - 1))
+
+        def borrow_onset(out):
+            # If the last syllable is just a nucleus token, borrow previous coda as onset.
+            curr = out[-1]
+            toks = curr.tokens
+            if len(toks) == 1 and (toks[0] in nuclei or toks[0] in short_vowels) and len(out) > 1:
+                prev = out[-2]
+                prev_toks = prev.tokens
+                if prev_toks and prev_toks[-1] not in nuclei:
+                    moved = prev_toks[-1]
+                    prev.text = "".join(prev_toks[:-1])
+                    curr.text = moved + curr.text
+
+        out = []
+        carry = None        # nucleus-less syllable waiting to merge into the next one
+        last = len(syllables) - 1
+        for k, curr in enumerate(syllables):
+            if carry is not None:
+                if carry.stressed:
+                    curr.stressed = True
+                curr.text = carry.text + curr.text
+                carry = None
+
+            if has_nucleus(curr.tokens):
+                out.append(curr)
+                borrow_onset(out)
+            elif k < last:
+                carry = curr
+            else:
+                # word-final: attach backward as coda until the host has a nucleus
+                out.append(curr)
+                while len(out) > 1 and not has_nucleus(out[-1].tokens):
+                    tail = out.pop()
+                    out[-1].text += tail.text
+                if has_nucleus(out[-1].tokens):
+                    borrow_onset(out)
                 # If it's the only syllable, nothing to merge with — just leave it.
 
-            # MERGE BACKWARD: if curr isn't a licensable onset, attach it to the previous syllable
-            curr_toks = tokenize_ipa(curr.text)
-            if i > 0 and not _licensable_onset(curr_toks):
-                syllables[i - 1].text += curr.text
-                syllables.pop(i)
-                i -= 1
-                continue
+        return out
 
-            # ==== INSERT: ClusterPolicy for CURRENT CODA ====
-            curr_toks = tokenize_ipa(curr.text)
-            coda = _coda_tokens(curr_toks, nuclei)
-
-            policy_dec = None
-            for rule in self.cluster_policies:
-                d = _cluster_policy_decision("coda", i, len(syllables), coda, rule)
-                if d is not None:
-                    policy_dec = d
-
-            if policy_dec is False and i + 1 < len(syllables) and coda:
-                # Coda explicitly banned → push one consonant forward
-                last = coda[-1]
-                # Remove the last token's literal slice; this assumes tokens are single-codepoint strings
-                curr.text = curr.text[:-len(last)]
-                syllables[i + 1].text = last + syllables[i + 1].text
-                continue
+# ===== PHONORULES ====
+def _flatten_stressed(word) -> list:
+    """[syll_index, token, is_stressed] for every token of the word."""
+    return [[i, t, syll.stressed] for i, syll in enumerate(word.syllables) for t in syll.tokens]
 
-            i += 1
+def _regroup(phonemes, syllables=None, touched=()) -> list:
+    """
+    Syllables back from _flatten_stressed entries; syllables left with no tokens
+    disappear. Given the word's syllables and the indices of the ones a scan
+    rewrote, and no syllable is empty, only the rewritten ones are rebuilt: the
+    others would come back with the same tokens and stress.
+    """
+    if syllables is not None and all(s.tokens for s in syllables):
+        if not touched:
+            return syllables
+        out = list(syllables)
+        for i in touched:
+            out[i] = Syllable.from_tokens([p[1] for p in phonemes if p[0] == i],
+                                          stressed=out[i].stressed)
+        return out
+
+    syllables = []
+    current_syll = []
+    current_idx = phonemes[0][0] if phonemes else None
+
+    for idx, phoneme in enumerate(phonemes):
+        syll_idx, symbol, stressed = phoneme
+        if syll_idx == current_idx:
+            current_syll.append(symbol)
+        else:
+            syllables.append(Syllable.from_tokens(current_syll, stressed=phonemes[idx - 1][2]))
+            current_syll = [symbol]
+            current_idx = syll_idx
 
-        return syllables
+    # Append final syllable
+    if current_syll:
+        syllables.append(Syllable.from_tokens(current_syll, stressed=phonemes[-1][2]))
+    return syllables
 
-# ===== PHONORULES ====
 class AssimilationRule(PhonoRule):
     def __init__(self, data: dict):
         super().__init__(data)
@@ -441,15 +872,25 @@ class AssimilationRule(PhonoRule):
         self.skip_stress = data.get("skip_stress", False)
         self.require_identical = data.get("require_identical", False)
 
+        # compiled lookups
+        self._target_index = _first_index(self.targets)
+        self._trigger_set = _member_set(self.triggers)
+        self.required_tokens = _required_singles(self._target_index, self._trigger_set)
+        self.no_match_effect = "regroup"
 
     def apply(self, word):
         # Flatten syllables into list of [syll_index, phoneme, is_stressed]
-        phonemes = []
-        for i, syll in enumerate(word.syllables):
-            tokens = tokenize_ipa(syll.text)
-            for t in tokens:
-                phonemes.append([i, t, syll.stressed])
+        phonemes = _flatten_stressed(word)
+        touched = self.scan(phonemes, word.get_stress_index())
+        word.syllables = _regroup(phonemes, word.syllables, touched)
 
+    def scan(self, phonemes, stress_index) -> set:
+        """
+        Rewrite the flattened [syll_index, phoneme, is_stressed] entries in place.
+        Returns the indices of the syllables it rewrote.
+        """
+        touched = set()
+        attempted = accepted = 0
         # Determine direction
         start = 0 if self.regressive else 1
         end = len(phonemes) - 1 if self.regressive else len(phonemes)
@@ -467,32 +908,21 @@ class AssimilationRule(PhonoRule):
                 if current[1] != neighbor[1]:
                     continue
 
-            if current[1] in self.targets and neighbor[1] in self.triggers:
-                target_index = self.targets.index(current[1])
+            target_index = self._target_index.get(current[1])
+            if target_index is None:
+                continue
+            attempted += 1
+            if neighbor[1] in self._trigger_set:
                 current[1] = self.replace[target_index]
+                touched.add(current[0])
+                accepted += 1
 
-        # === Reconstruct syllables by grouping phonemes by syll_index ===
-        syllables = []
-        current_syll = []
-        current_idx = phonemes[0][0] if phonemes else None
-
-        for idx, phoneme in enumerate(phonemes):
-            syll_idx, symbol, stressed = phoneme
-            if syll_idx == current_idx:
-                current_syll.append(symbol)
-            else:
-                syllables.append(Syllable("".join(current_syll), stressed=phonemes[idx-1][2]))
-                current_syll = [symbol]
-                current_idx = syll_idx
-
-        # Append final syllable
-        if current_syll:
-            syllables.append(Syllable("".join(current_syll), stressed=phonemes[-1][2]))
-
-        word.syllables = syllables
+        if self.stats is not None:
+            self.stats.add_matches(attempted, accepted)
+        return touched
 
 class DeletionRule(PhonoRule):
-    nuclei = set(IPA_GROUPS.get("Nuclei", [])) | set(IPA_GROUPS.get("ShortVowels", []))
+    nuclei = INVENTORY.members("Nuclei", "ShortVowels")
     def __init__(self, data: dict):
         super().__init__(data)
         self.del_list = data["del_list"]
@@ -504,41 +934,33 @@ class DeletionRule(PhonoRule):
         self.stress_solo = data.get("stress_solo", False)
         self.sonority_safe = data.get("sonority_safe", True)
 
-    def apply(self, word: Word):
-        # Tokenize syllables
-        phonemes = []
-        syllable_map = []
-        for i, syll in enumerate(word.syllables):
-            tokens = tokenize_ipa(syll.text)
-            for p in tokens:
-                phonemes.append(p)
-                syllable_map.append(i)
-            phonemes.append(".")
-            syllable_map.append(None)
-        if phonemes:
-            phonemes.pop()
-            syllable_map.pop()
-
-        pre_list_tok    = _prep_ctx_list(self.pre_list)
-        post_list_tok   = _prep_ctx_list(self.post_list)
-        except_pre_tok  = _prep_ctx_list(self.except_pre)
-        except_post_tok = _prep_ctx_list(self.except_post)
-
+        # compiled lookups
+        self._del_set = _member_set(self.del_list)
+        self._pre_ctx = _compile_ctx(self.pre_list, "pre")
+        self._post_ctx = _compile_ctx(self.post_list, "post")
+        self._except_pre_ctx = _compile_ctx(self.except_pre, "pre", honor_blank=False)
+        self._except_post_ctx = _compile_ctx(self.except_post, "post", honor_blank=False)
+        self.required_tokens = _required_singles(self._del_set)
+        self.no_match_effect = "resyllabify"
 
+    def apply(self, word: Word):
+        phonemes, syllable_map = self.flatten(word)
 
         # Stress index
         stress_index = word.get_stress_index()
 
 
         edits = []
+        attempted = 0
         i = 0
         while i < len(phonemes):
             syll_idx = syllable_map[i]
             symbol = phonemes[i]
 
-            if symbol not in self.del_list:
+            if symbol not in self._del_set:
                 i += 1
                 continue
+            attempted += 1
 
             
 
@@ -548,11 +970,11 @@ class DeletionRule(PhonoRule):
                 continue
 
             # Context filters
-            if not self.match_context(phonemes, i, 1, pre_list_tok, post_list_tok):
+            if not self.match_context(phonemes, i, 1, self._pre_ctx, self._post_ctx):
                 i += 1
                 continue
 
-            if self.match_exclusion(phonemes, i, 1, except_pre_tok, except_post_tok):
+            if self.match_exclusion(phonemes, i, 1, self._except_pre_ctx, self._except_post_ctx):
                 i += 1
                 continue
 
@@ -574,6 +996,9 @@ class DeletionRule(PhonoRule):
             edits.append(i)
             i += 1
 
+        if self.stats is not None:
+            self.stats.add_matches(attempted, len(edits))
+
         # Delete marked phonemes
         for index in reversed(edits):
             phonemes.pop(index)
@@ -594,76 +1019,69 @@ class DiscontiguousRule(PhonoRule):
         self.max_distance = data["max_distance"]
         self.require_identical = data.get("require_identical", False)
 
-
+        # compiled lookups
+        self._target_index = _first_index(self.targets)
+        self._trigger_set = _member_set(self.triggers)
+        self.required_tokens = _required_singles(self._target_index, self._trigger_set)
+        self.no_match_effect = "regroup"
 
     def apply(self, word: Word):
         # === Flatten into [syll_index, symbol, is_stressed]
-        phonemes = []
-        for i, syll in enumerate(word.syllables):
-            tokens = tokenize_ipa(syll.text)
-            for t in tokens:
-                phonemes.append([i, t, syll.stressed])
-
-        # === Identify stress index
-        stress_index = word.get_stress_index()
-
+        phonemes = _flatten_stressed(word)
+        touched = self.scan(phonemes, word.get_stress_index())
+        word.syllables = _regroup(phonemes, word.syllables, touched)
 
+    def scan(self, phonemes, stress_index) -> set:
+        """
+        Rewrite the flattened [syll_index, symbol, is_stressed] entries in place.
+        Returns the indices of the syllables it rewrote.
+        """
+        touched = set()
+        attempted = accepted = 0
         # === Apply discontiguous assimilation
-        for i, current in enumerate(phonemes):
-            syll_idx, phoneme, stressed = current
-
-            if phoneme not in self.targets:
-                continue
-            if self.skip_stress and syll_idx == stress_index:
-                continue
-
-            window_indices = self.get_window_indices(phonemes, i, self.max_distance)
-            if any(phonemes[j][1] in self.triggers for j in window_indices):
-                repl_index = self.targets.index(phoneme)
-                current[1] = self.replace[repl_index]
-
-        # === Rebuild syllables
-        syllables = []
-        current_syll = []
-        current_idx = phonemes[0][0] if phonemes else None
-
-        for idx, phoneme in enumerate(phonemes):
-            syll_idx, symbol, stressed = phoneme
-            if syll_idx == current_idx:
-                current_syll.append(symbol)
-            else:
-                syllables.append(Syllable("".join(current_syll),
-                                          stressed=phonemes[idx - 1][2]))
-                current_syll = [symbol]
-                current_idx = syll_idx
-
-        if current_syll:
-            syllables.append(Syllable("".join(current_syll), stressed=phonemes[-1][2]))
-
-        word.syllables = syllables
-
-    def get_window_indices(self, phonemes, idx, max_dist):
-        indices = []
-        dist = 0
-
+        # The window is the max_distance tokens before (progressive) or after (regressive)
+        # each target, not counting "." (rules may leave boundaries inside syllables);
+        # a running trigger count slides along with it. Progressive windows see
+        # replacements already made in this pass, regressive windows only hold tokens
+        # that have not been visited yet.
+        triggers = self._trigger_set
+        dist = max(self.max_distance, 0)
+        in_window = 0
         if self.regressive:
-            # Look forward (right)
-            j = idx + 1
-            while j < len(phonemes) and dist < max_dist:
-                if phonemes[j][1] != ".":
-                    indices.append(j)
-                    dist += 1
-                j += 1
+            ahead = [j for j, p in enumerate(phonemes) if p[1] != "."]
+            flags = [phonemes[j][1] in triggers for j in ahead]
+            k = 0                           # ahead[k] is the first position after i
+            in_window = sum(flags[:dist])
         else:
-            # Look backward (left)
-            j = idx - 1
-            while j >= 0 and dist < max_dist:
-                if phonemes[j][1] != ".":
-                    indices.append(j)
-                    dist += 1
-                j -= 1
+            behind = deque()                # trigger flags of the last dist tokens
 
-        return indices
+        for i, current in enumerate(phonemes):
+            syll_idx, phoneme, stressed = current
+            if self.regressive and k < len(ahead) and ahead[k] == i:
+                # slide the window past i
+                in_window -= flags[k]
+                if k + dist < len(ahead):
+                    in_window += flags[k + dist]
+                k += 1
+
+            repl_index = self._target_index.get(phoneme)
+            if repl_index is not None:
+                attempted += 1
+                if in_window and not (self.skip_stress and syll_idx == stress_index):
+                    current[1] = self.replace[repl_index]
+                    touched.add(syll_idx)
+                    accepted += 1
+
+            if not self.regressive and dist and current[1] != ".":
+                flag = current[1] in triggers
+                behind.append(flag)
+                in_window += flag
+                if len(behind) > dist:
+                    in_window -= behind.popleft()
+
+        if self.stats is not None:
+            self.stats.add_matches(attempted, accepted)
+        return touched
 
 class EpentheticRule(PhonoRule):
     def __init__(self, data: dict):
@@ -674,6 +1092,12 @@ class EpentheticRule(PhonoRule):
         self.pre_list = data.get("pre_list", [])
         self.post_list = data.get("post_list", [])
 
+        # compiled lookups
+        self._find_index = _first_index(self.find_list)
+        self._pre_set = _member_set(self.pre_list)
+        self._post_set = _member_set(self.post_list)
+        self.required_tokens = _required_singles(self._find_index)
+
     def refine_epenthetic_syllable(self, raw_text: str) -> list:
         if "." in raw_text:
             parts = raw_text.split(".")
@@ -687,27 +1111,33 @@ class EpentheticRule(PhonoRule):
 
         idx = 0 if self.syllable_pos == "first" else -1
         target = word.syllables[idx]
-        tokens = tokenize_ipa(target.text)
+        tokens = target.tokens
 
         new_tokens = []
         modified = False
+        attempted = accepted = 0
 
         for i, tok in enumerate(tokens):
             prev_tok = tokens[i - 1] if i > 0 else ""
             next_tok = tokens[i + 1] if i + 1 < len(tokens) else ""
 
-            if tok in self.find_list:
-                pre_ok = not self.pre_list or prev_tok in self.pre_list
-                post_ok = not self.post_list or next_tok in self.post_list
+            repl_index = self._find_index.get(tok)
+            if repl_index is not None:
+                attempted += 1
+                pre_ok = not self._pre_set or prev_tok in self._pre_set
+                post_ok = not self._post_set or next_tok in self._post_set
 
                 if pre_ok and post_ok:
-                    repl_index = self.find_list.index(tok)
                     new_tokens.append(self.replace_list[repl_index])
                     modified = True
+                    accepted += 1
                     continue
 
             new_tokens.append(tok)
 
+        if self.stats is not None:
+            self.stats.add_matches(attempted, accepted)
+
         if not modified:
             return
 
@@ -727,6 +1157,8 @@ class ClusterPolicyRule(PhonoRule):
     for onsets and codas. Does not modify words directly.
     Instead, its parameters are consumed by the syllabifier.
     """
+    # Note: the single-pass resyllabifier (refine_syllables) no longer consults
+    # policies; they are still collected and handed to every PhonoRule in order.
 
     def __init__(self, data: dict):
         super().__init__(data)
@@ -740,6 +1172,9 @@ class ClusterPolicyRule(PhonoRule):
         self.allow_set = set(self.allow)
         self.ban_set   = set(self.ban)
 
+        # never touches a word
+        self.required_tokens = (frozenset(),)
+
     def apply(self, word_obj):
         """
         ClusterPolicy does not transform the word directly.
@@ -769,63 +1204,81 @@ class ContextualRule(PhonoRule):
         self.post_ex    = data.get("post_ex", [])
         self.skip_stress = data.get("skip_stress", False)
         self.stress_solo = data.get("stress_solo", False)
+        self.compile()
+
+    def compile(self):
+        """
+        Pre-tokenize every list once and load old_list into a TokenTrie, so one walk
+        per position finds every candidate (in old_list order, as before). Patterns
+        containing a boundary can never apply and are left out. *GroupA+GroupB
+        patterns stay symbolic and are matched by splitting the text at each position.
+        """
+        if isinstance(self.new_list, ExpandedList):
+            self._new_seqs = _LazyTokens(self.new_list)
+        else:
+            self._new_seqs = tuple(_tokens(seq) for seq in self.new_list)
+
+        old = self.old_list
+        symbolic = isinstance(old, ExpandedList)
+        self._old_classes = old.patterns() if symbolic else []
+        self._old_trie = TokenTrie()
+        patterns = set()
+        for j, seq in (old.literals() if symbolic else enumerate(old)):
+            toks = _tokens(seq)
+            if "." not in toks:
+                self._old_trie.add(j, toks)
+                patterns.add(toks)
+
+        self._pre_ctx = _compile_ctx(self.pre_trig, "pre")
+        self._post_ctx = _compile_ctx(self.post_trig, "post")
+        self._except_pre_ctx = _compile_ctx(self.pre_ex, "pre", honor_blank=False)
+        self._except_post_ctx = _compile_ctx(self.post_ex, "post", honor_blank=False)
+
+        # an empty old_list entry matches everywhere
+        if () in patterns or self._old_classes:
+            self.required_tokens = None
+        else:
+            self.required_tokens = (frozenset(patterns),)
+        self.no_match_effect = "resyllabify"
+
+    def _matches(self, phonemes, i) -> list:
+        """TokenTrie.matches plus the hits of symbolic patterns, in pattern-id order."""
+        found = self._old_trie.matches(phonemes, i)
+        extra = []
+        for offset, pattern in self._old_classes:
+            for span in _pattern_spans(pattern, phonemes, i, 1):
+                extra.extend((offset + k, len(span)) for k in pattern.indices("".join(span)))
+        if extra:
+            found = sorted(found + extra)
+        return found
 
     def apply(self, word: Word):
-        old_list      = self.old_list
-        new_list      = self.new_list
-        pre_list      = self.pre_trig or []
-        post_list     = self.post_trig or []
-        except_pre    = self.pre_ex or []
-        except_post   = self.post_ex or []
         skip_stress   = self.skip_stress
         stress_solo   = self.stress_solo
+        matches       = self._matches if self._old_classes else self._old_trie.matches
 
-        # Tokenize lists
-        old_list    = [tokenize_ipa(seq) for seq in old_list]
-        new_list    = [tokenize_ipa(seq) for seq in new_list]
-        pre_list    = _prep_ctx_list(pre_list)
-        post_list   = _prep_ctx_list(post_list)
-        except_pre  = _prep_ctx_list(except_pre)
-        except_post = _prep_ctx_list(except_post)
-
-
-
-        phonemes = []
-        syllable_map = []
-        for i, syll in enumerate(word.syllables):
-            tokens = tokenize_ipa(syll.text)
-            for p in tokens:
-                phonemes.append(p)
-                syllable_map.append(i)
-            phonemes.append(".")
-            syllable_map.append(None)
-        if phonemes:
-            phonemes.pop()
-            syllable_map.pop()
+        phonemes, syllable_map = self.flatten(word)
 
         stress_index = word.get_stress_index()
         edits = []
+        attempted = 0
 
-        i = 0
-        while i < len(phonemes):
-            for j, old_seq in enumerate(old_list):
-                old_seq_list = list(old_seq)
-                end = i + len(old_seq_list)
-                if phonemes[i:end] != old_seq_list:
-                    continue
-                if "." in phonemes[i:end]:
-                    continue
+        # Stress, context and exclusion filters only run on real hits
+        for i in range(len(phonemes)):
+            for j, old_len in matches(phonemes, i):
+                attempted += 1
                 syll_index = syllable_map[i]
                 if not self.match_stress(syll_index, stress_index, stress_solo, skip_stress):
                     continue
-                if not self.match_context(phonemes, i, len(old_seq_list), pre_list, post_list):
+                if not self.match_context(phonemes, i, old_len, self._pre_ctx, self._post_ctx):
                     continue
-                if self.match_exclusion(phonemes, i, len(old_seq_list), except_pre, except_post):
+                if self.match_exclusion(phonemes, i, old_len, self._except_pre_ctx, self._except_post_ctx):
                     continue
 
-                edits.append((i, len(old_seq_list), list(new_list[j])))
+                edits.append((i, old_len, self._new_seqs[j]))
 
-            i += 1
+        if self.stats is not None:
+            self.stats.add_matches(attempted, len(edits))
 
         for start, length, replacement in reversed(edits):
             phonemes[start:start+length] = replacement
@@ -844,14 +1297,24 @@ class SyllabicRule(PhonoRule):
         self.skip_stress = data.get("skip_stress", False)
         self.stress_solo = data.get("stress_solo", False)
 
+        # Pseudo-ContextualRule scoped to one syllable, compiled once; the target
+        # index is filled in per word. (The adapter keeps its own empty policy list.)
+        adapter_data = {
+            "name": self.name, "type": "con", "notes": self.notes,
+            "old_list": self.old_list, "new_list": self.new_list,
+            "pre_trig": self.pre_list, "post_trig": self.post_list,
+            "pre_ex": [], "post_ex": [],
+            "skip_stress": self.skip_stress, "stress_solo": self.stress_solo,
+        }
+        self._adapter = SyllabicContextAdapter(adapter_data, self.position)
+
+        # Numbered positions warn on shorter words, so only first/last may skip words.
+        if self.position in ("first", "last"):
+            self.required_tokens = self._adapter.required_tokens
+            self.no_match_effect = f"syllabic-{self.position}"
+
     def apply(self, word: Word):
-        old_list    = self.old_list
-        new_list    = self.new_list
         position    = self.position
-        pre_list    = self.pre_list
-        post_list   = self.post_list
-        skip_stress = self.skip_stress
-        stress_solo = self.stress_solo
 
         # Resolve position
         if position == "first":
@@ -869,15 +1332,8 @@ class SyllabicRule(PhonoRule):
             print(f"[Warning] Syllable index {index} out of range for word: {word.original}")
             return
 
-        # Build a pseudo-ContextualRule scoped to this syllable
-        adapter_data = {
-            "name": self.name, "type": "con", "notes": self.notes,
-            "old_list": old_list, "new_list": new_list,
-            "pre_trig": pre_list, "post_trig": post_list,
-            "pre_ex": [], "post_ex": [],
-            "skip_stress": skip_stress, "stress_solo": stress_solo,
-        }
-        adapter = SyllabicContextAdapter(adapter_data, index)
+        adapter = self._adapter
+        adapter.syll_index = index
         adapter.apply(word)
 
         word.syllables = self.refine_syllables(word.syllables)
@@ -915,6 +1371,84 @@ class SyllabicContextAdapter(ContextualRule):
             + word.syllables[self.syll_index + 1:]
         )
 
+class NoMatchRule(PhonoRule):
+    """
+    Stands in for a rule that can never match (see reachability.py): does only what
+    the rule did to every word anyway, its no_match_effect ("resyllabify" for
+    con/del, "regroup" for ass/disc).
+    """
+
+    def __init__(self, rule: PhonoRule):
+        super().__init__({"name": rule.name, "type": rule.type, "notes": rule.notes})
+        self.replaces = rule
+        self.required_tokens = (frozenset(),)
+        self.no_match_effect = rule.no_match_effect
+
+    def apply(self, word: Word):
+        if self.no_match_effect == "regroup":
+            # syllables keep their tokens and stress; empty ones disappear
+            word.syllables = [Syllable.from_tokens(list(s.tokens), stressed=s.stressed)
+                              for s in word.syllables if s.tokens]
+            return
+        phonemes, _ = self.flatten(word)
+        stress_index = word.get_stress_index()
+        word.syllables = self.refine_syllables(self.rebuild_syllables(phonemes, stress_index))
+
+    def scan(self, phonemes, stress_index) -> set:
+        """Regroup-only stand-in: nothing to rewrite (fusable, see FusedRegroupRule)."""
+        return set()
+
+class FusedRegroupRule(PhonoRule):
+    """
+    A run of adjacent regrouping rules (assimilation, discontiguous assimilation,
+    or their NoMatchRule) applied as one pass: each rule scans the same flattened
+    word in turn and the syllables are regrouped once at the end.
+
+    That equals applying them one by one as long as the regroup between two rules
+    would change nothing, i.e. every syllable a rule rewrote re-tokenizes to the
+    same tokens (t + s would fuse into ts, "" would vanish) and no syllable is
+    empty to begin with. A word where that fails finishes rule by rule.
+    """
+
+    def __init__(self, rules: list):
+        super().__init__({"name": " + ".join(r.name for r in rules), "type": "fused", "notes": ""})
+        self.rules = rules
+        self.no_match_effect = "regroup"
+        # The first rule to change a word must find its targets in the original word.
+        if all(r.required_tokens is not None for r in rules):
+            self.required_tokens = (frozenset().union(*(r.required_tokens[0] for r in rules)),)
+
+    def apply(self, word: Word):
+        if not all(s.tokens for s in word.syllables):
+            for rule in self.rules:
+                rule.apply(word)
+            return
+
+        phonemes = _flatten_stressed(word)
+        stress_index = word.get_stress_index()
+        last = len(self.rules) - 1
+        touched = set()
+        for k, rule in enumerate(self.rules):
+            hit = rule.scan(phonemes, stress_index)
+            if not hit:
+                continue
+            touched |= hit
+            if k < last and not self._settled(phonemes, hit):
+                word.syllables = _regroup(phonemes, word.syllables, touched)
+                for rest in self.rules[k + 1:]:
+                    rest.apply(word)
+                return
+        word.syllables = _regroup(phonemes, word.syllables, touched)
+
+    @staticmethod
+    def _settled(phonemes, touched) -> bool:
+        """Would regrouping now leave every rewritten syllable's tokens as they are?"""
+        for syll_idx in touched:
+            run = tuple(p[1] for p in phonemes if p[0] == syll_idx)
+            if _tokens("".join(run)) != run:
+                return False
+        return True
+
 class StressRule(PhonoRule):
     def __init__(self, data: dict):
         super().__init__(data)
@@ -986,38 +1520,446 @@ class StressRule(PhonoRule):
             sylls[stressed_syll].stressed = True
 
 
+# ===== LEXICON INDEX =====
+
+class LexiconIndex:
+    """
+    Inverted index (token -> word ids) over a list of Word objects, kept current as
+    rules change the words, so a rule only visits the words it can act on.
+
+    A rule that does not match still normalizes the word it is applied to (see
+    Rule.no_match_effect), so a word is only skipped once it is known to be a fixed
+    point of that normalization: it went through a rule of the same effect without
+    matching and came out unchanged, and has not changed since.
+    """
+    __slots__ = ("words", "states", "tokens", "postings", "unsettled")
+
+    def __init__(self, words):
+        self.words = words
+        self.states = [w.snapshot() for w in words]
+        self.tokens = [self._token_set(state) for state in self.states]
+        self.postings: dict[str, set] = {}
+        for i, toks in enumerate(self.tokens):
+            for t in toks:
+                self.postings.setdefault(t, set()).add(i)
+        self.unsettled: dict[str, set] = {}    # no_match_effect -> ids not known to be fixed
+
+    @staticmethod
+    def _token_set(state) -> frozenset:
+        return frozenset(t for tokens, _ in state for t in tokens)
+
+    def candidates(self, required) -> set:
+        """Ids of the words that satisfy Rule.required_tokens."""
+        postings, tokens = self.postings, self.tokens
+        ids = None
+        for group in required:
+            hit = set()
+            for alt in group:
+                # walk the shortest posting list of the alternative
+                rarest = min(alt, key=lambda t: len(postings.get(t, ())))
+                posting = postings.get(rarest)
+                if not posting:
+                    continue
+                if len(alt) == 1:
+                    hit.update(posting)
+                else:
+                    hit.update(i for i in posting if tokens[i].issuperset(alt))
+            ids = hit if ids is None else ids & hit
+            if not ids:
+                break
+        return ids
+
+    def unsettled_for(self, effect: str) -> set:
+        ids = self.unsettled.get(effect)
+        if ids is None:
+            ids = self.unsettled[effect] = set(range(len(self.words)))
+        return ids
+
+    def update(self, i: int) -> bool:
+        """Re-read word i after a rule ran on it. Returns whether it changed."""
+        state = self.words[i].snapshot()
+        if state == self.states[i]:
+            return False
+        self.states[i] = state
+        old, new = self.tokens[i], self._token_set(state)
+        if old != new:
+            for t in old - new:
+                self.postings[t].discard(i)
+            for t in new - old:
+                self.postings.setdefault(t, set()).add(i)
+            self.tokens[i] = new
+        for ids in self.unsettled.values():
+            ids.add(i)
+        return True
+
+
 # ===== EVOLUTION ENGINE ======
 
+class Stage(tuple):
+    """A compiled (rule, cluster_policies) pair; .index is the rule's place in the rule list."""
+
+    def __new__(cls, rule, policies, index: int | None = None):
+        stage = super().__new__(cls, (rule, policies))
+        stage.index = index
+        return stage
+
+
 class EvolutionEngine:
-    def __init__(self, word_texts: list, log_steps: bool = False):
+    # Word lists at least this long are run through a LexiconIndex.
+    INDEX_MIN_WORDS = 32
+    # Drop rules that can never fire on the words at hand (see reachability.py).
+    PRUNE_DEAD_RULES = True
+
+    def __init__(self, word_texts: list, log_steps: bool = False, profile: bool = False,
+                 history_mode: str = "full", history_sample: float | None = None):
+        """
+        history_mode    how log_steps keeps Word.history (see HISTORY above):
+                        "full" (before/after strings), "compact" or "fired"
+        history_sample  keep histories for only this share (0-1) of the words,
+                        picked by a hash of the input form
+        """
+        if history_mode not in HISTORY_MODES:
+            raise ValueError(f"Unknown history_mode {history_mode!r}; use 'full', 'compact' or 'fired'")
         self.words = [Word(w) for w in word_texts]
         self.rules = []
         self.log_steps = log_steps
+        self.history_mode = history_mode
+        self.history_sample = history_sample
+        self.rule_names: list[str] = []   # the rule list being run, by index (history_mode="fired")
+        self._rule_index: int | None = None
         self.rule_cache = {}  # Cache to avoid rebuilding rules
         self.cluster_policies: list[ClusterPolicyRule] = []
+        self.analysis = []    # RuleReports of the last evolve()/compile() with inputs
+        self.profile = profile
+        self.profile_stats: list[RuleProfile] = []   # one per rule applied (see profiler.py)
 
 
-    def apply_rule(self, rule: Rule):
+    def apply_rule(self, rule: Rule, index: LexiconIndex | None = None):
         # make cluster policies visible to any PhonoRule subclass
         if isinstance(rule, PhonoRule):
             rule.cluster_policies = self.cluster_policies
 
-        for word in self.words:
-            before = word.to_string()
+        self._apply_to(rule, self.words, index)
+
+    def _index_for(self, words):
+        return LexiconIndex(words) if len(words) >= self.INDEX_MIN_WORDS else None
+
+    def _apply_to(self, rule: Rule, words, index: LexiconIndex | None = None):
+        if self.profile:
+            self._apply_profiled(rule, words, index)
+            return
+        if index is not None:
+            self._apply_indexed(rule, index)
+            return
+
+        # Snapshots are only needed for the history
+        if not self.log_steps:
+            for word in words:
+                rule.apply(word)
+            return
+
+        for word in words:
+            before = word.snapshot()
+            rule.apply(word)
+            after = word.snapshot()
+
+            if before != after:
+                self._log_step(word, rule.name, before, after)
+
+    def _log_step(self, word: Word, rule_name: str, before: tuple, after: tuple):
+        """Record a rule's change of a word (Word.snapshot() states) in its history."""
+        if self.history_sample is not None and not _sampled(word.original, self.history_sample):
+            return
+        history = word.history
+        if self.history_mode == "full" or (isinstance(history, list) and history):
+            before, after = _render(before), _render(after)
+            if before != after:
+                word.log_step(rule_name, before, after)
+            return
+        if self.history_mode == "fired":
+            if isinstance(history, list):
+                history = word.history = FiredRules(self.rule_names)
+            k = self._rule_index
+            if k is None:
+                # a rule applied on its own, outside evolve()/run_stages(): only its name to go by
+                if rule_name not in self.rule_names:
+                    self.rule_names.append(rule_name)
+                k = self.rule_names.index(rule_name)
+            history.record(k, before, after)
+            return
+        if isinstance(history, list):
+            history = word.history = CompactHistory()
+        history.record(rule_name, before, after)
+
+
+    def _apply_indexed(self, rule: Rule, index: LexiconIndex):
+        required = rule.required_tokens
+        effect = rule.no_match_effect
+        if required is None:
+            ids = range(len(index.words))
+            matchable = unsettled = None
+        else:
+            matchable = index.candidates(required)
+            if effect is None:
+                ids = sorted(matchable)
+                unsettled = None
+            else:
+                unsettled = index.unsettled_for(effect)
+                ids = sorted(matchable | unsettled)
+
+        log_steps = self.log_steps
+        n_changed = 0
+        for i in ids:
+            word = index.words[i]
+            if log_steps:
+                before = index.states[i]
             rule.apply(word)
-            after = word.to_string()
+            changed = index.update(i)
+            if changed:
+                n_changed += 1
+            if log_steps and changed:
+                self._log_step(word, rule.name, before, index.states[i])
+            elif not changed and unsettled is not None and i not in matchable and word.syllables:
+                # (a word without syllables keeps being visited: positional rules warn on it)
+                unsettled.discard(i)
+        return len(ids), n_changed
+
+    def _apply_profiled(self, rule: Rule, words, index: LexiconIndex | None):
+        """_apply_to, recording a RuleProfile for the rule in self.profile_stats."""
+        record = RuleProfile(len(self.profile_stats), rule.name, rule.type)
+        self.profile_stats.append(record)
+        # the rule itself, a syllabic rule's adapter, a fused rule's members
+        parts = [rule, getattr(rule, "_adapter", None)] + list(getattr(rule, "rules", []))
+        parts = [r for r in parts if r is not None]
+        for r in parts:
+            r.stats = record
+            if isinstance(r, PhonoRule):
+                r.refine_syllables = self._timed_refine(r, record)
+
+        start = perf_counter()
+        try:
+            if index is not None:
+                record.visited, record.changed = self._apply_indexed(rule, index)
+                return
+            for word in words:
+                state = word.snapshot()
+                rule.apply(word)
+                record.visited += 1
+                after = word.snapshot()
+                if after != state:
+                    record.changed += 1
+                    if self.log_steps:
+                        self._log_step(word, rule.name, state, after)
+        finally:
+            record.wall = perf_counter() - start
+            for r in parts:
+                del r.stats
+                r.__dict__.pop("refine_syllables", None)
+
+    @staticmethod
+    def _timed_refine(rule: "PhonoRule", record: RuleProfile):
+        refine = type(rule).refine_syllables
+        def timed(syllables):
+            start = perf_counter()
+            try:
+                return refine(rule, syllables)
+            finally:
+                record.refine += perf_counter() - start
+        return timed
 
-            if self.log_steps and before != after:
-                word.log_step(rule.name, before, after)
+    def _reachability(self, inputs):
+        if inputs is None or not self.PRUNE_DEAD_RULES:
+            return None
+        from .reachability import Reachability
+        return Reachability(inputs)
 
+    @staticmethod
+    def _prune(rule: Rule, report) -> Rule | None:
+        """What runs in place of a rule: itself, its no-match effect, or nothing."""
+        if not report.dead or isinstance(rule, SyllabicRule):
+            return rule
+        if rule.no_match_effect is None:
+            return None
+        return NoMatchRule(rule)
 
     def evolve(self, rule_data_list: list):
         self.cluster_policies.clear()
-        for rule_data in rule_data_list:
+        index = self._index_for(self.words)
+        reach = self._reachability([w.to_string() for w in self.words])
+        self.profile_stats = []
+        self.rule_names = []
+        try:
+            for k, rule_data in enumerate(rule_data_list):
+                built = rule = self.build_rule(rule_data)
+                self.rule_names.append(built.name)
+                if reach is not None:
+                    rule = self._prune(rule, reach.visit(k, rule))
+                    if rule is None:
+                        if self.profile:    # keep one record per rule
+                            self.profile_stats.append(RuleProfile(k, built.name + " (dropped)", built.type))
+                        continue
+                self._rule_index = k
+                self.apply_rule(rule, index)
+        finally:
+            self._rule_index = None
+        self.analysis = reach.reports if reach is not None else []
+
+    # ===== BATCH MODE =====
+
+    def compile(self, rule_data_list: list, inputs=None, fuse: bool = True) -> list:
+        """
+        Build every rule up front. Returns (rule, cluster_policies) stages, where each
+        stage carries the cluster policies declared before it: the same view the rule
+        gets inside evolve(), and the rule's index in rule_data_list (Stage.index). Given the input IPA strings, rules that can never fire
+        on them are dropped or reduced to their no-match effect (self.analysis).
+        Unless histories are logged (or fuse=False, to keep one stage per rule), runs
+        of adjacent regrouping rules become one FusedRegroupRule.
+        """
+        self.cluster_policies.clear()
+        reach = self._reachability(inputs)
+        stages = []
+        self.rule_names = []
+        for k, rule_data in enumerate(rule_data_list):
             rule = self.build_rule(rule_data)
-            self.apply_rule(rule)
+            self.rule_names.append(rule.name)
+            if reach is not None:
+                rule = self._prune(rule, reach.visit(k, rule))
+                if rule is None:
+                    continue
+            stages.append(Stage(rule, list(self.cluster_policies), k))
+        self.analysis = reach.reports if reach is not None else []
+        if fuse and not self.log_steps:
+            stages = self._fuse(stages)
+        return stages
+
+    @staticmethod
+    def _fuse(stages: list) -> list:
+        fused, run = [], []
+        for stage in stages + [(None, None)]:
+            rule = stage[0]
+            if rule is not None and rule.no_match_effect == "regroup" and hasattr(rule, "scan"):
+                run.append(stage)
+                continue
+            if len(run) > 1:
+                fused.append((FusedRegroupRule([r for r, _ in run]), run[0][1]))
+            else:
+                fused.extend(run)
+            run = []
+            if rule is not None:
+                fused.append(stage)
+        return fused
+
+    def run_stages(self, stages: list, words, index: LexiconIndex | None = None) -> None:
+        """
+        Apply compiled stages, in order, to a list of Word objects. Pass a LexiconIndex
+        built over `words` to keep it across calls; long lists get one automatically.
+        """
+        if index is None:
+            index = self._index_for(words)
+        try:
+            for stage in stages:
+                rule, policies = stage
+                if isinstance(rule, PhonoRule):
+                    rule.cluster_policies = policies
+                self._rule_index = getattr(stage, "index", None)   # None for a fused run
+                self._apply_to(rule, words, index)
+        finally:
+            self._rule_index = None
+
+    def evolve_parallel(self, word_texts, rule_data_list: list, workers: int | None = None,
+                        chunk_size: int = 1000, histories: bool = False):
+        """
+        Process-pool version of evolve_batch. Distinct input forms are streamed to the
+        workers in chunks; every worker compiles the rules once and carries the current
+        weight function (set_weight_fn) and sonority scale. Results come back in input order.
+        workers=1 runs in-process.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            return self.evolve_batch(word_texts, rule_data_list, histories=histories)
+
+        word_texts = list(word_texts)
+        unique = list(dict.fromkeys(word_texts))
+        chunks = [unique[k:k + chunk_size] for k in range(0, len(unique), chunk_size)]
+
+        weight_fn = _WEIGHT_FN
+        try:
+            pickle.dumps(weight_fn)
+        except Exception:
+            # Forked workers inherit the module state; other start methods cannot.
+            if multiprocessing.get_start_method() != "fork":
+                raise ValueError("The registered weight function cannot be sent to worker "
+                                 "processes; register a picklable (module-level) function.")
+            weight_fn = _INHERIT_WEIGHT_FN
+
+        log_steps = self.log_steps or histories
+        results = {}
+        with multiprocessing.Pool(
+            processes=min(workers, len(chunks)) or 1,
+            initializer=_parallel_init,
+            initargs=(rule_data_list, weight_fn, _SCALE, log_steps,
+                      self.history_mode, self.history_sample),
+        ) as pool:
+            for chunk, out in zip(chunks, pool.imap(_parallel_run, chunks)):
+                results.update(zip(chunk, out))
+
+        forms = [results[text][0] for text in word_texts]
+        if histories:
+            return forms, [list(results[text][1]) for text in word_texts]
+        return forms
+
+    def evolve_batch(self, word_texts, rule_data_list: list, histories: bool = False,
+                     cache=None):
+        """
+        Evolve a whole lexicon and return the final forms in input order.
+
+        Identical input forms are evolved once and the result is shared. Nothing is
+        rendered between rules unless logging is on (log_steps, or histories=True,
+        which also returns one history list per input word). Output is identical to
+        running evolve() on the same words. self.words is left untouched.
 
+        With a ResultCache, forms already evolved under the same preset are reused
+        and the new ones are stored.
+        """
+        word_texts = list(word_texts)
+        log_steps = self.log_steps or histories
+        # the cache holds full histories: sampled or fired-only ones are not shared
+        if log_steps and (self.history_mode == "fired" or self.history_sample is not None):
+            cache = None
+        key = cache.key_for(rule_data_list) if cache is not None else None
+
+        results: dict[str, tuple] = {}
+        pending: dict[str, Word] = {}
+        for text in word_texts:
+            if text in results or text in pending:
+                continue
+            hit = cache.get(key, text, need_history=log_steps) if cache is not None else None
+            if hit is not None:
+                results[text] = hit
+            else:
+                pending[text] = Word(text)
 
+        if pending:
+            saved = self.log_steps
+            self.log_steps = log_steps
+            try:
+                self.run_stages(self.compile(rule_data_list, inputs=pending),
+                                list(pending.values()))
+            finally:
+                self.log_steps = saved
+
+            for text, word in pending.items():
+                form = word.to_string()
+                results[text] = (form, word.history)
+                if cache is not None:
+                    cache.put(key, text, form, word.history if log_steps else None)
+            if cache is not None:
+                cache.commit()
+
+        forms = [results[text][0] for text in word_texts]
+        if histories:
+            return forms, [list(results[text][1]) for text in word_texts]
+        return forms
 
     # Fields whose values are phoneme lists and should have group keywords expanded
     _EXPANDABLE = {
@@ -1092,18 +2034,27 @@ class EvolutionEngine:
 
         return base
 
+    @classmethod
+    def rule_key(cls, rule_data) -> tuple:
+        """Hashable identity of a rule's content (list or dict format)."""
+        data = rule_data if isinstance(rule_data, dict) else cls._list_to_dict(rule_data)
+        return tuple(sorted((k, repr(v)) for k, v in data.items()))
+
     def build_rule(self, rule_data) -> Rule:
         # Normalise to dict (supports both legacy list format and new dict format)
         data = rule_data if isinstance(rule_data, dict) else self._list_to_dict(rule_data)
 
-        rule_key = tuple(sorted((k, repr(v)) for k, v in data.items()))
+        rule_key = self.rule_key(data)
         if rule_key in self.rule_cache:
-            return self.rule_cache[rule_key]
+            rule = self.rule_cache[rule_key]
+            if isinstance(rule, ClusterPolicyRule):     # every build declares the policy
+                self.cluster_policies.append(rule)
+            return rule
 
         # Expand group keywords in phoneme-list fields
         rule_type = data["type"]
         expandable = self._EXPANDABLE.get(rule_type, [])
-        expanded = {k: (expand_group_keywords(v) if k in expandable else v)
+        expanded = {k: (expand_group_keywords(v, lazy=True) if k in expandable else v)
                     for k, v in data.items()}
 
         if rule_type == "ass":
@@ -1128,3 +2079,28 @@ class EvolutionEngine:
 
         self.rule_cache[rule_key] = rule
         return rule
+
+
+# ===== PARALLEL WORKERS =====
+# Per-process state for EvolutionEngine.evolve_parallel: rules are compiled once per worker.
+
+_INHERIT_WEIGHT_FN = "inherit"
+_WORKER_ENGINE: EvolutionEngine | None = None
+_WORKER_RULES: list = []
+
+def _parallel_init(rule_data_list, weight_fn, scale, log_steps,
+                   history_mode="full", history_sample=None):
+    global _WORKER_ENGINE, _WORKER_RULES
+    if weight_fn != _INHERIT_WEIGHT_FN:
+        set_weight_fn(weight_fn)
+    set_sonority_scale(scale)
+    _WORKER_ENGINE = EvolutionEngine([], log_steps=log_steps, history_mode=history_mode,
+                                     history_sample=history_sample)
+    _WORKER_RULES = rule_data_list
+    _WORKER_ENGINE.compile(rule_data_list)
+
+def _parallel_run(chunk):
+    words = [Word(text) for text in chunk]
+    # rules are built once (rule_cache); only the dead-rule pruning is per chunk
+    _WORKER_ENGINE.run_stages(_WORKER_ENGINE.compile(_WORKER_RULES, inputs=chunk), words)
+    return [(word.to_string(), word.history) for word in words]
@@ -0,0 +1,97 @@
+# incremental.py
+"""
+Incremental re-evolution of a fixed lexicon while a preset is being edited.
+
+Every run checkpoints each word after each rule, but only where the word's state
+actually changed. When the rule list is edited, the next run finds the first rule
+that differs (position k), puts every word back to its state after rule k-1 and
+only applies rules k onwards. Output and histories are identical to a full
+EvolutionEngine.evolve() over the same words.
+"""
+
+from bisect import bisect_left
+
+from . import evolver
+from .evolver import EvolutionEngine, Word
+
+
+class IncrementalEvolution:
+    def __init__(self, word_texts: list, log_steps: bool = False):
+        self.word_texts = list(word_texts)
+        self.log_steps = log_steps
+        self.words: list[Word] = []
+        self.resumed_from = 0       # first rule index applied by the last evolve()
+        self._keys: list = []       # rule keys of the last run
+        self._env = None
+        # per word: rule indices and (state, history length) after each changing rule
+        self._steps: list[list[int]] = []
+        self._states: list[list[tuple]] = []
+
+    def _environment(self):
+        # Tokenizer inventory/mode, weight function and sonority scale change every result.
+        tok = evolver._TOK
+        return (id(tok), tok.version, tok.strict_compounds, evolver._WEIGHT_FN, evolver._SCALE)
+
+    def reset(self) -> None:
+        """Drop all checkpoints; the next evolve() starts from the first rule."""
+        self.words = []
+        self._keys = []
+        self._env = None
+        self._steps = []
+        self._states = []
+
+    def evolve(self, rule_data_list: list) -> list[str]:
+        """Evolve the lexicon through rule_data_list, reusing the previous run's prefix."""
+        keys = [EvolutionEngine.rule_key(r) for r in rule_data_list]
+        env = self._environment()
+        if env != self._env or not self.words:
+            self.reset()
+            self._env = env
+
+        k = 0
+        while k < min(len(keys), len(self._keys)) and keys[k] == self._keys[k]:
+            k += 1
+        self._rewind(k)
+
+        engine = EvolutionEngine([], log_steps=self.log_steps)
+        stages = engine.compile(rule_data_list, fuse=False)   # one stage per rule
+        words = self.words
+        index = engine._index_for(words)
+        prev = [w.snapshot() for w in words]
+        try:
+            for r in range(k, len(stages)):
+                engine.run_stages(stages[r:r + 1], words, index)
+                for i, word in enumerate(words):
+                    state = word.snapshot()
+                    if state != prev[i]:
+                        prev[i] = state
+                        self._steps[i].append(r)
+                        self._states[i].append((state, len(word.history)))
+        except Exception:
+            # Part-applied rules leave no usable checkpoints.
+            self.reset()
+            raise
+
+        self._keys = keys
+        self.resumed_from = k
+        return [w.to_string() for w in words]
+
+    def _rewind(self, k: int) -> None:
+        """Put every word back to its state after rule k-1."""
+        if not self.words:
+            self.words = [Word(text) for text in self.word_texts]
+            self._steps = [[] for _ in self.word_texts]
+            self._states = [[] for _ in self.word_texts]
+            return
+
+        for i, text in enumerate(self.word_texts):
+            cut = bisect_left(self._steps[i], k)
+            del self._steps[i][cut:]
+            del self._states[i][cut:]
+            word = self.words[i]
+            if cut:
+                state, history_len = self._states[i][cut - 1]
+                word.restore(state)
+                del word.history[history_len:]
+            else:
+                self.words[i] = Word(text)
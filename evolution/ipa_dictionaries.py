@@ -1,3 +1,7 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from types import MappingProxyType
+
 _COMBINING_TILDE = "̃"
 _VOWEL_CHARS = set("aeiouyɯɨʉɪʊʏɛɔæœøɐəɞɜʌɑɒ")
 
@@ -373,13 +377,64 @@ if not IPA_GROUPS["Vocoids"]:
     ))
 
 
-__all__ = ["IPA_GROUPS", "expand_group_keywords", "validate_ipa_groups", "tokens_for"]
+__all__ = ["IPA_GROUPS", "expand_group_keywords", "validate_ipa_groups", "tokens_for",
+           "GroupPattern", "ExpandedList", "PhonemeInventory", "INVENTORY"]
+
+
+class PhonemeInventory:
+    """
+    Frozen snapshot of a group table. Every known token gets an integer ID and a
+    bitmask of its groups (bit k is groups[k]), so a membership test is one dict
+    lookup and an AND however many groups are combined. members() hands hot loops
+    a cached frozenset per mask.
+    """
+    __slots__ = ("groups", "tokens", "ids", "masks", "_bits", "_members")
+
+    def __init__(self, groups: dict):
+        self.groups = tuple(groups)
+        self._bits = MappingProxyType({name: 1 << k for k, name in enumerate(self.groups)})
+        masks = {}
+        for name, members in groups.items():
+            bit = self._bits[name]
+            for tok in members:
+                masks[tok] = masks.get(tok, 0) | bit
+        self.tokens = tuple(masks)                                  # ID -> token
+        self.ids = MappingProxyType({tok: i for i, tok in enumerate(self.tokens)})
+        self.masks = MappingProxyType(masks)                        # token -> mask
+        self._members = {}
+
+    def group_mask(self, *names: str) -> int:
+        """OR of the bits of the named groups (unknown names add nothing)."""
+        mask = 0
+        for name in names:
+            mask |= self._bits.get(name, 0)
+        return mask
+
+    def id_of(self, token: str) -> int:
+        """Integer ID of a token, -1 if no group lists it."""
+        return self.ids.get(token, -1)
+
+    def mask_of(self, token: str) -> int:
+        return self.masks.get(token, 0)
+
+    def in_groups(self, token: str, *names: str) -> bool:
+        return bool(self.masks.get(token, 0) & self.group_mask(*names))
+
+    def members(self, *names: str) -> frozenset:
+        """Tokens in any of the named groups, cached per mask."""
+        mask = self.group_mask(*names)
+        found = self._members.get(mask)
+        if found is None:
+            found = self._members[mask] = frozenset(
+                tok for tok, m in self.masks.items() if m & mask)
+        return found
+
+
+# Built once, after the derived groups above are filled in.
+INVENTORY = PhonemeInventory(IPA_GROUPS)
 
 def tokens_for(*group_names: str) -> set[str]:
-    out: set[str] = set()
-    for g in group_names:
-        out.update(IPA_GROUPS.get(g, []))
-    return out
+    return set(INVENTORY.members(*group_names))
 
 def validate_ipa_groups(strict: bool = False) -> None:
     """
@@ -418,9 +473,169 @@ def validate_ipa_groups(strict: bool = False) -> None:
         if dups:
             warn(f"Group '{name}' has duplicates: {sorted(dups)}")
 
-def expand_group_keywords(data):
+class GroupPattern:
+    """
+    A *GroupA+GroupB keyword kept symbolic: every string made of one member of each
+    group in turn. len(), indexing and iteration give exactly the list
+    itertools.product would build, but membership is a split of the string into
+    group members, so no cost depends on the product of the group sizes.
+    """
+    __slots__ = ("keyword", "groups", "min_len", "max_len", "_members", "_lengths",
+                 "_strides", "_size", "_memo")
+
+    def __init__(self, keyword: str, groups: list):
+        self.keyword = keyword
+        self.groups = tuple(tuple(g) for g in groups)
+        self._members = []                  # per group: member -> its indices
+        for g in self.groups:
+            members = {}
+            for k, m in enumerate(g):
+                members.setdefault(m, []).append(k)
+            self._members.append(members)
+        self._lengths = [sorted({len(m) for m in g}) for g in self.groups]
+        self.min_len = sum(min(ls, default=0) for ls in self._lengths)
+        self.max_len = sum(max(ls, default=0) for ls in self._lengths)
+
+        self._strides = []
+        size = 1
+        for g in reversed(self.groups):
+            self._strides.append(size)
+            size *= len(g)
+        self._strides.reverse()
+        self._size = size
+        self._memo = {}
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(self._size))]
+        if k < 0:
+            k += self._size
+        if not 0 <= k < self._size:
+            raise IndexError("GroupPattern index out of range")
+        parts = []
+        for g, stride in zip(self.groups, self._strides):
+            digit, k = divmod(k, stride)
+            parts.append(g[digit])
+        return "".join(parts)
+
+    def __iter__(self):
+        from itertools import product
+        return ("".join(p) for p in product(*self.groups))
+
+    def __contains__(self, s):
+        return bool(self.indices(s))
+
+    def indices(self, s) -> tuple:
+        """Sorted positions of s in the expanded list (several if groups overlap)."""
+        if not isinstance(s, str) or not self.min_len <= len(s) <= self.max_len:
+            return ()
+        hit = self._memo.get(s)
+        if hit is None:
+            out = []
+            last = len(self.groups)
+
+            def walk(p, pos, base):
+                if p == last:
+                    if pos == len(s):
+                        out.append(base)
+                    return
+                for length in self._lengths[p]:
+                    for k in self._members[p].get(s[pos:pos + length], ()):
+                        walk(p + 1, pos + length, base + k * self._strides[p])
+
+            walk(0, 0, 0)
+            if len(self._memo) >= 4096:
+                self._memo.clear()
+            hit = self._memo[s] = tuple(sorted(out))
+        return hit
+
+    def __repr__(self):
+        return f"GroupPattern({self.keyword!r})"
+
+
+class ExpandedList(Sequence):
+    """
+    A rule field after lazy expansion: plain items as they were, every *GroupA+GroupB
+    keyword as a GroupPattern. Indexing, len() and iteration match the fully
+    expanded list; literals() and patterns() let the matcher treat the two apart.
+    """
+    __slots__ = ("_parts", "_starts", "_len")
+
+    def __init__(self, segments: list):
+        self._parts = []                    # (offset, list of plain items | GroupPattern)
+        offset = 0
+        for seg in segments:
+            if isinstance(seg, GroupPattern):
+                self._parts.append((offset, seg))
+                offset += len(seg)
+                continue
+            if not self._parts or isinstance(self._parts[-1][1], GroupPattern):
+                self._parts.append((offset, []))
+            self._parts[-1][1].append(seg)
+            offset += 1
+        self._starts = [off for off, _ in self._parts]
+        self._len = offset
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(self._len))]
+        if k < 0:
+            k += self._len
+        if not 0 <= k < self._len:
+            raise IndexError("list index out of range")
+        off, seg = self._parts[bisect_right(self._starts, k) - 1]
+        return seg[k - off]
+
+    def __iter__(self):
+        for _, seg in self._parts:
+            yield from seg
+
+    def __contains__(self, value):
+        return any(value in seg for _, seg in self._parts)
+
+    def index(self, value, start=0, stop=None):
+        """First position of value, as list.index on the expanded list."""
+        stop = self._len if stop is None else stop
+        for off, seg in self._parts:
+            if isinstance(seg, GroupPattern):
+                hits = seg.indices(value)
+            else:
+                hits = [n for n, item in enumerate(seg) if item == value]
+            for n in hits:
+                if start <= off + n < stop:
+                    return off + n
+        raise ValueError(f"{value!r} is not in list")
+
+    def literals(self):
+        """(index, item) for every plain item."""
+        for off, seg in self._parts:
+            if not isinstance(seg, GroupPattern):
+                for n, item in enumerate(seg):
+                    yield off + n, item
+
+    def patterns(self):
+        """(index of first expansion, GroupPattern) for every symbolic keyword."""
+        return [(off, seg) for off, seg in self._parts if isinstance(seg, GroupPattern)]
+
+    def __repr__(self):
+        items = []
+        for _, seg in self._parts:
+            items.extend([seg] if isinstance(seg, GroupPattern) else seg)
+        return f"ExpandedList({items!r})"
+
+
+def expand_group_keywords(data, lazy: bool = False):
     """
     Expands *Group or *GroupA+GroupB keywords into IPA group values or cross-products.
+
+    With lazy=True a *GroupA+GroupB keyword stays a GroupPattern and a list holding
+    one comes back as an ExpandedList; single groups are still expanded in place.
     """
     def expand_token(token):
         if not token.startswith("*"):
@@ -439,6 +654,9 @@ def expand_group_keywords(data):
                 return [token]  # Return original if unknown
             group_lists.append(group)
 
+        if lazy and len(group_lists) > 1:
+            return [GroupPattern(token, group_lists)]
+
         # Compute Cartesian product
         from itertools import product
         return [''.join(p) for p in product(*group_lists)]
@@ -449,9 +667,11 @@ def expand_group_keywords(data):
             if isinstance(item, str):
                 result.extend(expand_token(item))
             elif isinstance(item, list):
-                result.append(expand_group_keywords(item))
+                result.append(expand_group_keywords(item, lazy))
             else:
                 result.append(item)
+        if any(isinstance(item, GroupPattern) for item in result):
+            return ExpandedList(result)
         return result
     return data
 
@@ -0,0 +1,134 @@
+# lexicon.py
+"""
+A struct-of-arrays lexicon for holding millions of words in one process.
+
+    lex = Lexicon(ipa_words)                    # or Lexicon.from_words(words)
+    word = lex[17]                              # a fresh Word, as Word(ipa_words[17])
+    out = lex.evolve(rules)                     # a new Lexicon, originals kept
+    forms = out.strings()
+
+Instead of a Word with a list of Syllable objects per entry, every word is a run
+of syllables and every syllable a run of token ids, all kept in flat arrays:
+
+    phonemes    token table: id → token string (each token stored once)
+    tokens      token ids of every syllable, back to back
+    syll_ends   per syllable: end offset in tokens
+    stress      per syllable: 1 if stressed
+    word_ends   per word: end offset in syll_ends
+    originals   per word: the input form (interned), unless originals=False
+
+Words come back as ordinary Word objects, with the token tuples shared through
+the tokenization cache, so rules and callers see the usual API. syn_func is not
+stored; every word comes back with the default.
+"""
+
+import sys
+from array import array
+
+from .evolver import EvolutionEngine, Word, _tokens
+
+
+class Lexicon:
+    def __init__(self, texts=(), originals: bool = True):
+        """texts: dotted, stressed IPA words. originals=False drops the input forms."""
+        self.phonemes: list[str] = []
+        self._ids: dict[str, int] = {}
+        self.tokens = array("I")
+        self.syll_ends = array("I")
+        self.stress = bytearray()
+        self.word_ends = array("I")
+        self.originals: list[str] | None = [] if originals else None
+        self.extend(texts)
+
+    @classmethod
+    def from_words(cls, words, originals: bool = True) -> "Lexicon":
+        lex = cls(originals=originals)
+        for word in words:
+            lex.append_word(word)
+        return lex
+
+    # ----- building -----
+
+    def append(self, text: str) -> None:
+        self.append_word(Word(text))
+
+    def extend(self, texts) -> None:
+        for text in texts:
+            self.append(text)
+
+    def append_word(self, word: Word, original: str | None = None) -> None:
+        """Store a word's current form, under `original` (default: word.original)."""
+        ids, table = self._ids, self.phonemes
+        for syll in word.syllables:
+            for token in syll.tokens:
+                k = ids.get(token)
+                if k is None:
+                    k = ids[token] = len(table)
+                    table.append(token)
+                self.tokens.append(k)
+            self.syll_ends.append(len(self.tokens))
+            self.stress.append(1 if syll.stressed else 0)
+        self.word_ends.append(len(self.syll_ends))
+        if self.originals is not None:
+            self.originals.append(sys.intern(word.original if original is None else original))
+
+    # ----- reading -----
+
+    def __len__(self):
+        return len(self.word_ends)
+
+    def snapshot(self, i: int) -> tuple:
+        """Word i as a Word.snapshot() state."""
+        if i < 0:
+            i += len(self)
+        first = self.word_ends[i - 1] if i else 0
+        start = self.syll_ends[first - 1] if first else 0
+        table, tokens, stress = self.phonemes, self.tokens, self.stress
+        state = []
+        for s in range(first, self.word_ends[i]):
+            end = self.syll_ends[s]
+            # back through the tokenization cache, so equal syllables share one tuple
+            state.append((_tokens("".join([table[t] for t in tokens[start:end]])), bool(stress[s])))
+            start = end
+        return tuple(state)
+
+    def to_string(self, i: int) -> str:
+        return ".".join(("ˈ" if stressed else "") + "".join(toks) for toks, stressed in self.snapshot(i))
+
+    def __getitem__(self, i: int) -> Word:
+        word = Word.__new__(Word)
+        word.restore(self.snapshot(i))
+        word.original = self.originals[i] if self.originals is not None else self.to_string(i)
+        word.syn_func = "v"
+        word.history = None
+        return word
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def strings(self) -> list[str]:
+        return [self.to_string(i) for i in range(len(self))]
+
+    def nbytes(self) -> int:
+        """Bytes held by the arrays (not the token table or the original strings)."""
+        return sum(a.itemsize * len(a) for a in (self.tokens, self.syll_ends, self.word_ends)) + len(self.stress)
+
+    # ----- evolution -----
+
+    def evolve(self, rule_data_list: list, engine: EvolutionEngine | None = None,
+               chunk_size: int = 10000) -> "Lexicon":
+        """
+        Evolve every word through rule_data_list, chunk_size Word objects at a time,
+        into a new Lexicon (same originals). Forms are those EvolutionEngine.evolve()
+        gives; rules are built once and only the dead-rule pruning is per chunk.
+        """
+        engine = engine or EvolutionEngine([])
+        out = Lexicon(originals=self.originals is not None)
+        for k in range(0, len(self), chunk_size):
+            words = [self[i] for i in range(k, min(k + chunk_size, len(self)))]
+            stages = engine.compile(rule_data_list, inputs=[w.to_string() for w in words])
+            engine.run_stages(stages, words)
+            for word in words:
+                out.append_word(word)
+        return out
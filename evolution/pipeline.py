@@ -0,0 +1,146 @@
+# pipeline.py
+"""
+Headless streaming pipeline: orthography → IPA → evolution → orthography.
+
+Every stage is a generator over lines, where a line is a list of words, so a
+corpus of any size runs in bounded memory:
+
+    lines = read_lines("corpus.txt")
+    ipa = phonologize(lines, PhonoLatin())
+    evolved = evolve(ipa, rules)
+    for words in transcribe(evolved, Orthographer(mapping)):
+        ...
+
+The evolution stage compiles the rules once and evolves `batch_lines` lines at a
+time, so the work per line stays the same no matter how long the input is. Rules
+that can never fire on a batch are dropped for that batch.
+
+A word that fails to convert or evolve comes out as "?" (ERROR_MARK), with a
+warning on stderr, and the stream goes on; later stages pass the mark through.
+"""
+
+import re
+import sys
+from itertools import islice, tee
+from typing import Iterable, Iterator, TextIO
+
+from .evolver import EvolutionEngine, Word
+from .orthographer import Orthographer
+
+# Same clean-up as the main window: dashes split words, punctuation is dropped.
+_DASHES = str.maketrans({"‑": " ", "–": " ", "—": " ", "-": " "})
+_PUNCT = re.compile(r"[.,;:!?()\[\]{}\"'…]")
+
+# Stands in for a word a stage could not handle (cleaned input never contains it).
+ERROR_MARK = "?"
+
+
+def _warn(stage: str, word: str, error: Exception) -> None:
+    print(f"[Warning] Could not {stage} '{word}': {type(error).__name__}: {error}", file=sys.stderr)
+
+
+def clean_line(line: str) -> list[str]:
+    """Normalize one line of running text into lowercase words."""
+    return _PUNCT.sub("", line.translate(_DASHES)).lower().split()
+
+
+def read_lines(source: str | TextIO) -> Iterator[list[str]]:
+    """Yield the cleaned words of each line of a path or open text file."""
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as fh:
+            yield from read_lines(fh)
+        return
+    for line in source:
+        yield clean_line(line)
+
+
+def phonologize(lines: Iterable[list[str]], phono) -> Iterator[list[str]]:
+    """Convert each word to IPA with a Phonologizer (anything with .to_ipa)."""
+    for words in lines:
+        out = []
+        for w in words:
+            try:
+                out.append(phono.to_ipa(w))
+            except Exception as e:
+                _warn("convert", w, e)
+                out.append(ERROR_MARK)
+        yield out
+
+
+def evolve(lines: Iterable[list[str]], rule_data_list: list,
+           batch_lines: int = 256, cache=None) -> Iterator[list[str]]:
+    """
+    Evolve IPA lines through a rule list. Rules are compiled once; lines are
+    evolved in batches of `batch_lines`, sharing the work for repeated forms.
+    An optional ResultCache skips forms evolved under this preset before.
+    """
+    engine = EvolutionEngine([])
+    engine.compile(rule_data_list)
+    key = cache.key_for(rule_data_list) if cache is not None else None
+    lines = iter(lines)
+
+    while True:
+        batch = list(islice(lines, batch_lines))
+        if not batch:
+            return
+
+        forms = {ERROR_MARK: ERROR_MARK}
+        unique = {}
+        for text in (t for words in batch for t in words):
+            if text in forms or text in unique:
+                continue
+            hit = cache.get(key, text) if cache is not None else None
+            if hit is not None:
+                forms[text] = hit[0]
+            else:
+                unique[text] = Word(text)
+
+        # rules are built once (rule_cache); dead-rule pruning follows each batch
+        stages = engine.compile(rule_data_list, inputs=unique)
+        try:
+            engine.run_stages(stages, list(unique.values()))
+        except Exception:
+            # find the words that fail and run the rest one by one
+            for text in unique:
+                word = unique[text] = Word(text)
+                try:
+                    engine.run_stages(stages, [word])
+                except Exception as e:
+                    _warn("evolve", text, e)
+                    unique[text] = None
+                    forms[text] = ERROR_MARK
+        for text, word in unique.items():
+            if word is None:
+                continue
+            forms[text] = word.to_string()
+            if cache is not None:
+                cache.put(key, text, forms[text])
+        if cache is not None:
+            cache.commit()
+
+        for words in batch:
+            yield [forms[text] for text in words]
+
+
+def transcribe(lines: Iterable[list[str]], orthographer: Orthographer) -> Iterator[list[str]]:
+    """Spell each evolved IPA word with an orthography preset."""
+    for words in lines:
+        yield [w if w == ERROR_MARK else orthographer.transcribe(w) for w in words]
+
+
+def run_pipeline(source: str | TextIO, phono, rule_data_list: list,
+                 orthographer: Orthographer | None = None,
+                 batch_lines: int = 256, cache=None) -> Iterator[tuple[str, str]]:
+    """
+    Full chain over a text source. Yields one (ipa, orthography) pair of
+    space-joined strings per input line; orthography is "" without a preset.
+    """
+    evolved = evolve(phonologize(read_lines(source), phono), rule_data_list, batch_lines, cache)
+    if orthographer is None:
+        for words in evolved:
+            yield " ".join(words), ""
+        return
+
+    ipa, spelled = tee(evolved)
+    for words, ortho in zip(ipa, transcribe(spelled, orthographer)):
+        yield " ".join(words), " ".join(ortho)
@@ -0,0 +1,72 @@
+# presets.py
+"""
+Presets, orthographies and base languages as the headless tools in scripts/ load
+them: rule lists from presets/presets.db, orthography maps from
+presets/orthographies.db and base languages from core/ (PhonoLatin, ...).
+"""
+
+import importlib
+import json
+import os
+import sqlite3
+
+from .orthographer import Orthographer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DB_PATH       = os.path.join(ROOT, "presets", "presets.db")
+ORTHO_DB_PATH = os.path.join(ROOT, "presets", "orthographies.db")
+OVER_PATH     = os.path.join(ROOT, "data", "latin_stress_overrides.json")
+
+
+def load_base_language(name: str):
+    """The Phono<Name> class of core/<name>.py, with the Latin stress overrides."""
+    name = name.lower()
+    module = importlib.import_module(f"core.{name}")
+    cls = getattr(module, f"Phono{name.capitalize()}")
+    return cls(override_path=OVER_PATH)
+
+
+def load_rules(preset_name: str, db_path: str = DB_PATH) -> list:
+    """A preset's rules in order ([] if there is no such preset)."""
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT rule FROM presets WHERE preset_name = ? ORDER BY rule_order",
+            (preset_name,)
+        )
+        return [json.loads(r[0]) for r in cur.fetchall()]
+
+
+def load_presets(names=None, db_path: str = DB_PATH) -> dict:
+    """{preset name: rules} for the named presets, or all of them."""
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT preset_name, rule FROM presets ORDER BY preset_name, rule_order")
+        presets = {}
+        for name, rule in cur.fetchall():
+            presets.setdefault(name, []).append(json.loads(rule))
+    if names:
+        missing = [n for n in names if n not in presets]
+        if missing:
+            raise ValueError(f"Preset(s) not found: {', '.join(missing)}")
+        presets = {n: presets[n] for n in names}
+    return presets
+
+
+def load_orthographer(name: str, db_path: str = ORTHO_DB_PATH) -> Orthographer | None:
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT data FROM orth_presets WHERE name = ?", (name,))
+        row = cur.fetchone()
+    if not row:
+        return None
+    return Orthographer(json.loads(row[0]).get("map", []) or [])
+
+
+def load_orthographers(db_path: str = ORTHO_DB_PATH) -> dict:
+    """{name: Orthographer} for every orthography preset."""
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT name, data FROM orth_presets")
+        return {name: Orthographer(json.loads(data).get("map", []) or []) for name, data in cur.fetchall()}
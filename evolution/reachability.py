@@ -0,0 +1,207 @@
+# reachability.py
+"""
+Static dead-rule analysis of an ordered rule list.
+
+Starting from the characters that can occur in the input (the words about to be
+evolved, or a base language's IPA map), each rule is checked in order: can any
+of its targets, and every trigger context it requires, still occur at this
+point? If not, the rule can never change a word. Otherwise the characters it
+can write are added for the rules after it.
+
+Reachability is tracked per character rather than per token or n-gram, because
+syllables are re-tokenized after every rule (deleting a consonant between a and
+i can create the token "ai"): a token is reachable only if all its characters
+are. That is coarser than tracking tokens, but it is never wrong, so
+EvolutionEngine can drop what it finds without changing any output.
+
+Only the match can be dropped. Contextual and deletion rules resyllabify every
+word and (dis)contiguous assimilation regroups syllables even when nothing
+matches, so a dead rule of those types becomes a NoMatchRule carrying that
+effect; a dead epenthesis rule disappears; dead syllabic rules and stress and
+cluster rules are always kept.
+"""
+
+from dataclasses import dataclass, field
+
+from .ipa_dictionaries import ExpandedList, GroupPattern
+from .evolver import (AssimilationRule, ContextualRule, DeletionRule, DiscontiguousRule,
+                      EpentheticRule, NoMatchRule, SyllabicRule, _tokens)
+
+
+@dataclass
+class RuleReport:
+    index: int                      # position in the rule list
+    name: str
+    type: str
+    dead: bool = False              # can never change a word
+    reason: str = ""
+    dead_contexts: list = field(default_factory=list)   # context fields that can never match
+
+
+class Reachability:
+    """Walks a rule list in order, tracking the characters that can occur."""
+
+    def __init__(self, inputs):
+        chars = {"."}
+        for text in inputs:
+            chars.update(text)
+        self.chars = chars
+        self.reports: list[RuleReport] = []
+
+    # ----- reachability of rule fields -----
+
+    def reachable(self, item) -> bool:
+        """Can this field entry (string or *GroupA+GroupB pattern) occur?"""
+        if isinstance(item, GroupPattern):
+            return all(any(self._spelled(m) for m in g) for g in item.groups)
+        return isinstance(item, str) and self._spelled(item)
+
+    def _spelled(self, text: str) -> bool:
+        return self.chars.issuperset(text)
+
+    def _entries(self, seq):
+        """(index range, entry) for each entry of a rule field."""
+        if isinstance(seq, ExpandedList):
+            for k, item in seq.literals():
+                yield range(k, k + 1), item
+            for off, pattern in seq.patterns():
+                yield range(off, off + len(pattern)), pattern
+        else:
+            for k, item in enumerate(seq):
+                yield range(k, k + 1), item
+
+    def _live(self, seq) -> list:
+        """Index ranges of the entries of a field that can occur."""
+        return [span for span, item in self._entries(seq) if self.reachable(item)]
+
+    def _context_live(self, seq, honor_blank: bool) -> bool:
+        if not seq:
+            return True             # no constraint
+        for _, item in self._entries(seq):
+            if honor_blank and item == "*Blank":
+                return True
+            if isinstance(item, str) and not _tokens(item):
+                return True         # empty entry matches everywhere
+            if self.reachable(item):
+                return True
+        return False
+
+    def _write(self, seq, spans) -> None:
+        """Add the characters of the entries of `seq` at the given index ranges."""
+        for span in spans:
+            if len(span) > 64:          # a whole symbolic pattern: take every member
+                self._write_all(seq)
+                return
+            for k in span:
+                if k < len(seq) and isinstance(seq[k], str):
+                    self.chars.update(seq[k])
+
+    def _write_all(self, seq) -> None:
+        for _, item in self._entries(seq):
+            if isinstance(item, GroupPattern):
+                for g in item.groups:
+                    for m in g:
+                        self.chars.update(m)
+            elif isinstance(item, str):
+                self.chars.update(item)
+
+    # ----- rules -----
+
+    def visit(self, index: int, rule) -> RuleReport:
+        """Check one rule against what can occur so far, then record what it can write."""
+        report = RuleReport(index, rule.name, rule.type)
+        if isinstance(rule, SyllabicRule):
+            self._contextual(rule._adapter, report, ("pre_list", "post_list"), ())
+        elif isinstance(rule, ContextualRule):
+            self._contextual(rule, report, ("pre_trig", "post_trig"), ("pre_ex", "post_ex"))
+        elif isinstance(rule, DeletionRule):
+            self._contexts(rule, report, (("pre_list", rule.pre_list), ("post_list", rule.post_list)),
+                           (("except_pre", rule.except_pre), ("except_post", rule.except_post)))
+            if not self._live(rule.del_list):
+                report.dead, report.reason = True, "no deletable segment can occur"
+        elif isinstance(rule, (AssimilationRule, DiscontiguousRule)):
+            live = self._live(rule.targets)
+            if not live:
+                report.dead, report.reason = True, "no target can occur"
+            elif not self._live(rule.triggers):
+                report.dead, report.reason = True, "no trigger can occur"
+                report.dead_contexts.append("triggers")
+            else:
+                self._write_replacements(rule.targets, rule.replace, live)
+        elif isinstance(rule, EpentheticRule):
+            live = self._live(rule.find_list)
+            for name in ("pre_list", "post_list"):
+                seq = getattr(rule, name)
+                if seq and not self._live(seq):
+                    report.dead_contexts.append(name)
+            if not live:
+                report.dead, report.reason = True, "no target can occur"
+            elif report.dead_contexts:
+                report.dead, report.reason = True, "a required neighbour can never occur"
+            else:
+                self._write_replacements(rule.find_list, rule.replace_list, live)
+        self.reports.append(report)
+        return report
+
+    def _contexts(self, rule, report, triggers, exceptions) -> None:
+        for name, seq in triggers:
+            if not self._context_live(seq, honor_blank=True):
+                report.dead_contexts.append(name)
+                report.dead, report.reason = True, f"{name} can never match"
+        for name, seq in exceptions:
+            if seq and not self._context_live(seq, honor_blank=False):
+                report.dead_contexts.append(name)
+
+    def _contextual(self, rule, report, trig_names, ex_names) -> None:
+        self._contexts(rule, report,
+                       [(n, getattr(rule, k)) for n, k in zip(trig_names, ("pre_trig", "post_trig"))],
+                       [(n, getattr(rule, n)) for n in ex_names])
+        live = [span for span, item in self._entries(rule.old_list)
+                if self.reachable(item) and (not isinstance(item, str) or "." not in _tokens(item))]
+        if not live:
+            report.dead, report.reason = True, "no target can occur"
+        if not report.dead:
+            self._write(rule.new_list, live)
+
+    def _write_replacements(self, targets, replace, live) -> None:
+        # A token takes the replacement at its first position in the target list,
+        # which is always within the first live range holding it.
+        if isinstance(targets, ExpandedList) or isinstance(replace, ExpandedList):
+            self._write_all(replace)
+        else:
+            self._write(replace, live)
+
+
+def analyze(rule_data_list: list, inputs, engine=None) -> list[RuleReport]:
+    """Reports for every rule of a list, given the IPA strings that can be input."""
+    from .evolver import EvolutionEngine
+    engine = engine or EvolutionEngine([])
+    reach = Reachability(inputs)
+    for k, rule_data in enumerate(rule_data_list):
+        reach.visit(k, engine.build_rule(rule_data))
+    return reach.reports
+
+
+def base_inventory(phono) -> list[str]:
+    """
+    IPA strings a base language can output: its IPA map plus any vowel, diphthong
+    or unit inventories it declares. An estimate (spelling rules can add symbols);
+    the engine itself only prunes against the words it is given.
+    """
+    out = list(getattr(phono, "ipa_map", {}).values())
+    for attr in ("vowels", "diphthongs", "ipa_units", "legal_compounds"):
+        out.extend(x for x in getattr(phono, attr, ()) or () if isinstance(x, str))
+    return out
+
+
+def format_report(reports: list[RuleReport]) -> str:
+    lines = []
+    for r in reports:
+        if r.dead:
+            lines.append(f"{r.index:>4}  DEAD  [{r.type}] {r.name}: {r.reason}")
+        elif r.dead_contexts:
+            lines.append(f"{r.index:>4}  ctx   [{r.type}] {r.name}: "
+                         f"{', '.join(r.dead_contexts)} can never match")
+    dead = sum(r.dead for r in reports)
+    lines.append(f"{dead} of {len(reports)} rules can never fire.")
+    return "\n".join(lines)
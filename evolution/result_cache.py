@@ -0,0 +1,168 @@
+# result_cache.py
+"""
+Word-level memo of evolution results across EvolutionEngine runs.
+
+Entries map (preset key, input IPA) to (evolved form, history). The preset key is
+a content hash of the normalized rule list plus the engine state that changes
+results (tokenizer inventory/mode, weight function and sonority scale) and the
+source of the evolution package, so editing any rule, switching base language
+or changing the engine code simply misses the old entries.
+
+The in-memory tier is an LRU of `maxsize` words. Give a `path` to add a SQLite
+tier (e.g. next to presets.db) that survives restarts; it keeps at most
+`max_rows` rows, dropping the least recently used first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+
+from . import evolver
+
+# Bump to drop stored entries for reasons the source fingerprint does not see.
+CACHE_VERSION = 1
+
+
+def _source_fingerprint() -> str:
+    """Hash of every module of the evolution package, so engine edits miss old entries."""
+    h = hashlib.sha256()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(folder)):
+        if name.endswith(".py"):
+            h.update(name.encode("utf-8"))
+            with open(os.path.join(folder, name), "rb") as fh:
+                h.update(fh.read())
+    return h.hexdigest()
+
+ENGINE_FINGERPRINT = _source_fingerprint()
+
+
+def _weight_fn_name(fn) -> str:
+    if fn is None:
+        return ""
+    owner = getattr(fn, "__self__", None)
+    prefix = f"{type(owner).__module__}.{type(owner).__qualname__}." if owner is not None else ""
+    return prefix + getattr(fn, "__qualname__", repr(fn))
+
+
+def preset_key(rule_data_list: list) -> str:
+    """Content hash of a rule list together with the current engine configuration."""
+    rules = [r if isinstance(r, dict) else evolver.EvolutionEngine._list_to_dict(r)
+             for r in rule_data_list]
+    tok = evolver._TOK
+    state = {
+        "version": CACHE_VERSION,
+        "engine": ENGINE_FINGERPRINT,
+        "rules": rules,
+        "units": sorted(tok.units),        # tok.units is ordered by length only
+        "strict": tok.strict_compounds,
+        "legal_units": sorted(tok.legal_units or []),
+        "legal_compounds": sorted(tok.legal_compounds or []),
+        "weight_fn": _weight_fn_name(evolver._WEIGHT_FN),
+        "sonority": evolver._SCALE.fingerprint(),
+    }
+    blob = json.dumps(state, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory, optional SQLite) cache of evolved forms and histories."""
+
+    def __init__(self, maxsize: int = 65536, path: str | None = None, max_rows: int = 1_000_000):
+        self.maxsize = maxsize
+        self.max_rows = max_rows
+        self._mem: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._tick = 0
+        if path:
+            self._conn = sqlite3.connect(path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " preset_key TEXT, word TEXT, form TEXT, history TEXT, used INTEGER,"
+                " PRIMARY KEY (preset_key, word))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_used ON results(used)")
+            row = self._conn.execute("SELECT MAX(used) FROM results").fetchone()
+            self._tick = row[0] or 0
+
+    @staticmethod
+    def key_for(rule_data_list: list) -> str:
+        return preset_key(rule_data_list)
+
+    def get(self, key: str, word: str, need_history: bool = False):
+        """Return (form, history) or None. history is None if it was not recorded."""
+        entry = self._mem.get((key, word))
+        if entry is None and self._conn is not None:
+            row = self._conn.execute(
+                "SELECT form, history FROM results WHERE preset_key = ? AND word = ?",
+                (key, word)
+            ).fetchone()
+            if row:
+                history = None if row[1] is None else [tuple(h) for h in json.loads(row[1])]
+                entry = (row[0], history)
+                self._remember(key, word, entry)
+                self._touch(key, word)
+
+        if entry is None or (need_history and entry[1] is None):
+            self.misses += 1
+            return None
+        self._mem.move_to_end((key, word))
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, word: str, form: str, history: list | None = None) -> None:
+        entry = (form, None if history is None else [tuple(h) for h in history])
+        self._remember(key, word, entry)
+        if self._conn is not None:
+            self._tick += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, word, form, None if history is None else json.dumps(entry[1], ensure_ascii=False),
+                 self._tick)
+            )
+
+    def commit(self) -> None:
+        """Flush the SQLite tier and trim it to max_rows."""
+        if self._conn is None:
+            return
+        count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_rows:
+            self._conn.execute(
+                "DELETE FROM results WHERE rowid IN "
+                "(SELECT rowid FROM results ORDER BY used LIMIT ?)",
+                (count - self.max_rows,)
+            )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        self._mem.clear()
+        self.hits = self.misses = 0
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._mem)}
+
+    def _remember(self, key, word, entry) -> None:
+        self._mem[(key, word)] = entry
+        self._mem.move_to_end((key, word))
+        if len(self._mem) > self.maxsize:
+            self._mem.popitem(last=False)
+
+    def _touch(self, key, word) -> None:
+        self._tick += 1
+        self._conn.execute(
+            "UPDATE results SET used = ? WHERE preset_key = ? AND word = ?",
+            (self._tick, key, word)
+        )
@@ -0,0 +1,186 @@
+# synthetic.py
+"""
+Seeded synthetic lexicons in the shape a base language's to_ipa() produces.
+
+    gen = LexiconGenerator(PhonoLatin(), seed=1, lengths={2: 1, 3: 1})
+    words = gen.words(10_000)                 # in memory
+    gen.write("lexicon.txt", 1_000_000)       # streamed to disk
+    for word in gen.stream():                 # endless
+        ...
+
+The phonemes are the base language's own (the IPA its ipa_map can produce, plus
+any ipa_units it declares), weighted by their IPA_GROUPS class. Each word is a
+run of onset + nucleus + coda templates; two-consonant onsets and codas only use
+clusters of the usual shapes (obstruent + liquid, s + plosive; sonorant +
+obstruent, plosive + sibilant). The tokens are then syllabified and stressed by
+the base language itself, so the output has its dots and stress marks.
+
+Without a base language (phono=None) the phonemes are the whole IPA inventory
+(IPA_GROUPS Consonants; short and long vowels and diphthongs as nuclei), each
+template is one syllable and one syllable at random is stressed: far less
+regular than real input, which is what the differential harness wants.
+
+Word n depends only on the seed and n: the same seed always gives the same
+words, whether they are streamed, listed or written.
+"""
+
+import random
+import unicodedata
+from itertools import accumulate, islice
+
+from .evolver import _tokens
+from .ipa_dictionaries import IPA_GROUPS
+
+# first matching group sets a phoneme's weight; anything else weighs 1
+GROUP_WEIGHTS = (
+    ("ShortVowels", 4.0), ("LongVowels", 1.5), ("Diphthongs", 0.7),
+    ("Plosives", 4.0), ("Nasals", 3.0), ("SibilantFricatives", 3.0),
+    ("Trills", 2.5), ("LateralApproximants", 2.5), ("Taps", 2.0),
+    ("Glides", 1.5), ("Fricatives", 1.5), ("LabioVelars", 0.7),
+)
+
+DEFAULT_LENGTHS = {1: 2, 2: 4, 3: 3, 4: 1}       # syllables per word
+DEFAULT_ONSETS = {0: 2, 1: 7, 2: 1}              # consonants per onset
+DEFAULT_CODAS = {0: 6, 1: 3.5, 2: 0.5}           # consonants per coda
+
+_LIQUIDS = set(IPA_GROUPS["Trills"]) | set(IPA_GROUPS["Taps"]) | set(IPA_GROUPS["LateralApproximants"])
+_OBSTRUENTS = set(IPA_GROUPS["Plosives"]) | set(IPA_GROUPS["Fricatives"]) | set(IPA_GROUPS["LabioVelars"])
+_SONORANTS = set(IPA_GROUPS["Nasals"]) | _LIQUIDS
+
+
+def _is_modifier(token: str) -> bool:
+    """Stress and length marks, aspiration and other bare diacritics."""
+    return all(unicodedata.combining(c) or unicodedata.category(c) == "Lm" for c in token)
+
+
+def phoneme_weight(phoneme: str) -> float:
+    for group, weight in GROUP_WEIGHTS:
+        if phoneme in IPA_GROUPS[group]:
+            return weight
+    return 1.0
+
+
+class _Choice:
+    """Weighted choice from a fixed population, with the cumulative weights kept."""
+
+    def __init__(self, weights: dict):
+        self.population = [k for k, w in weights.items() if w > 0]
+        self.cum_weights = list(accumulate(weights[k] for k in self.population))
+
+    def __bool__(self):
+        return bool(self.population)
+
+    def __call__(self, rnd: random.Random):
+        return rnd.choices(self.population, cum_weights=self.cum_weights)[0]
+
+
+class LexiconGenerator:
+    def __init__(self, phono, seed: int = 0, lengths: dict | None = None,
+                 onsets: dict | None = None, codas: dict | None = None,
+                 weights: dict | None = None):
+        """
+        phono    a base language (PhonoLatin(), PhonoCeltic(), PhonoGermanic(), ...),
+                 or None for the whole IPA inventory
+        lengths  {syllables per word: weight}
+        onsets   {consonants per onset (0-2): weight}; likewise codas
+        weights  {phoneme: weight} overriding the IPA_GROUPS weights (0 drops it)
+        """
+        self.phono = phono
+        self.seed = seed
+        if phono is None:
+            self.consonants = set(IPA_GROUPS["Consonants"])
+            self.nuclei = set(IPA_GROUPS["ShortVowels"]) | set(IPA_GROUPS["LongVowels"]) | set(IPA_GROUPS["Diphthongs"])
+        else:
+            self.consonants, self.nuclei = self.inventory(phono)
+        weights = weights or {}
+
+        def weigh(phonemes):
+            return {p: weights.get(p, phoneme_weight(p)) for p in sorted(phonemes)}
+
+        consonants = weigh(self.consonants)
+        self._nucleus = _Choice(weigh(self.nuclei))
+        self._consonant = _Choice(consonants)
+        live = [c for c in consonants if consonants[c] > 0]
+        self._onset2 = _Choice({(a, b): consonants[a] * consonants[b] for a in live for b in live
+                                if (a in _OBSTRUENTS and b in _LIQUIDS)
+                                or (a in IPA_GROUPS["SibilantFricatives"] and b in IPA_GROUPS["Plosives"])})
+        self._coda2 = _Choice({(a, b): consonants[a] * consonants[b] for a in live for b in live
+                               if (a in _SONORANTS and b in _OBSTRUENTS)
+                               or (a in IPA_GROUPS["Plosives"] and b in IPA_GROUPS["SibilantFricatives"])})
+        if not self._nucleus or not self._consonant:
+            raise ValueError(f"{type(phono).__name__} has no usable vowels or consonants")
+
+        self._length = _Choice(lengths or DEFAULT_LENGTHS)
+        self._onset_size = _Choice(onsets or DEFAULT_ONSETS)
+        self._coda_size = _Choice(codas or DEFAULT_CODAS)
+
+    @staticmethod
+    def inventory(phono) -> tuple[set, set]:
+        """(consonants, nuclei) a base language's IPA map and units can produce."""
+        tokenize = phono.tokenizer.tokenize if hasattr(phono, "tokenizer") else _tokens
+        tokens = set(getattr(phono, "ipa_units", None) or ())
+        for ipa in getattr(phono, "ipa_map", {}).values():
+            units = []
+            for t in tokenize(ipa):
+                if units and _is_modifier(t):
+                    units[-1] += t          # a strict tokenizer splits off ː, ʰ, ̯
+                else:
+                    units.append(t)
+            tokens.update(units)
+        tokens = {t for t in tokens if t != "." and not _is_modifier(t)}
+        vowels = set(getattr(phono, "vowels", ())) | set(IPA_GROUPS["Nuclei"])
+        nuclei = {t for t in tokens if t in vowels}
+        return tokens - nuclei, nuclei
+
+    # ----- words -----
+
+    def _cluster(self, rnd: random.Random, size: int, pairs: _Choice) -> list:
+        if size >= 2 and pairs:
+            return list(pairs(rnd))
+        return [self._consonant(rnd)] if size else []
+
+    def templates(self, rnd: random.Random) -> list[list[str]]:
+        """The onset + nucleus + coda runs of one word."""
+        out = []
+        for _ in range(self._length(rnd)):
+            run = self._cluster(rnd, self._onset_size(rnd), self._onset2)
+            run.append(self._nucleus(rnd))
+            run += self._cluster(rnd, self._coda_size(rnd), self._coda2)
+            out.append(run)
+        return out
+
+    def tokens(self, rnd: random.Random) -> list[str]:
+        """The phonemes of one word, before syllabification."""
+        return [t for run in self.templates(rnd) for t in run]
+
+    def word(self, tokens: list[str]) -> str:
+        """Syllabify and stress tokens the way the base language's to_ipa does."""
+        phono = self.phono
+        syllables = phono.syllabify(list(tokens))
+        return ".".join(phono.assign_stress(syllables))
+
+    def stream(self, n: int | None = None):
+        """Yield n words (or never stop, if n is None)."""
+        rnd = random.Random(self.seed)
+        count = 0
+        while n is None or count < n:
+            if self.phono is not None:
+                yield self.word(self.tokens(rnd))
+            else:
+                runs = self.templates(rnd)
+                k = rnd.randrange(len(runs))
+                yield ".".join(("ˈ" if i == k else "") + "".join(run) for i, run in enumerate(runs))
+            count += 1
+
+    def words(self, n: int) -> list[str]:
+        return list(self.stream(n))
+
+    def write(self, path: str, n: int, per_line: int = 1) -> None:
+        """Write n words to a text file, `per_line` words to a line."""
+        words = self.stream(n)
+        with open(path, "w", encoding="utf-8") as fh:
+            while True:
+                line = list(islice(words, per_line))
+                if not line:
+                    break
+                fh.write(" ".join(line) + "\n")
@@ -1,18 +1,21 @@
-from typing import Iterable, List, Optional, Set
-from evolution.ipa_dictionaries import IPA_GROUPS
+import sys
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from evolution.ipa_dictionaries import INVENTORY
 from itertools import product
 
 # === DEFAULT IPA UNITS BUILDER ===
 
 def build_default_ipa_units() -> List[str]:
     """
-    Build a robust default unit set using IPA_GROUPS plus some common extras.
+    Build a robust default unit set from the IPA group inventory plus some common extras.
     Sorted by length desc to enable greedy longest-match tokenization.
     """
     units: Set[str] = set()
 
     # Add all short vowels and their lengthened/nasalized forms
-    for v in IPA_GROUPS.get("ShortVowels", []):
+    short_vowels = INVENTORY.members("ShortVowels")
+    for v in short_vowels:
         units.add(v)
         units.add(v + "ː")
         units.add(v + "ːː")
@@ -21,18 +24,18 @@ def build_default_ipa_units() -> List[str]:
         units.add(v + "̃ːː")
 
     # Add diphthongs if defined, else generate from ShortVowels
-    dips = IPA_GROUPS.get("Diphthongs", [])
+    dips = INVENTORY.members("Diphthongs")
     if not dips:
-        dips = [a + b for a in IPA_GROUPS.get("ShortVowels", []) for b in IPA_GROUPS.get("ShortVowels", []) if a != b]
+        dips = [a + b for a in short_vowels for b in short_vowels if a != b]
     units.update(dips)
 
     # Add consonants, affricates, and extras
-    for key in ["Consonants", "Nasals", "Plosives", "SibilantAffricates", "NonSibilantAffricates",
-                "SibilantFricatives", "NonSibilantFricatives", "Approximants", "Taps", "Trills",
-                "LateralAffricates", "LateralFricatives", "LateralApproximants", "LateralTaps",
-                "Glottal", "Uvular", "Velar", "Palatal", "Retroflex", "PostAlveolar", "Alveolar", "Dental",
-                "Labiodental", "Bilabial", "LabioVelars"]:
-        units.update(IPA_GROUPS.get(key, []))
+    units.update(INVENTORY.members(
+        "Consonants", "Nasals", "Plosives", "SibilantAffricates", "NonSibilantAffricates",
+        "SibilantFricatives", "NonSibilantFricatives", "Approximants", "Taps", "Trills",
+        "LateralAffricates", "LateralFricatives", "LateralApproximants", "LateralTaps",
+        "Glottal", "Uvular", "Velar", "Palatal", "Retroflex", "PostAlveolar", "Alveolar", "Dental",
+        "Labiodental", "Bilabial", "LabioVelars"))
 
     # Always include stress/length markers as standalone
     units.update({"ˈ", "ˌ", "ː", "̃", "."})
@@ -44,7 +47,18 @@ def build_default_ipa_units() -> List[str]:
 # Expose default units at module level
 DEFAULT_IPA_UNITS: List[str] = build_default_ipa_units()
 
-__all__ = ["Tokenizer", "build_default_ipa_units", "DEFAULT_IPA_UNITS"]
+__all__ = ["Tokenizer", "TokenCache", "build_default_ipa_units", "DEFAULT_IPA_UNITS"]
+
+# === PREFIX TRIE ===
+# Nodes are plain dicts keyed by character; the unit ending at a node is stored
+# under _END (no real character is the empty string).
+_END = ""
+
+def _trie_insert(trie: dict, unit: str) -> None:
+    node = trie
+    for ch in unit:
+        node = node.setdefault(ch, {})
+    node[_END] = unit
 
 class Tokenizer:
     """
@@ -56,6 +70,9 @@ class Tokenizer:
       - strict_compounds=False: any multi-char unit present in `units` can match.
 
     You can flip modes at runtime (e.g., strict for `to_ipa`, permissive for evolution).
+
+    Matching walks a prefix trie of the legal units, so each position costs at most
+    the length of the longest unit instead of a scan over the whole inventory.
     """
     def __init__(
         self,
@@ -68,12 +85,49 @@ class Tokenizer:
         self._unit_set: Set[str] = set(u for u in units if u)
         self.units: List[str] = sorted(self._unit_set, key=len, reverse=True)
 
+        # prefix tries of *legal* units, one per strict/permissive mode, built lazily
+        self._tries: Dict[bool, dict] = {}
+
+        # bumped whenever the inventory or the legality sets change (see TokenCache)
+        self.version = 0
+
         # optional limiters
-        self.legal_units: Optional[Set[str]] = set(legal_units) if legal_units else None
-        self.legal_compounds: Optional[Set[str]] = set(legal_compounds) if legal_compounds else None
+        self._legal_units: Optional[Set[str]] = set(legal_units) if legal_units else None
+        self._legal_compounds: Optional[Set[str]] = set(legal_compounds) if legal_compounds else None
 
         # mode
-        self.strict_compounds = strict_compounds
+        self._strict_compounds = strict_compounds
+
+    # ---- legality gates (setting any of these invalidates the tries) -----
+
+    @property
+    def strict_compounds(self) -> bool:
+        return self._strict_compounds
+
+    @strict_compounds.setter
+    def strict_compounds(self, on: bool) -> None:
+        # Both modes keep their own trie, so flipping is free.
+        self._strict_compounds = bool(on)
+
+    @property
+    def legal_units(self) -> Optional[Set[str]]:
+        return self._legal_units
+
+    @legal_units.setter
+    def legal_units(self, seq: Optional[Iterable[str]]) -> None:
+        self._legal_units = set(seq) if seq else None
+        self._tries.clear()
+        self.version += 1
+
+    @property
+    def legal_compounds(self) -> Optional[Set[str]]:
+        return self._legal_compounds
+
+    @legal_compounds.setter
+    def legal_compounds(self, seq: Optional[Iterable[str]]) -> None:
+        self._legal_compounds = set(seq) if seq else None
+        self._tries.clear()
+        self.version += 1
 
     # ---- public toggles -------------------------------------------------
 
@@ -84,52 +138,76 @@ class Tokenizer:
         self.strict_compounds = False
 
     def set_legal_units(self, seq: Optional[Iterable[str]]) -> None:
-        self.legal_units = set(seq) if seq else None
+        self.legal_units = seq
 
     def set_legal_compounds(self, seq: Optional[Iterable[str]]) -> None:
-        self.legal_compounds = set(seq) if seq else None
+        self.legal_compounds = seq
 
     def add_units(self, new_units: Iterable[str]) -> None:
-        changed = False
+        added = []
         for u in new_units:
             if u and u not in self._unit_set:
                 self._unit_set.add(u)
-                changed = True
-        if changed:
+                added.append(u)
+        if added:
             self.units = sorted(self._unit_set, key=len, reverse=True)
+            self.version += 1
+            # incremental rebuild: graft the new units onto any trie already built
+            for strict, trie in self._tries.items():
+                for u in added:
+                    if self._is_allowed(u, strict):
+                        _trie_insert(trie, u)
 
     # ---- core tokenization ----------------------------------------------
 
-
-    def _is_allowed(self, cand: str) -> bool:
+    def _is_allowed(self, cand: str, strict: Optional[bool] = None) -> bool:
         """Check legality gates for a candidate unit."""
+        if strict is None:
+            strict = self._strict_compounds
+
         # If a full legal_units list is supplied, it constrains everything.
-        if self.legal_units is not None and cand not in self.legal_units:
+        if self._legal_units is not None and cand not in self._legal_units:
             return False
 
         # If strict mode and candidate is multi-char, it must be in legal_compounds.
-        if self.strict_compounds and len(cand) > 1:
-            if self.legal_compounds is None:
+        if strict and len(cand) > 1:
+            if self._legal_compounds is None:
                 return False  # no compounds are legal unless whitelisted
-            return cand in self.legal_compounds
+            return cand in self._legal_compounds
 
         return True
 
+    def _trie(self) -> dict:
+        """Trie of the units that pass the legality gates in the current mode."""
+        strict = self._strict_compounds
+        trie = self._tries.get(strict)
+        if trie is None:
+            trie = {}
+            for u in self._unit_set:
+                if self._is_allowed(u, strict):
+                    _trie_insert(trie, u)
+            self._tries[strict] = trie
+        return trie
+
     def tokenize(self, text: str) -> List[str]:
         tokens: List[str] = []
+        trie = self._trie()
         i = 0
         n = len(text)
 
         while i < n:
+            # walk the trie as far as the text allows, remembering the longest legal unit
             matched = None
-
-            # try longest-first
-            for u in self.units:
-                if not text.startswith(u, i):
-                    continue
-                if self._is_allowed(u):
-                    matched = u
+            node = trie
+            j = i
+            while j < n:
+                node = node.get(text[j])
+                if node is None:
                     break
+                j += 1
+                unit = node.get(_END)
+                if unit is not None:
+                    matched = unit
 
             # fallback: single char (even if not in units)
             if matched is None:
@@ -143,3 +221,61 @@ class Tokenizer:
     @staticmethod
     def detokenize(tokens: Iterable[str]) -> str:
         return "".join(tokens)
+
+
+class TokenCache:
+    """
+    Bounded LRU memo in front of one Tokenizer.
+
+    Entries are keyed on (text, strict_compounds) and hold token tuples, so they can be
+    shared freely. The whole cache is dropped as soon as the tokenizer's `version`
+    moves, i.e. after `add_units` or a change to `legal_units` / `legal_compounds`.
+    """
+    def __init__(self, tokenizer: Tokenizer, maxsize: int = 65536):
+        self.tokenizer = tokenizer
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[str, bool], Tuple[str, ...]]" = OrderedDict()
+        self._version = tokenizer.version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def tokens(self, text: str) -> Tuple[str, ...]:
+        tok = self.tokenizer
+        if tok.version != self._version:
+            self._data.clear()
+            self._version = tok.version
+
+        key = (text, tok.strict_compounds)
+        data = self._data
+        toks = data.get(key)
+        if toks is not None:
+            self.hits += 1
+            data.move_to_end(key)
+            return toks
+
+        self.misses += 1
+        # interned tokens compare by identity first, which keeps the hot dict/set probes cheap
+        toks = tuple(map(sys.intern, tok.tokenize(text)))
+        data[key] = toks
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+        return toks
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -11,6 +11,7 @@ from PyQt5 import uic
 
 from evolution.evolver import EvolutionEngine
 from evolution.orthographer import Orthographer
+from evolution.result_cache import ResultCache
 from interface.preset_edit import UI_Main as Preset_Main
 from interface.orthographer_editor import OrthographyEditor
 
@@ -19,6 +20,7 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "presets", "presets.db")
 ORTHO_DB_PATH = os.path.join(BASE_DIR, "presets", "orthographies.db")
 OVERRIDE_PATH = os.path.join(BASE_DIR, "data", "latin_stress_overrides.json")
+RESULT_CACHE_PATH = os.path.join(BASE_DIR, "presets", "result_cache.db")
 
 
 
@@ -43,6 +45,8 @@ class MainApp(QMainWindow):
             self.from_ipa_button.clicked.connect(self.translate_from_ipa)
 
         self.phono = None
+        # Evolved forms survive between clicks and restarts; editing a preset misses them.
+        self.result_cache = ResultCache(path=RESULT_CACHE_PATH)
 
 
         # === EVENT HANDLERS ===
@@ -202,9 +206,9 @@ class MainApp(QMainWindow):
             print(f"[DB Ortho] JSON error for preset '{sel}': {je}")
         return None
 
-    def apply_orthography(self, words):
+    def apply_orthography(self, ipa_strings):
         """
-        words: list[Word] from the engine (supports .to_string()).
+        ipa_strings: list[str] of evolved IPA words.
         Produces a single orthographic string or a warning text.
         """
         preset = self.get_selected_orthography_preset()
@@ -221,8 +225,6 @@ class MainApp(QMainWindow):
 
             og = Orthographer(mapping)
 
-            # Convert engine words: we pass the IPA strings to the orthographer
-            ipa_strings = [w.to_string() for w in words]
             ortho_words = [og.transcribe(s) for s in ipa_strings]
             return " ".join(ortho_words)
 
@@ -324,16 +326,16 @@ class MainApp(QMainWindow):
             # 4) Phonologize
             ipa_words = [self.phono.to_ipa(w) for w in words]
             
-            # 5) Evolve
-            engine = EvolutionEngine(ipa_words, log_steps=True)
-            engine.evolve(rule_data)
+            # 5) Evolve (cached per word for this preset)
+            engine = EvolutionEngine([])
+            evolved = engine.evolve_batch(ipa_words, rule_data, cache=self.result_cache)
 
             # 6) IPA Output
-            ipa_result = " ".join(w.to_string() for w in engine.words)
+            ipa_result = " ".join(evolved)
             self.output_box.setPlainText(ipa_result)
 
             # Orthography Output
-            ortho_result = self.apply_orthography(engine.words)
+            ortho_result = self.apply_orthography(evolved)
             self.ortho_box.setPlainText(ortho_result)
 
         except Exception as e:
@@ -0,0 +1,52 @@
+"""
+scripts/analyze_preset.py
+Run: python scripts/analyze_preset.py --preset Marcher [--base latin] [--words corpus.txt]
+
+Lists the rules of a preset that can never fire, and the trigger/exception
+contexts that can never match, given what the base language can produce. With
+--words the words of a text file (run through the base language) are used
+instead of the base language's inventory, which is exact for that corpus.
+"""
+
+import argparse, io, json, os, sys
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from evolution.pipeline import read_lines
+from evolution.presets import load_base_language, load_rules
+from evolution.reachability import analyze, base_inventory, format_report
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Report rules of a preset that can never fire.")
+    ap.add_argument("--preset", required=True, help="preset name in presets.db")
+    ap.add_argument("--base", default="latin", help="base language module in core/ (default: latin)")
+    ap.add_argument("--words", help="text file whose words are the input (default: base inventory)")
+    ap.add_argument("--json", action="store_true", help="print the reports as JSON")
+    args = ap.parse_args()
+
+    rules = load_rules(args.preset)
+    if not rules:
+        sys.exit(f"[Error] Preset '{args.preset}' not found or empty.")
+
+    with redirect_stdout(io.StringIO()):
+        phono = load_base_language(args.base)
+        if args.words:
+            inputs = {phono.to_ipa(w) for words in read_lines(args.words) for w in words}
+        else:
+            inputs = base_inventory(phono)
+
+    reports = analyze(rules, inputs)
+    if args.json:
+        print(json.dumps([vars(r) for r in reports if r.dead or r.dead_contexts],
+                         ensure_ascii=False, indent=2))
+    else:
+        print(format_report(reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+scripts/benchmark.py
+Run: python scripts/benchmark.py run [-o baseline.json] [--presets Marcher Cambric] [--sizes 2000]
+     python scripts/benchmark.py compare baseline.json [current.json] [--threshold 0.10]
+
+Times every preset in presets.db over the word lists of phono_survey.py (Latin)
+and test_cambric.py (Proto-Celtic), and over seeded synthetic Latin lexicons of
+the given sizes (see evolution/synthetic.py). Tokenizer, rule, resyllabification and
+orthography time are reported separately (see evolution/benchmark.py).
+
+compare re-runs the suite with the baseline's settings (or reads a second
+result file) and exits with status 1 if any timing regressed by more than the
+threshold.
+"""
+
+import argparse, io, json, os, sys
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from core.celtic import PhonoCeltic
+from core.latin import PhonoLatin
+from evolution.benchmark import compare, format_comparison, load, run_suite, save
+from evolution.presets import OVER_PATH, load_orthographers, load_presets
+from evolution.synthetic import LexiconGenerator
+from scripts.phono_survey import SECTIONS
+from scripts.test_cambric import TEST_WORDS
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def load_corpora(sizes, seed):
+    lat = PhonoLatin(override_path=OVER_PATH)
+    cel = PhonoCeltic()
+    corpora = {
+        "survey": [lat.to_ipa(latin.lower()) for _, words in SECTIONS for _, latin in words],
+        "cambric": [cel.to_ipa(form) for form, _ in TEST_WORDS],
+    }
+    for n in sizes:
+        corpora[f"synthetic-{n}"] = LexiconGenerator(lat, seed=seed).words(n)
+    return corpora
+
+def presets_named(names):
+    try:
+        return load_presets(names)
+    except ValueError as e:
+        sys.exit(f"[Error] {e}")
+
+def build_cases(presets, sizes, seed):
+    with redirect_stdout(io.StringIO()):
+        corpora = load_corpora(sizes, seed)
+        orthographers = load_orthographers()
+    return {f"{name}/{corpus}": (rules, words, orthographers.get(name))
+            for name, rules in presets.items()
+            for corpus, words in corpora.items()}
+
+def run(presets, sizes, seed, repeat):
+    cases = build_cases(presets, sizes, seed)
+    progress = lambda name: print(f"  {name}", file=sys.stderr)
+    with redirect_stdout(io.StringIO()):        # rule warnings
+        result = run_suite(cases, repeat=repeat, progress=progress)
+    result["meta"].update(presets=list(presets), sizes=sizes, seed=seed)
+    return result
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark presets and compare against a JSON baseline.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    ap_run = sub.add_parser("run", help="time the suite")
+    ap_run.add_argument("-o", "--output", help="write the result as JSON (default: stdout)")
+    ap_run.add_argument("--presets", nargs="+", help="preset names (default: all in presets.db)")
+    ap_run.add_argument("--sizes", nargs="*", type=int, default=[2000], help="synthetic lexicon sizes")
+    ap_run.add_argument("--seed", type=int, default=0, help="seed of the synthetic lexicons")
+    ap_run.add_argument("--repeat", type=int, default=5, help="runs per case; the fastest counts")
+
+    ap_cmp = sub.add_parser("compare", help="compare against a baseline")
+    ap_cmp.add_argument("baseline", help="baseline JSON written by 'run'")
+    ap_cmp.add_argument("current", nargs="?", help="result JSON to compare (default: run the suite now)")
+    ap_cmp.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown, as a fraction")
+    ap_cmp.add_argument("--regressions", action="store_true", help="only list regressions")
+    ap_cmp.add_argument("-o", "--output", help="also write the new result as JSON")
+    args = ap.parse_args()
+
+    if args.command == "run":
+        result = run(presets_named(args.presets), args.sizes, args.seed, args.repeat)
+        if args.output:
+            save(result, args.output)
+        else:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    baseline = load(args.baseline)
+    if args.current:
+        current = load(args.current)
+    else:
+        meta = baseline["meta"]
+        current = run(presets_named(meta["presets"]), meta["sizes"], meta["seed"], meta["repeat"])
+        if args.output:
+            save(current, args.output)
+    rows = compare(baseline, current, args.threshold)
+    print(format_comparison(rows, only_regressions=args.regressions))
+    if any(r["regressed"] for r in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+scripts/diff_engines.py
+Run: python scripts/diff_engines.py --reference main [--presets Marcher Cambric] [--words 2000]
+
+Evolves the phono_survey.py and test_cambric.py word lists and a synthetic
+lexicon drawn from the whole IPA inventory (LexiconGenerator without a base
+language) through every preset, once with a frozen
+reference copy of evolution/ (a git revision or a directory) and once with the
+working tree, and compares final forms, the forms after every rule, histories
+and batch output (see evolution/differential.py). Each mismatch is minimized to
+a small word and rule list. Exits with status 1 if the engines disagree.
+"""
+
+import argparse, io, os, sys
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from evolution import evolver
+from evolution.differential import Differential, load_reference
+from evolution.presets import load_presets
+from evolution.synthetic import LexiconGenerator
+from scripts.benchmark import load_corpora
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def show_rule(rule):
+    if isinstance(rule, dict):
+        return f"[{rule.get('type')}] {rule.get('name')}"
+    return str(rule)
+
+def report(diff, preset, rules, mismatches, minimize, max_reports):
+    print(f"\n{preset}: {len(mismatches)} word(s) differ")
+    for m in mismatches[:max_reports]:
+        where = f" after rule {m.rule_index} ({show_rule(rules[m.rule_index])})" if m.rule_index is not None else ""
+        print(f"  {m.word}  [{m.field}{where}]")
+        print(f"      reference: {m.reference}")
+        print(f"      candidate: {m.candidate}")
+        if not minimize:
+            continue
+        with redirect_stdout(io.StringIO()):
+            case = diff.minimize(rules, m.word)
+        if case is None:
+            print("      (does not reproduce on its own)")
+            continue
+        print(f"      minimized: {case.word} with {len(case.rules)} rule(s):")
+        for rule in case.rules:
+            print(f"        {show_rule(rule)}")
+        for mm in case.mismatches:
+            print(f"        {mm.field}: {mm.reference}  ≠  {mm.candidate}")
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare the working tree's engine against a frozen reference.")
+    ap.add_argument("--reference", required=True,
+                    help="baseline git revision (tag, branch, commit) or evolution/ directory")
+    ap.add_argument("--presets", nargs="+", help="preset names (default: all in presets.db)")
+    ap.add_argument("--words", type=int, default=2000, help="size of the synthetic lexicon")
+    ap.add_argument("--seed", type=int, default=0, help="seed of the synthetic lexicon")
+    ap.add_argument("--no-minimize", action="store_true", help="report mismatches without minimizing them")
+    ap.add_argument("--max-reports", type=int, default=3, help="mismatches shown per preset")
+    args = ap.parse_args()
+
+    reference = load_reference(args.reference)
+    diff = Differential(reference, evolver)
+    try:
+        presets = load_presets(args.presets)
+    except ValueError as e:
+        sys.exit(f"[Error] {e}")
+    with redirect_stdout(io.StringIO()):
+        corpora = load_corpora([], args.seed)
+    words = corpora["survey"] + corpora["cambric"] + LexiconGenerator(None, seed=args.seed).words(args.words)
+
+    failed = 0
+    for preset, rules in presets.items():
+        with redirect_stdout(io.StringIO()):        # rule warnings
+            mismatches = diff.run(rules, words)
+        if mismatches:
+            failed += 1
+            report(diff, preset, rules, mismatches, not args.no_minimize, args.max_reports)
+        else:
+            print(f"{preset}: {len(words)} words agree")
+
+    print(f"\n{failed} of {len(presets)} preset(s) differ from {args.reference}.")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
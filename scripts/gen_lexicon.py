@@ -0,0 +1,63 @@
+"""
+scripts/gen_lexicon.py
+Run: python scripts/gen_lexicon.py -n 1000000 [--base latin] [--seed 0] [-o lexicon.txt]
+                                   [--lengths 1:2,2:4,3:3,4:1] [--onsets 0:2,1:7,2:1] [--codas 0:6,1:3.5,2:0.5]
+
+Streams a seeded synthetic IPA lexicon in the shape the base language's to_ipa
+produces (see evolution/synthetic.py), one word per line or --per-line words to
+a line. The same arguments always give the same words.
+"""
+
+import argparse, io, os, sys
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from evolution.presets import load_base_language
+from evolution.synthetic import LexiconGenerator
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def weights(text):
+    """'1:2,2:4' → {1: 2.0, 2: 4.0}"""
+    out = {}
+    for item in text.split(","):
+        key, _, weight = item.partition(":")
+        out[int(key)] = float(weight or 1)
+    return out
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate a seeded synthetic IPA lexicon.")
+    ap.add_argument("-n", "--words", type=int, required=True, help="number of words")
+    ap.add_argument("--base", default="latin", help="base language module in core/ (default: latin)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--lengths", type=weights, help="syllables per word, as n:weight,...")
+    ap.add_argument("--onsets", type=weights, help="consonants per onset (0-2), as n:weight,...")
+    ap.add_argument("--codas", type=weights, help="consonants per coda (0-2), as n:weight,...")
+    ap.add_argument("--per-line", type=int, default=1, help="words per output line")
+    ap.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = ap.parse_args()
+
+    with redirect_stdout(io.StringIO()):
+        phono = load_base_language(args.base)
+    gen = LexiconGenerator(phono, seed=args.seed, lengths=args.lengths,
+                           onsets=args.onsets, codas=args.codas)
+    if args.output:
+        gen.write(args.output, args.words, args.per_line)
+        return
+    line = []
+    for word in gen.stream(args.words):
+        line.append(word)
+        if len(line) == args.per_line:
+            print(" ".join(line))
+            line = []
+    if line:
+        print(" ".join(line))
+
+
+if __name__ == "__main__":
+    main()
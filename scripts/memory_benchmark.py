@@ -0,0 +1,65 @@
+"""
+scripts/memory_benchmark.py
+Run: python scripts/memory_benchmark.py [-n 100000] [--base latin] [--seed 0] [--reference HEAD~1]
+
+Memory per word of the lexicon layouts, over a seeded synthetic lexicon (see
+evolution/synthetic.py): the IPA strings themselves, a list of Word objects, and
+a struct-of-arrays Lexicon with and without its original forms (see
+evolution/lexicon.py). --reference adds the Word objects of another revision
+(a git revision or evolution/ directory, as in diff_engines.py), for a
+before/after comparison.
+"""
+
+import argparse, io, os, sys
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from evolution.benchmark import bytes_per_word
+from evolution.differential import load_reference
+from evolution.evolver import Word
+from evolution.lexicon import Lexicon
+from evolution.presets import load_base_language
+from evolution.synthetic import LexiconGenerator
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def layouts(reference=None):
+    out = {"Word objects": lambda ws: [Word(w) for w in ws]}
+    if reference is not None:
+        ref_word = load_reference(reference).Word
+        out[f"Word objects @ {reference}"] = lambda ws: [ref_word(w) for w in ws]
+    out["Lexicon"] = lambda ws: Lexicon(ws)
+    out["Lexicon, no originals"] = lambda ws: Lexicon(ws, originals=False)
+    return out
+
+def text_bytes(words):
+    # the strings plus a list slot each
+    return sum(sys.getsizeof(w) + 8 for w in words) / len(words)
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Measure memory per word of the lexicon layouts.")
+    ap.add_argument("-n", "--words", type=int, default=100000, help="lexicon size")
+    ap.add_argument("--base", default="latin", help="base language module in core/ (default: latin)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--reference", help="also measure Word of this git revision or evolution/ directory")
+    args = ap.parse_args()
+
+    with redirect_stdout(io.StringIO()):
+        phono = load_base_language(args.base)
+    words = LexiconGenerator(phono, seed=args.seed).words(args.words)
+    syllables = sum(w.count(".") + 1 for w in words) / len(words)
+    print(f"{len(words)} words, {syllables:.2f} syllables per word")
+    print("(the layouts share the input strings and do not count them)\n")
+
+    print(f"  {'IPA strings':<32}{text_bytes(words):>8.0f} bytes/word")
+    for name, build in layouts(args.reference).items():
+        print(f"  {name:<32}{bytes_per_word(build, words):>8.0f} bytes/word")
+
+
+if __name__ == "__main__":
+    main()
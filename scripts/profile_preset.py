@@ -0,0 +1,56 @@
+"""
+scripts/profile_preset.py
+Run: python scripts/profile_preset.py --preset Marcher [--base latin] [--words corpus.txt]
+                                      [--sort wall] [--limit 20] [--json]
+
+Evolves a word list through a preset with per-rule profiling on and prints, for
+each rule, its wall time, the words it visited and changed, the matches it tried
+and applied, and the time spent re-syllabifying.
+"""
+
+import argparse, io, os, sys
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from evolution.evolver import EvolutionEngine
+from evolution.pipeline import read_lines
+from evolution.presets import load_base_language, load_rules
+from evolution.profiler import SORT_KEYS, format_table, to_json
+
+WORDS_PATH = os.path.join(ROOT, "core", "swadesh lists", "swadesh_latin.txt")
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Profile a preset rule by rule.")
+    ap.add_argument("--preset", required=True, help="preset name in presets.db")
+    ap.add_argument("--base", default="latin", help="base language module in core/ (default: latin)")
+    ap.add_argument("--words", default=WORDS_PATH, help="text file of input words (default: Latin Swadesh list)")
+    ap.add_argument("--sort", default="wall", choices=SORT_KEYS,
+                    help="column to sort by (default: wall)")
+    ap.add_argument("--limit", type=int, help="only show the first N rules")
+    ap.add_argument("--json", action="store_true", help="print the profile as JSON")
+    args = ap.parse_args()
+
+    rules = load_rules(args.preset)
+    if not rules:
+        sys.exit(f"[Error] Preset '{args.preset}' not found or empty.")
+
+    with redirect_stdout(io.StringIO()):
+        phono = load_base_language(args.base)
+        words = [phono.to_ipa(w) for line in read_lines(args.words) for w in line]
+        engine = EvolutionEngine(words, profile=True)
+        engine.evolve(rules)
+
+    if args.json:
+        print(to_json(engine.profile_stats, sort_by=args.sort))
+    else:
+        print(f"{len(words)} words, {len(rules)} rules")
+        print(format_table(engine.profile_stats, sort_by=args.sort, limit=args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+scripts/stream_pipeline.py
+Run: python scripts/stream_pipeline.py corpus.txt --base latin --preset Marcher [--ortho NAME] [-o out.tsv] [--cache]
+
+Streams a text file (or stdin with "-") line by line through
+base language → IPA → preset evolution → orthography, writing each line as soon
+as it is done. Output lines are "<ipa>" or "<ipa>\t<orthography>" with --ortho.
+"""
+
+import argparse, os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from evolution.orthographer import Orthographer
+from evolution.pipeline import run_pipeline
+from evolution.presets import load_base_language, load_orthographer, load_rules
+from evolution.result_cache import ResultCache
+
+CACHE_PATH    = os.path.join(ROOT, "presets", "result_cache.db")
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description="Stream a corpus through a base language and preset.")
+    ap.add_argument("input", help='text file, or "-" for stdin')
+    ap.add_argument("--base", default="latin", help="base language module in core/ (default: latin)")
+    ap.add_argument("--preset", required=True, help="preset name in presets.db")
+    ap.add_argument("--ortho", help="orthography preset name in orthographies.db")
+    ap.add_argument("-o", "--output", help="output file (default: stdout)")
+    ap.add_argument("--batch-lines", type=int, default=256, help="lines evolved per batch")
+    ap.add_argument("--cache", action="store_true", help="reuse/store evolved forms in result_cache.db")
+    args = ap.parse_args()
+
+    rules = load_rules(args.preset)
+    if not rules:
+        sys.exit(f"[Error] Preset '{args.preset}' not found or empty.")
+
+    orthographer = None
+    if args.ortho:
+        orthographer = load_orthographer(args.ortho)
+        if orthographer is None:
+            sys.exit(f"[Error] Orthography preset '{args.ortho}' not found.")
+
+    phono = load_base_language(args.base)
+    source = sys.stdin if args.input == "-" else args.input
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    cache = ResultCache(path=CACHE_PATH) if args.cache else None
+
+    try:
+        for ipa, ortho in run_pipeline(source, phono, rules, orthographer, args.batch_lines, cache):
+            out.write(f"{ipa}\t{ortho}\n" if orthographer else f"{ipa}\n")
+    finally:
+        if cache is not None:
+            cache.close()
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()